@@ -1,13 +1,13 @@
-from . import models
-from . import performance
-from . import geometry
-from . import visualization
-from . import optimization
+from robosandbox._lazy import attach
 
-__all__ = [
-    "models",
-    "performance",
-    "geometry",
-    "visualization",
-    "optimization",
-]
+# Subpackages are imported on first access, see robosandbox._lazy
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "models",
+        "performance",
+        "geometry",
+        "visualization",
+        "optimization",
+    ],
+)
@@ -0,0 +1,46 @@
+"""
+Lazy loading of subpackages and re-exported attributes (PEP 562).
+
+Importing robosandbox or one of its subpackages only runs the __init__ files; the
+subpackages, modules and classes they export are imported on first attribute access,
+so e.g. ``import robosandbox.performance.workspace`` does not import the Dash apps.
+
+Packages whose exported classes share the name of their module (e.g. models.DH.Panda)
+stay eager: once the module is imported, the package attribute would be the module.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+
+def attach(package_name, submodules=(), attributes=None):
+    """
+    Module-level __getattr__, __dir__ and __all__ of a lazily loaded package.
+    :param package_name: str, the __name__ of the package.
+    :param submodules: list of str, the subpackages and modules exported by the package.
+    :param attributes: dict mapping each exported attribute to the module defining it, relative to the package.
+    :return: __getattr__, __dir__ and __all__.
+    """
+    attributes = dict(attributes or {})
+    exported = list(submodules) + list(attributes)
+
+    def __getattr__(name):
+        if name in attributes:
+            module = importlib.import_module(f"{package_name}.{attributes[name]}")
+            value = getattr(module, name)
+        elif name in submodules or (
+            not name.startswith("__")
+            and importlib.util.find_spec(f"{package_name}.{name}") is not None
+        ):
+            # Any module of the package, as after an eager import of it
+            value = importlib.import_module(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(exported) | set(vars(sys.modules[package_name])))
+
+    return __getattr__, __dir__, exported
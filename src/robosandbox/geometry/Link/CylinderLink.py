@@ -1,7 +1,26 @@
+from functools import lru_cache
 import numpy as np
 import matplotlib.pyplot as plt
 from robosandbox.visualization.plotly_Link3D import Link3D
-from robosandbox.geometry.mesh_utilities import add_face, index_of
+from robosandbox.geometry.mesh_utilities import strip_faces
+from robosandbox.geometry.Link.mass_properties import (
+    hollow_link_mass_properties,
+    parallel_axis,
+)
+
+
+@lru_cache(maxsize=1024)
+def _cached_mass_properties(length, segments_number, Rout, rho, thickness):
+    mass, COM, I_tensor = hollow_link_mass_properties(
+        np.linspace(0, length, segments_number),
+        Rout - np.array(thickness),
+        Rout,
+        rho,
+    )
+    # Shared between links, so guard against in-place edits
+    COM.setflags(write=False)
+    I_tensor.setflags(write=False)
+    return float(mass), COM, I_tensor
 
 
 class CylinderLink(Link3D):
@@ -26,9 +45,21 @@ class CylinderLink(Link3D):
             inner_profile["params"], inner_profile["method"]
         )
         self.Rout = Rout
-        self.mass = self.get_link_mass()
-        self.COM = self.get_center_of_mass()
-        self.I_tensor = self.get_inertia_tensor(self.COM)
+
+    @property
+    def mass(self):
+        """Mass of the link, computed on first use"""
+        return self.get_mass_properties()[0]
+
+    @property
+    def COM(self):
+        """Center of mass (x, y, z) of the link, computed on first use"""
+        return self.get_mass_properties()[1]
+
+    @property
+    def I_tensor(self):
+        """Inertia tensor about the center of mass, computed on first use"""
+        return self.get_mass_properties()[2]
 
     def get_discretized_points(self):
         """
@@ -49,107 +80,101 @@ class CylinderLink(Link3D):
                     points.append((x, y, z))
         return points, len(points)
 
+    def _ring_points(self, radii, z, endpoint=True):
+        """
+        Points on rings of the given radii and heights, one row per ring.
+        radii, z: arrays of shape (rows,)
+        endpoint: repeat the first point of each ring at 2*pi (open seam) or not (closed ring)
+        return: array of shape (rows, points_per_ring, 3)
+        """
+        angular = self.resolutions["angular"]
+        phi = np.linspace(0, 2 * np.pi, angular if endpoint else angular - 1, endpoint=endpoint)
+        radii, z = np.broadcast_arrays(np.asarray(radii, dtype=float), np.asarray(z, dtype=float))
+        x = radii[:, None] * np.cos(phi)[None, :]
+        y = radii[:, None] * np.sin(phi)[None, :]
+        # if near 0, set to 0
+        x[np.abs(x) < 1e-10] = 0
+        y[np.abs(y) < 1e-10] = 0
+        return np.stack((x, y, np.broadcast_to(z[:, None], x.shape)), axis=-1)
+
+    def _surface_mesh(self, radii, z, method):
+        points = self._ring_points(radii, z)
+        index_grid = np.arange(points.shape[0] * points.shape[1]).reshape(points.shape[:2])
+        return points.reshape(-1, 3), strip_faces(index_grid, method=method)
+
     def get_outer_mesh(self, method="quad"):
         """
         Get the mesh of the outer surface
         return: list of mesh [(x,y,z), (x,y,z), ...]
         """
-        points = []
-        for idx in range(self.resolutions["axial"]):
-            z = self.segments_location[idx]
-            for phi in np.linspace(0, 2 * np.pi, self.resolutions["angular"]):
-                x = self.Rout * np.cos(phi)
-                y = self.Rout * np.sin(phi)
-                # if near 0, set to 0
-                if abs(x) < 1e-10:
-                    x = 0
-                if abs(y) < 1e-10:
-                    y = 0
-                points.append((x, y, z))
-
-        faces = []
-        for j in range(self.resolutions["axial"] - 1):
-            for i in range(self.resolutions["angular"] - 1):
-                faces = add_face(
-                    faces,
-                    index_of(i, j, self.resolutions["angular"]),
-                    index_of(i + 1, j, self.resolutions["angular"]),
-                    index_of(i + 1, j + 1, self.resolutions["angular"]),
-                    index_of(i, j + 1, self.resolutions["angular"]),
-                    method=method,
-                )
-        return np.array(points), np.array(faces)
+        return self._surface_mesh(self.Rout, self.segments_location, method)
 
     def get_inner_mesh(self, method="quad"):
         """
-        Get the mesh of the outer surface
+        Get the mesh of the inner surface
         return: list of mesh [(x,y,z), (x,y,z), ...]
         """
-        points = []
-        for idx in range(self.resolutions["axial"]):
-            z = self.segments_location[idx]
-            for phi in np.linspace(0, 2 * np.pi, self.resolutions["angular"]):
-                x = (self.Rout - self.thickness_distribution[idx]) * np.cos(phi)
-                y = (self.Rout - self.thickness_distribution[idx]) * np.sin(phi)
-                # if near 0, set to 0
-                if abs(x) < 1e-10:
-                    x = 0
-                if abs(y) < 1e-10:
-                    y = 0
-                points.append((x, y, z))
-
-        faces = []
-        for j in range(self.resolutions["axial"] - 1):
-            for i in range(self.resolutions["angular"] - 1):
-                faces = add_face(
-                    faces,
-                    index_of(i, j, self.resolutions["angular"]),
-                    index_of(i + 1, j, self.resolutions["angular"]),
-                    index_of(i + 1, j + 1, self.resolutions["angular"]),
-                    index_of(i, j + 1, self.resolutions["angular"]),
-                    method=method,
-                )
-        return np.array(points), np.array(faces)
+        return self._surface_mesh(
+            self.Rout - self.thickness_distribution, self.segments_location, method
+        )
 
     def get_side_mesh(self, method="quad", side="start"):
         """
-        Get the mesh of the outer surface
+        Get the mesh of the annulus closing the start or end of the link
         return: list of mesh [(x,y,z), (x,y,z), ...]
         """
         if side == "start":
             idx = 0
         if side == "end":
             idx = -1
-
-        points = []
-        for r in np.linspace(
+        radii = np.linspace(
             self.Rout - self.thickness_distribution[idx],
             self.Rout,
             self.resolutions["radial"],
-        ):
-            z = self.segments_location[idx]
-            for phi in np.linspace(0, 2 * np.pi, self.resolutions["angular"]):
-                x = r * np.cos(phi)
-                y = r * np.sin(phi)
-                # if near 0, set to 0
-                if abs(x) < 1e-10:
-                    x = 0
-                if abs(y) < 1e-10:
-                    y = 0
-                points.append((x, y, z))
+        )
+        return self._surface_mesh(radii, self.segments_location[idx], method)
+
+    def get_watertight_mesh(self, method="tri"):
+        """
+        Get a closed mesh of the whole link: outer and inner surfaces stitched to both
+        end annuli. Rings share their seam and the surfaces share their boundary rings,
+        so every edge belongs to exactly two faces and all normals point outwards.
+        return: points, faces
+        """
+        axial = self.resolutions["axial"]
+        radial = max(self.resolutions["radial"], 2)
+        inner_radii = self.Rout - self.thickness_distribution
+        outer = self._ring_points(self.Rout, self.segments_location, endpoint=False)
+        inner = self._ring_points(inner_radii, self.segments_location, endpoint=False)
+        ring_size = outer.shape[1]
+
+        # Intermediate rings of the end annuli, between the inner and outer rings
+        cap_rings = []
+        for idx in (0, -1):
+            radii = np.linspace(inner_radii[idx], self.Rout, radial)[1:-1]
+            cap_rings.append(self._ring_points(radii, self.segments_location[idx], endpoint=False))
+        points = np.concatenate([outer, inner] + cap_rings).reshape(-1, 3)
+
+        outer_ids = np.arange(axial * ring_size).reshape(axial, ring_size)
+        inner_ids = outer_ids + axial * ring_size
+        start_ids = 2 * axial * ring_size + np.arange((radial - 2) * ring_size).reshape(
+            radial - 2, ring_size
+        )
+        end_ids = start_ids + (radial - 2) * ring_size
+        start_grid = np.concatenate((inner_ids[:1], start_ids, outer_ids[:1]))
+        end_grid = np.concatenate((inner_ids[-1:], end_ids, outer_ids[-1:]))
 
-        faces = []
-        for j in range(self.resolutions["radial"] - 1):
-            for i in range(self.resolutions["angular"] - 1):
-                faces = add_face(
-                    faces,
-                    index_of(i, j, self.resolutions["angular"]),
-                    index_of(i + 1, j, self.resolutions["angular"]),
-                    index_of(i + 1, j + 1, self.resolutions["angular"]),
-                    index_of(i, j + 1, self.resolutions["angular"]),
-                    method=method,
-                )
-        return np.array(points), np.array(faces)
+        # Row order sets the face orientation: rows along +z give outward normals on the
+        # outer surface, inner-to-outer rows point the start annulus along -z
+        faces = np.concatenate(
+            (
+                strip_faces(outer_ids, method=method, wrap=True),
+                strip_faces(inner_ids[::-1], method=method, wrap=True),
+                strip_faces(start_grid, method=method, wrap=True),
+                strip_faces(end_grid[::-1], method=method, wrap=True),
+            )
+        )
+        return points, faces
 
     # def get_outer_side_mesh_connected(self, stacked_mesh, method="quad"):
     #     points = stacked_mesh[0]
@@ -177,6 +202,8 @@ class CylinderLink(Link3D):
         Get the thickness distribution of the link
         parameters: list of parameters [p1, p2, ...]
         method: method of thickness distribution
+            "linear": thickness from parameters[0] at the start to parameters[1] at the end
+            "piecewise_linear": thickness at evenly spaced stations from the start to the end
         return: list of thickness distribution [t1, t2, ...], shape = (segments_number,)
         """
         if method == "linear":
@@ -186,37 +213,40 @@ class CylinderLink(Link3D):
                 initial_thickness, final_thickness, self.segments_number
             )
             return thickness
+        elif method == "piecewise_linear":
+            stations = np.linspace(0, self.len, len(parameters))
+            return np.interp(self.segments_location, stations, parameters)
+        raise ValueError(f"Unknown thickness distribution method: {method}")
+
+    def get_mass_properties(self):
+        """
+        Get the mass, center of mass and inertia tensor about the center of mass, integrated
+        exactly over the thickness profile (linear between the axial segments).
+        Results are shared between all links with the same geometry and material.
+        return: mass, COM (x, y, z), inertia tensor shape = (3, 3), the arrays are read-only
+        """
+        return _cached_mass_properties(
+            float(self.len),
+            int(self.segments_number),
+            float(self.Rout),
+            float(self.rho),
+            tuple(np.asarray(self.thickness_distribution, dtype=float).tolist()),
+        )
 
     def get_segments_mass(self):
         """
         Get the mass of each segment
         return: list of mass [m1, m2, ...], shape = (segments_number,)
         """
-        segments_mass = []
-        for thickness in self.thickness_distribution:
-            mass = (
-                np.pi
-                * (self.Rout**2 - (self.Rout - thickness) ** 2)
-                * self.segement_length
-                * self.rho
-            )
-            segments_mass.append(mass)
-        return segments_mass
+        areas = np.pi * (self.Rout**2 - (self.Rout - self.thickness_distribution) ** 2)
+        return list(areas * self.segement_length * self.rho)
 
     def get_link_mass(self):
         """
         Get the mass of the link
         return: mass of the link
         """
-        if self.inner_profile["params"][0] == self.inner_profile["params"][1]:
-            return (
-                np.pi
-                * (self.Rout**2 - (self.Rout - self.inner_profile["params"][0]) ** 2)
-                * self.len
-                * self.rho
-            )
-        else:
-            return sum(self.get_segments_mass())
+        return self.get_mass_properties()[0]
 
     def get_inertia_tensor(self, origin=(0, 0, 0)):
         """
@@ -224,48 +254,15 @@ class CylinderLink(Link3D):
         origin: origin of the frame
         return: inertia tensor, shape = (3, 3)
         """
-        if self.inner_profile["params"][0] == self.inner_profile["params"][1]:
-            return self.inertia_vector_hollow_cylinder(
-                M=self.mass,
-                R1=self.inner_profile["params"][0],
-                R2=self.Rout,
-                h=self.len,
-            )
-
-        points, points_number = self.get_discretized_points()
-        Ixx, Iyy, Izz, Ixy, Ixz, Iyz = 0, 0, 0, 0, 0, 0
-        points_mass = self.mass / points_number
-        for point in points:
-            x, y, z = point
-            x -= origin[0]
-            y -= origin[1]
-            z -= origin[2]
-            Ixx += points_mass * (y**2 + z**2)
-            Iyy += points_mass * (x**2 + z**2)
-            Izz += points_mass * (x**2 + y**2)
-            Ixy -= points_mass * x * y
-            Ixz -= points_mass * x * z
-            Iyz -= points_mass * y * z
-        I_tensor = np.array([[Ixx, Ixy, Ixz], [Ixy, Iyy, Iyz], [Ixz, Iyz, Izz]])
-        return I_tensor
+        mass, com, inertia = self.get_mass_properties()
+        return parallel_axis(inertia, mass, com, origin)
 
     def get_center_of_mass(self):
         """
         Get the center of mass
         return: center of mass (x, y, z)
         """
-        if self.inner_profile["params"][0] == self.inner_profile["params"][1]:
-            return np.array([0, 0, self.len / 2])
-        points, points_number = self.get_discretized_points()
-        x, y, z = 0, 0, 0
-        points_mass = self.mass / points_number
-        for point in points:
-            x += point[0] * points_mass
-            y += point[1] * points_mass
-            z += point[2] * points_mass
-        COM = np.array([x, y, z]) / self.mass
-        # COM = np.mean(np.array(points), axis=0) # another way to calculate the center of mass since the points are equivalent
-        return COM
+        return self.get_mass_properties()[1]
 
     @staticmethod
     def inertia_vector_hollow_cylinder(M, R1, R2, h) -> np.ndarray:
@@ -0,0 +1,105 @@
+import numpy as np
+
+
+def hollow_link_mass_properties(z, inner_radius, outer_radius, rho=2700.0, order=3):
+    """
+    Mass properties of axisymmetric hollow links along the z axis.
+
+    Between consecutive stations z the radii vary linearly, and each segment is
+    integrated as a stack of thin annuli with Gauss-Legendre quadrature. The integrands
+    are polynomials of degree 4 in z, so order=3 is exact for such profiles.
+
+    All arguments broadcast, with the stations on the last axis, so many links (e.g. a
+    design sweep) are evaluated at once: z, inner_radius and outer_radius of shape (..., S)
+    and rho of shape (...).
+
+    :param z: array-like, the stations along the link axis in meters (increasing).
+    :param inner_radius: array-like, the inner radius at each station in meters.
+    :param outer_radius: array-like, the outer radius at each station in meters.
+    :param rho: float or array-like, the density in kg/m³.
+    :param order: int, the number of quadrature nodes per segment.
+    :return: mass (...), center of mass (..., 3) and inertia tensor about the center of mass (..., 3, 3).
+    """
+    z, inner_radius, outer_radius = np.broadcast_arrays(
+        np.asarray(z, dtype=float),
+        np.asarray(inner_radius, dtype=float),
+        np.asarray(outer_radius, dtype=float),
+    )
+    if z.shape[-1] < 2:
+        raise ValueError("At least two stations are needed along the link axis")
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    t = (nodes + 1) / 2  # position of the nodes within each segment, in [0, 1]
+
+    def at_nodes(values):
+        # (..., S) station values -> (..., S - 1, order) values at the quadrature nodes
+        return values[..., :-1, None] + (values[..., 1:, None] - values[..., :-1, None]) * t
+
+    half_lengths = (z[..., 1:] - z[..., :-1])[..., None] / 2
+    z_q = at_nodes(z)
+    r_q = at_nodes(inner_radius)
+    R_q = at_nodes(outer_radius)
+
+    def integrate(integrand):
+        return np.sum(integrand * weights * half_lengths, axis=(-2, -1))
+
+    rho = np.asarray(rho, dtype=float)
+    area = np.pi * (R_q**2 - r_q**2)
+    mass = rho * integrate(area)
+    first_moment = rho * integrate(area * z_q)
+    second_moment = rho * integrate(area * z_q**2)
+    # Moment of inertia of each annulus about its own diameter, per unit length
+    diametral = rho * integrate(np.pi / 4 * (R_q**4 - r_q**4))
+
+    z_com = first_moment / mass
+    com = np.zeros(mass.shape + (3,))
+    com[..., 2] = z_com
+    inertia = np.zeros(mass.shape + (3, 3))
+    inertia[..., 0, 0] = diametral + second_moment - mass * z_com**2
+    inertia[..., 1, 1] = inertia[..., 0, 0]
+    inertia[..., 2, 2] = 2 * diametral
+    return mass, com, inertia
+
+
+def parallel_axis(inertia, mass, com, origin=(0, 0, 0)):
+    """
+    Shift inertia tensors from the center of mass to another origin.
+
+    :param inertia: array-like of shape (..., 3, 3), the inertia about the center of mass.
+    :param mass: array-like of shape (...), the mass.
+    :param com: array-like of shape (..., 3), the center of mass.
+    :param origin: array-like of shape (..., 3), the new reference point.
+    :return: np.ndarray of shape (..., 3, 3), the inertia about origin.
+    """
+    mass = np.asarray(mass, dtype=float)
+    d = np.asarray(com, dtype=float) - np.asarray(origin, dtype=float)
+    shift = np.einsum("...i,...i->...", d, d)[..., None, None] * np.eye(3) - np.einsum(
+        "...i,...j->...ij", d, d
+    )
+    return np.asarray(inertia, dtype=float) + mass[..., None, None] * shift
+
+
+def links_mass_properties(links):
+    """
+    Mass properties of many CylinderLinks at once.
+
+    Links with the same number of axial segments are stacked and integrated in one call.
+
+    :param links: list of CylinderLink.
+    :return: mass (N,), center of mass (N, 3) and inertia tensor about the center of mass (N, 3, 3).
+    """
+    mass = np.zeros(len(links))
+    com = np.zeros((len(links), 3))
+    inertia = np.zeros((len(links), 3, 3))
+    groups = {}
+    for index, link in enumerate(links):
+        groups.setdefault(len(link.segments_location), []).append(index)
+    for indices in groups.values():
+        group = [links[index] for index in indices]
+        outer = np.array([link.Rout for link in group])[:, None]
+        mass[indices], com[indices], inertia[indices] = hollow_link_mass_properties(
+            np.stack([link.segments_location for link in group]),
+            outer - np.stack([link.thickness_distribution for link in group]),
+            outer,
+            np.array([link.rho for link in group]),
+        )
+    return mass, com, inertia
@@ -1,4 +1,3 @@
-from robosandbox.geometry import Link
-from robosandbox.geometry import mesh_utilities
+from robosandbox._lazy import attach
 
-__all__ = ["Link", "mesh_utilities"]
+__getattr__, __dir__, __all__ = attach(__name__, submodules=["Link", "mesh_utilities"])
@@ -68,3 +68,36 @@ def add_face(faces, *indices, **kwargs):
         faces.append([entry[0], entry[1], entry[3]])
         faces.append([entry[1], entry[2], entry[3]])
     return faces
+
+
+def strip_faces(index_grid, method="quad", wrap=False):
+    """
+    Faces of a structured grid of points in one go.
+
+    Args:
+        index_grid: A `rows x columns` integer array of indices into `points`. Neighboring entries are connected.
+
+        method: "quad" for `m x 4` faces, or "tri" to split each quad into two triangles like `add_face`.
+
+        wrap: If True, the last column is also connected to the first one (closed ring without a duplicated seam).
+
+    Returns: `faces` in standard format, ordered like the nested `add_face` loops (row-major over quads).
+
+    """
+    index_grid = np.asarray(index_grid)
+    if wrap:
+        index_grid = np.concatenate((index_grid, index_grid[:, :1]), axis=1)
+    quads = np.stack(
+        (
+            index_grid[:-1, :-1],
+            index_grid[:-1, 1:],
+            index_grid[1:, 1:],
+            index_grid[1:, :-1],
+        ),
+        axis=-1,
+    ).reshape(-1, 4)
+    if method == "quad":
+        return quads
+    elif method == "tri":
+        return np.stack((quads[:, [0, 1, 3]], quads[:, [1, 2, 3]]), axis=1).reshape(-1, 3)
+    raise ValueError(f"Unknown mesh method: {method}")
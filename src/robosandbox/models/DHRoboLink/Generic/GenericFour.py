@@ -14,9 +14,17 @@ from robosandbox.visualization.plotly_robot import PlotlyRobot
 
 
 class GenericFour(DHRobot, PlotlyRobot):
-    """ """
+    """
+    Four-DOF DH robot built from CylinderLinks.
 
-    def __init__(self, dofs=4, links=None, alpha=[pi / 2, 0, 0, 0]):
+    :param dofs: int, the number of joints.
+    :param links: list of CylinderLink, the links (default: four identical hollow cylinders).
+    :param alpha: list of float, the DH link twists.
+    :param dynamics: bool, if False only the kinematics are set up and the link mass
+        properties are never computed.
+    """
+
+    def __init__(self, dofs=4, links=None, alpha=[pi / 2, 0, 0, 0], dynamics=True):
         if links is None:
             l1 = cl(
                 length=0.4,
@@ -66,49 +74,54 @@ class GenericFour(DHRobot, PlotlyRobot):
             -links[2].len,
             -links[3].len,
         ]  # Link length along common normal
-        # r = [[0] * 3 for _ in range(dofs)]  # Position of COM with respect to link frame
-        r = [
-            [0, -links[0].COM[-1], 0],
-            [links[1].COM[-1], 0, 0],
-            [links[2].COM[-1], 0, 0],
-            [links[3].COM[-1], 0, 0],
-        ]
-        I = [
-            [
-                links[0].I_tensor[0, 0],
-                links[0].I_tensor[-1, -1],
-                links[0].I_tensor[1, 1],
-                0,
-                0,
-                0,
-            ],  # around y axis
-            [
-                links[1].I_tensor[-1, -1],
-                links[1].I_tensor[0, 0],
-                links[1].I_tensor[1, 1],
-                0,
-                0,
-                0,
-            ],  # around x axis
-            [
-                links[2].I_tensor[-1, -1],
-                links[2].I_tensor[0, 0],
-                links[2].I_tensor[1, 1],
-                0,
-                0,
-                0,
-            ],
-            [
-                links[3].I_tensor[-1, -1],
-                links[3].I_tensor[0, 0],
-                links[3].I_tensor[1, 1],
-                0,
-                0,
-                0,
-            ],
-        ]
+        if dynamics:
+            # r = [[0] * 3 for _ in range(dofs)]  # Position of COM with respect to link frame
+            r = [
+                [0, -links[0].COM[-1], 0],
+                [links[1].COM[-1], 0, 0],
+                [links[2].COM[-1], 0, 0],
+                [links[3].COM[-1], 0, 0],
+            ]
+            I = [
+                [
+                    links[0].I_tensor[0, 0],
+                    links[0].I_tensor[-1, -1],
+                    links[0].I_tensor[1, 1],
+                    0,
+                    0,
+                    0,
+                ],  # around y axis
+                [
+                    links[1].I_tensor[-1, -1],
+                    links[1].I_tensor[0, 0],
+                    links[1].I_tensor[1, 1],
+                    0,
+                    0,
+                    0,
+                ],  # around x axis
+                [
+                    links[2].I_tensor[-1, -1],
+                    links[2].I_tensor[0, 0],
+                    links[2].I_tensor[1, 1],
+                    0,
+                    0,
+                    0,
+                ],
+                [
+                    links[3].I_tensor[-1, -1],
+                    links[3].I_tensor[0, 0],
+                    links[3].I_tensor[1, 1],
+                    0,
+                    0,
+                    0,
+                ],
+            ]
 
-        m = [links[0].mass, links[1].mass, links[2].mass, links[3].mass]  # mass of link
+            m = [links[0].mass, links[1].mass, links[2].mass, links[3].mass]  # mass of link
+        else:
+            r = [None] * dofs
+            I = [None] * dofs
+            m = [None] * dofs
         Jm = [0] * dofs  # actuator inertia
         G = [0] * dofs  # gear ratio
         B = [0] * dofs  # actuator viscous friction coefficient (measured at the motor)
@@ -2,14 +2,70 @@
 
 import numpy as np
 from roboticstoolbox.robot.ERobot import ERobot
+import hashlib
 import os
 import pathlib
 import time
 
 try:
     from .generic_dh_robot import DH_2_URDF
+    from .urdf_cache import ROBOT_KEEPS_URDF, URDF_CACHE, atomic_write_text
+    from .chain_kinematics import JointChain
 except ImportError:
     from generic_dh_robot import DH_2_URDF
+    from urdf_cache import ROBOT_KEEPS_URDF, URDF_CACHE, atomic_write_text
+    from chain_kinematics import JointChain
+
+# Default directory of the URDF file cache
+RSB_DATA_DIR = pathlib.Path(__file__).parent.parent.parent / "rsb-data"
+
+
+def urdf_digest(urdf_string):
+    """
+    Content hash of a URDF string, identical designs share the same digest
+
+    Parameters:
+    -----------
+    urdf_string : str
+        The URDF
+
+    Returns:
+    --------
+    str
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(urdf_string.encode("utf-8")).hexdigest()
+
+
+def write_urdf_file(urdf_string, directory, name, dofs):
+    """
+    Store a URDF in a file named after its content hash
+
+    The URDF is written to a temporary file in the same directory and renamed
+    into place, so parallel processes generating the same design never see a
+    partial file, and an existing file is reused as is.
+
+    Parameters:
+    -----------
+    urdf_string : str
+        The URDF
+    directory : str or pathlib.Path
+        Cache directory, created if missing
+    name : str
+        Robot name
+    dofs : int
+        Number of degrees of freedom
+
+    Returns:
+    --------
+    pathlib.Path
+        Path to the URDF file
+    """
+    directory = pathlib.Path(directory)
+    file_path = directory / f"{name}_{dofs}dof_{urdf_digest(urdf_string)[:16]}.urdf"
+    if not file_path.exists():
+        atomic_write_text(file_path, urdf_string)
+    return file_path
 
 
 class GenericDH(ERobot):
@@ -27,13 +83,14 @@ class GenericDH(ERobot):
         link_radius=0.04,
         actuator_radius=0.05,
         actuator_length=0.1,
+        urdf_dir=None,
     ):
         """
         Create a generic robot from DH parameters
 
-        This class generates a URDF file from DH parameters and stores it
-        persistently in the rsb-data directory for later access. The URDF
-        filename is automatically generated to avoid conflicts.
+        This class generates a URDF string from DH parameters and parses it in
+        memory. With urdf_dir, the URDF is also stored in a file named after
+        its content hash, shared by identical designs.
 
         Parameters:
         -----------
@@ -59,11 +116,15 @@ class GenericDH(ERobot):
             Radius of the actuators (default: 0.05)
         actuator_length : float, optional
             Length of the actuators (default: 0.1)
+        urdf_dir : str or pathlib.Path, optional
+            Directory of the URDF file cache, e.g. RSB_DATA_DIR (default: None,
+            the file is only written when urdf_file_path is accessed)
 
         Note:
         -----
-        The generated URDF file is stored in rsb-data/{name}_{dofs}dof.urdf
-        and can be accessed later via the urdf_file_path property.
+        The URDF is stored in {urdf_dir}/{name}_{dofs}dof_{hash}.urdf and can
+        be accessed later via the urdf_file_path property. Without urdf_dir,
+        the first access of urdf_file_path writes it to RSB_DATA_DIR.
         """
         # print(qlim.shape)
         # print(qlim)
@@ -112,40 +173,26 @@ class GenericDH(ERobot):
             link_radius=link_radius,
             actuator_radius=actuator_radius,
             actuator_length=actuator_length,
-            qlim=[(None, None)]
-            * dofs,  # qlim not used in URDF string, but kept for compatibility
+            qlim=list(zip(qlim[0], qlim[1])),  # limits of the prismatic joints
             name=name,
             joint_types=joint_types,
         )
         urdf_string = dh2urdf.generate_urdf()
 
-        # Create persistent URDF file in rsb-data folder
-        current_dir = pathlib.Path(__file__).parent
-        project_root = current_dir.parent.parent.parent
-        rsb_data_dir = project_root / "rsb-data"
+        urdf_filepath = None
+        if urdf_dir is not None:
+            urdf_filepath = str(write_urdf_file(urdf_string, urdf_dir, name, dofs))
 
-        # Ensure rsb-data directory exists
-        rsb_data_dir.mkdir(exist_ok=True)
-
-        # Create unique filename based on robot name and parameters
-        urdf_filename = self._generate_unique_filename(rsb_data_dir, name, dofs)
-        urdf_filepath = rsb_data_dir / urdf_filename
-
-        # Write URDF file
-        with open(urdf_filepath, "w") as f:
-            f.write(urdf_string)
-
-        # Read the URDF
-        links, robot_name, urdf_string, _ = self.URDF_read(
-            file_path=str(urdf_filepath), tld=None
-        )
+        links, robot_name = URDF_CACHE.parse(urdf_string, urdf_filepath)
 
+        urdf_source = {}
+        if ROBOT_KEEPS_URDF:
+            urdf_source = dict(urdf_string=urdf_string, urdf_filepath=urdf_filepath)
         super().__init__(
             links,
             name=name,
             manufacturer="Generic",
-            urdf_string=urdf_string,
-            urdf_filepath=str(urdf_filepath),
+            **urdf_source,
             # gripper_links=links[-1],
         )
 
@@ -166,60 +213,123 @@ class GenericDH(ERobot):
         self._dh_offset = np.array(offset)
         self._joint_types = joint_types
 
-        # Store URDF file path for reference
-        self._urdf_filepath = str(urdf_filepath)
+        # Store the URDF for reference, the file is written on demand when
+        # the robot was parsed in memory
+        self._urdf_string = urdf_string
+        self._urdf_filepath = urdf_filepath
+
+        # Batched kinematics chain, built on the first batch call
+        self._joint_chain = None
+
+    @property
+    def base(self):
+        return ERobot.base.fget(self)
+
+    @base.setter
+    def base(self, T):
+        ERobot.base.fset(self, T)
+        self._joint_chain = None
 
-    def _generate_unique_filename(self, directory, name, dofs):
+    @property
+    def tool(self):
+        return ERobot.tool.fget(self)
+
+    @tool.setter
+    def tool(self, T):
+        ERobot.tool.fset(self, T)
+        self._joint_chain = None
+
+    def joint_chain(self):
+        """
+        Batched kinematics chain of the robot, cached on the instance
+
+        The chain is rebuilt after the base or tool is set, or when the
+        transform of a link is replaced.
+
+        Returns:
+        --------
+        JointChain
         """
-        Generate a unique URDF filename to avoid conflicts
+        link_ets = [link.ets for link in self.links]
+        if self._joint_chain is not None:
+            chain, chain_ets = self._joint_chain
+            if all(a is b for a, b in zip(link_ets, chain_ets)):
+                return chain
+        chain = JointChain.from_robot(self)
+        self._joint_chain = (chain, link_ets)
+        return chain
+
+    def fkine_batch(self, q):
+        """
+        End-effector poses of many joint configurations in one vectorized pass
+
+        Equivalent to calling fkine on each configuration, without going
+        through the fixed actuator links one configuration at a time.
 
         Parameters:
         -----------
-        directory : pathlib.Path
-            Directory where the file will be stored
-        name : str
-            Base name for the robot
-        dofs : int
-            Number of degrees of freedom
+        q : array_like
+            Joint configurations of shape (N, n) or (n,)
 
         Returns:
         --------
-        str
-            Unique filename
+        ndarray
+            Poses of shape (N, 4, 4)
+        """
+        return self.joint_chain().fkine(q)
+
+    def jacob0_batch(self, q):
         """
-        base_filename = f"{name}_{dofs}dof"
-        urdf_filename = f"{base_filename}.urdf"
+        Geometric Jacobians of many joint configurations in one vectorized pass
+
+        Equivalent to calling jacob0 on each configuration, revolute and
+        prismatic joints alike.
 
-        # Check if file already exists and create unique name if needed
-        counter = 1
-        while (directory / urdf_filename).exists():
-            urdf_filename = f"{base_filename}_{counter}.urdf"
-            counter += 1
+        Parameters:
+        -----------
+        q : array_like
+            Joint configurations of shape (N, n) or (n,)
 
-        return urdf_filename
+        Returns:
+        --------
+        ndarray
+            Jacobians of shape (N, 6, n)
+        """
+        return self.joint_chain().jacob0(q)
 
     @property
     def urdf_file_path(self):
         """
         Get the path to the stored URDF file
 
+        A robot parsed in memory writes its URDF to RSB_DATA_DIR on the first
+        access.
+
         Returns:
         --------
         str
             Path to the URDF file
         """
+        if self._urdf_filepath is None:
+            self._urdf_filepath = str(
+                write_urdf_file(
+                    self._urdf_string, RSB_DATA_DIR, self.name, len(self._joint_types)
+                )
+            )
         return self._urdf_filepath
 
     @classmethod
-    def cleanup_generated_urdf_files(cls, name_pattern=None):
+    def cleanup_generated_urdf_files(cls, name_pattern=None, urdf_dir=RSB_DATA_DIR):
         """
-        Clean up generated URDF files from rsb-data directory
+        Clean up generated URDF files from the URDF file cache
 
         Parameters:
         -----------
         name_pattern : str, optional
             Pattern to match filenames (e.g., "GenericDH*" or "test_robot*")
             If None, removes all *_*dof*.urdf files
+        urdf_dir : str or pathlib.Path, optional
+            Directory of the URDF file cache (default: RSB_DATA_DIR)
 
         Returns:
         --------
@@ -228,10 +338,7 @@ class GenericDH(ERobot):
         """
         import glob
 
-        # Get rsb-data directory path
-        current_dir = pathlib.Path(__file__).parent
-        project_root = current_dir.parent.parent.parent
-        rsb_data_dir = project_root / "rsb-data"
+        rsb_data_dir = pathlib.Path(urdf_dir)
 
         if not rsb_data_dir.exists():
             return []
@@ -381,6 +488,7 @@ if __name__ == "__main__":
         actuator_radius=[0.064, 0.060, 0.060, 0.060, 0.045, 0.045],
         actuator_length=[0.04, 0.12, 0.12, 0.12, 0.05, 0.090],
         # qlim=np.array([-np.pi * np.ones(6), np.pi * np.ones(6)]),
+        urdf_dir=RSB_DATA_DIR,
     )
     print(f"Created robot: {robot.name} with {robot.n} DOFs")
     print(f"URDF file path: {robot.urdf_file_path}")
@@ -4,8 +4,13 @@ import numpy as np
 from roboticstoolbox.robot.Robot import Robot
 from spatialmath import SE3
 
+try:
+    from .urdf_cache import ROBOT_KEEPS_URDF, CachedURDFMixin
+except ImportError:
+    from urdf_cache import ROBOT_KEEPS_URDF, CachedURDFMixin
 
-class Model(Robot):
+
+class Model(CachedURDFMixin, Robot):
     """
     Class that imports a URDF model from file.
     file_path: str
@@ -21,6 +26,7 @@ class Model(Robot):
     gripper_links: list
         List of gripper links, if any. If not provided, defaults to an empty list.
     This class reads the URDF file, extracts the links, and initializes the robot model.
+    Parsed links are cached per process by URDF content, see urdf_cache.URDF_CACHE.
     """
 
     def __init__(
@@ -38,13 +44,15 @@ class Model(Robot):
             xacro_tld=xacro_tld,
         )
 
+        urdf_source = {}
+        if ROBOT_KEEPS_URDF:
+            urdf_source = dict(urdf_string=urdf_string, urdf_filepath=urdf_filepath)
         super().__init__(
             links,
             name=name,
             manufacturer=manufacturer,
             gripper_links=gripper_links,
-            urdf_string=urdf_string,
-            urdf_filepath=urdf_filepath,
+            **urdf_source,
         )
 
         # self.grippers[0].tool = SE3(0, 0, 0.1034)
@@ -2,8 +2,13 @@
 #!/usr/bin/env python
 import roboticstoolbox.models.URDF.Panda as PandaBase
 
+try:
+    from .urdf_cache import CachedURDFMixin
+except ImportError:
+    from urdf_cache import CachedURDFMixin
 
-class Panda(PandaBase):
+
+class Panda(CachedURDFMixin, PandaBase):
     """
     Class that imports a Panda URDF model.
 
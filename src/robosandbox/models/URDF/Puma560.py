@@ -2,8 +2,13 @@
 #!/usr/bin/env python
 import roboticstoolbox.models.URDF.Puma560 as Puma560Base
 
+try:
+    from .urdf_cache import CachedURDFMixin
+except ImportError:
+    from urdf_cache import CachedURDFMixin
 
-class Puma560(Puma560Base):
+
+class Puma560(CachedURDFMixin, Puma560Base):
     """
     Class that imports a Puma560 URDF model.
     """
@@ -2,8 +2,13 @@
 #!/usr/bin/env python
 import roboticstoolbox.models.URDF.UR5 as UR5Base
 
+try:
+    from .urdf_cache import CachedURDFMixin
+except ImportError:
+    from urdf_cache import CachedURDFMixin
 
-class UR5(UR5Base):
+
+class UR5(CachedURDFMixin, UR5Base):
     """
     Class that imports a UR5 URDF model.
 
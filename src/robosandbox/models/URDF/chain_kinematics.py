@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Batched kinematics of a serial elementary transform sequence (ETS)
+
+The links of a URDF robot interleave joint transforms with fixed transforms,
+including the identity joints of the actuator geometry. JointChain folds each
+run of fixed transforms into one matrix and evaluates forward kinematics and
+the geometric Jacobian for many joint configurations in one vectorized pass,
+instead of one toolbox call per configuration.
+"""
+
+import numpy as np
+
+# Columns rotated by a rotation about the x, y and z axes
+_ROTATED_COLUMNS = {0: (1, 2), 1: (2, 0), 2: (0, 1)}
+
+
+def _kind(et):
+    # ET.axis was renamed ET.kind in roboticstoolbox 1.4
+    return et.kind if hasattr(et, "kind") else et.axis
+
+
+class JointChain:
+    """
+    Serial chain of fixed transforms and single-axis joints
+
+    Parameters:
+    -----------
+    ets : roboticstoolbox.ETS
+        Elementary transforms from the base to the end-effector
+    base : ndarray, optional
+        4x4 base transform (default: identity)
+    tool : ndarray, optional
+        4x4 tool transform (default: identity)
+    """
+
+    def __init__(self, ets, base=None, tool=None):
+        self.base = np.eye(4) if base is None else np.array(base, dtype=float)
+        fixed = np.eye(4)
+        # (fixed transform before the joint, axis, prismatic, sign, joint index)
+        self.joints = []
+        n = 0
+        for et in ets:
+            if not et.isjoint:
+                fixed = fixed @ et.A()
+                continue
+            kind = _kind(et)
+            jindex = et.jindex if et.jindex is not None else n
+            self.joints.append(
+                (
+                    fixed,
+                    "xyz".index(kind[1]),
+                    kind[0] == "t",
+                    -1.0 if et.isflip else 1.0,
+                    jindex,
+                )
+            )
+            fixed = np.eye(4)
+            n += 1
+        self.n = n
+        self.end = fixed if tool is None else fixed @ np.asarray(tool, dtype=float)
+
+    @classmethod
+    def from_robot(cls, robot):
+        """
+        Chain of a robot, including its base and tool transforms
+
+        Parameters:
+        -----------
+        robot : roboticstoolbox.Robot
+
+        Returns:
+        --------
+        JointChain
+        """
+        return cls(robot.ets(), base=robot.base.A, tool=robot.tool.A)
+
+    def _check_q(self, q):
+        q = np.atleast_2d(np.asarray(q, dtype=float))
+        if q.shape[1] != self.n:
+            raise ValueError(f"Expected {self.n} joint values, got {q.shape[1]}")
+        return q
+
+    def _forward(self, q, jacobian=False):
+        T = np.empty((len(q), 4, 4))
+        T[:] = np.eye(4)
+        axes, origins = [], []
+        for fixed, axis, prismatic, sign, jindex in self.joints:
+            T = T @ fixed
+            value = sign * q[:, jindex]
+            if jacobian:
+                axes.append(T[:, :3, axis].copy())
+                origins.append(T[:, :3, 3].copy())
+            if prismatic:
+                T[:, :3, 3] += value[:, None] * T[:, :3, axis]
+            else:
+                i, j = _ROTATED_COLUMNS[axis]
+                c, s = np.cos(value)[:, None], np.sin(value)[:, None]
+                col_i, col_j = T[:, :3, i].copy(), T[:, :3, j]
+                T[:, :3, i] = c * col_i + s * col_j
+                T[:, :3, j] = c * col_j - s * col_i
+        T = T @ self.end
+        return T, axes, origins
+
+    def fkine(self, q):
+        """
+        End-effector poses of many joint configurations
+
+        Parameters:
+        -----------
+        q : array_like
+            Joint configurations of shape (N, n) or (n,)
+
+        Returns:
+        --------
+        ndarray
+            Poses of shape (N, 4, 4)
+        """
+        return self.base @ self._forward(self._check_q(q))[0]
+
+    def jacob0(self, q):
+        """
+        Geometric Jacobians of many joint configurations
+
+        As Robot.jacob0, the Jacobians are expressed in the base frame.
+
+        Parameters:
+        -----------
+        q : array_like
+            Joint configurations of shape (N, n) or (n,)
+
+        Returns:
+        --------
+        ndarray
+            Jacobians of shape (N, 6, n), translational rows first
+        """
+        q = self._check_q(q)
+        T, axes, origins = self._forward(q, jacobian=True)
+        J = np.zeros((len(q), 6, self.n))
+        end = T[:, :3, 3]
+        for (_, _, prismatic, sign, jindex), axis, origin in zip(
+            self.joints, axes, origins
+        ):
+            if prismatic:
+                J[:, :3, jindex] = sign * axis
+            else:
+                J[:, :3, jindex] = sign * np.cross(axis, end - origin)
+                J[:, 3:, jindex] = sign * axis
+        return J
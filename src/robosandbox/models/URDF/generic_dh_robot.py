@@ -1,7 +1,102 @@
+import hashlib
+import json
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from numpy import sin, cos, pi
 from scipy.spatial.transform import Rotation as R
 
+try:
+    from .urdf_cache import atomic_write_text
+except ImportError:
+    from urdf_cache import atomic_write_text
+
+# Templates of generate_urdf, filled by generate_urdf_batch
+_URDF_HEADER = (
+    "<robot name='{name}'>\n"
+    "\t<material name='blue'>\n\t\t<color rgba='0 0 0.8 1'/>\n\t</material>\n"
+    "\t<material name='red'>\n\t\t<color rgba='0.8 0 0 1'/>\n\t</material>\n"
+)
+_URDF_ACTUATOR = (
+    "\t<link name='a{i}'>\n"
+    "\t\t<visual>\n"
+    "\t\t\t<origin rpy='{rpy}' xyz='{xyz}'/>\n"
+    "\t\t\t<geometry>\n"
+    "\t\t\t\t<cylinder length='{length}' radius='{radius}'/>\n"
+    "\t\t\t</geometry>\n"
+    "\t\t\t<material name='blue'><color rgba='0.73 0.79 0.82 1'/></material>\n"
+    "\t\t</visual>\n"
+    "\t\t<collision>\n"
+    "\t\t\t<geometry>\n"
+    "\t\t\t\t<cylinder length='{length}' radius='{radius}'/>\n"
+    "\t\t\t</geometry>\n"
+    "\t\t</collision>\n"
+    "\t</link>\n"
+)
+_URDF_ACTUATOR_JOINT = (
+    "\t<joint name='fix_a{i}_to_l{parent}' type='fixed'>\n"
+    "\t\t<parent link='l{parent}'/>\n"
+    "\t\t<child link='a{i}'/>\n"
+    "\t\t<origin rpy='0 0 0' xyz='0 0 0'/>\n"
+    "\t</joint>\n"
+)
+_URDF_LINK = (
+    "\t<link name='l{i}'>\n"
+    "\t\t<visual>\n"
+    "\t\t\t<origin rpy='{rpy}' xyz='{xyz}'/>\n"
+    "\t\t\t<geometry>\n"
+    "\t\t\t\t<cylinder length='{length}' radius='{radius}'/>\n"
+    "\t\t\t</geometry>\n"
+    "\t\t\t<material name='grey'><color rgba='0.99 0.54 0.54 1'/></material>\n"
+    "\t\t</visual>\n"
+    "\t\t<collision>\n"
+    "\t\t\t<geometry>\n"
+    "\t\t\t\t<cylinder length='{length}' radius='{radius}'/>\n"
+    "\t\t\t</geometry>\n"
+    "\t\t</collision>\n"
+    "\t</link>\n"
+)
+_URDF_JOINT = (
+    "\t<joint name='move_l{i}_from_a{i}' type='{type}'>\n"
+    "\t\t<parent link='a{i}'/>\n"
+    "\t\t<child link='l{i}'/>\n"
+    "\t\t<axis xyz='{axis}'/>\n"
+    "\t\t<origin rpy='0 0 0' xyz='{xyz}'/>\n"
+)
+_URDF_LIMIT = "\t\t<limit lower='{lower}' upper='{upper}' effort='0' velocity='0'/>\n"
+_URDF_TOOL = (
+    "\t<link name='tool0'/>\n"
+    "\t<joint name='tool0_fixed_joint' type='fixed'>\n"
+    "\t\t<origin rpy='{rpy}' xyz='{xyz}'/>\n"
+    "\t\t<parent link='l{parent}'/>\n"
+    "\t\t<child link='tool0'/>\n"
+    "\t</joint>\n"
+    "</robot>\n"
+)
+_URDF_JOINT_TYPES = {"r": "continuous", "p": "prismatic", "f": "fixed"}
+# Prismatic joint limits generate_urdf uses in place of None
+_DEFAULT_QLIM = (0.0, 1.0)
+
+
+def _joint_limits(qlim, shape):
+    """
+    Prismatic joint limits of shape shape + (2,), None limits replaced by the
+    defaults of generate_urdf.
+    """
+    qlim = np.asarray(_DEFAULT_QLIM if qlim is None else qlim, dtype=float)
+    qlim = np.where(np.isnan(qlim), _DEFAULT_QLIM, qlim)
+    return np.broadcast_to(qlim, shape + (2,))
+
+
+def _vector_strings(values):
+    """
+    'x y z' strings of an array of shape (..., 3), nested like its leading axes.
+    """
+    rows = values.reshape(-1, 3).tolist()
+    strings = np.array([f"{x} {y} {z}" for x, y, z in rows], dtype=object)
+    return strings.reshape(values.shape[:-1]).tolist()
+
 
 class DH_2_URDF:
     def __init__(
@@ -219,6 +314,12 @@ class DH_2_URDF:
                 # Axis: use z-axis of the frame
                 urdf += f"\t\t<axis xyz='{np.round(fr[0, 2], 5)} {np.round(fr[1, 2], 5)} {np.round(fr[2, 2], 5)}'/>\n"
                 urdf += f"\t\t<origin rpy='0 0 0' xyz='{el[0, 3]} {el[1, 3]} {el[2, 3]}'/>\n"
+                if jointType == "prismatic":
+                    # URDF requires limits on prismatic joints
+                    lower, upper = self.qlim[i]
+                    lower = _DEFAULT_QLIM[0] if lower is None else lower
+                    upper = _DEFAULT_QLIM[1] if upper is None else upper
+                    urdf += f"\t\t<limit lower='{lower}' upper='{upper}' effort='0' velocity='0'/>\n"
                 urdf += "\t</joint>\n"
 
             if i == self.dofs:
@@ -245,6 +346,256 @@ class DH_2_URDF:
         with open(filename, "w") as f:
             f.write(urdf)
 
+    @staticmethod
+    def generate_urdf_batch(
+        a,
+        d,
+        alpha,
+        link_radius=0.04,
+        actuator_radius=0.05,
+        actuator_length=0.1,
+        qlim=None,
+        names="GenericDH",
+        joint_types=None,
+    ):
+        """
+        Generate the URDF strings of many designs at once.
+
+        The joint frames of all designs are computed in vectorized passes and the
+        strings rendered from precompiled templates; each string matches what
+        generate_urdf returns for the same design.
+
+        Parameters:
+        - a, d, alpha: DH parameters of shape (designs, dofs)
+        - link_radius, actuator_radius, actuator_length: scalar, per joint (dofs,)
+          or per design (designs, dofs)
+        - qlim: Prismatic joint limits of shape (dofs, 2) or (designs, dofs, 2),
+          None limits as in generate_urdf (default: 0 to 1)
+        - names: Robot name, or list of one name per design (default: "GenericDH")
+        - joint_types: List of joint types shared by all designs, or one list per
+          design (default: all 'r')
+
+        Returns:
+        - list of URDF strings, one per design
+        """
+        a = np.atleast_2d(np.asarray(a, dtype=float))
+        num_designs, dofs = shape = a.shape
+        d, alpha, link_radius, actuator_radius, actuator_length = (
+            np.broadcast_to(np.asarray(value, dtype=float), shape)
+            for value in [d, alpha, link_radius, actuator_radius, actuator_length]
+        )
+        joint_types = np.broadcast_to(
+            np.asarray(["r"] * dofs if joint_types is None else joint_types), shape
+        )
+        for jt in np.unique(joint_types):
+            if jt not in _URDF_JOINT_TYPES:
+                raise ValueError(f"Unknown joint type: {jt}")
+        qlim = _joint_limits(qlim, shape)
+        names = [names] * num_designs if isinstance(names, str) else list(names)
+        if len(names) != num_designs:
+            raise ValueError(f"Expected {num_designs} names, got {len(names)}")
+
+        # DH transforms at zero joint values, theta is zero for every joint type
+        theta = np.zeros(shape)
+        ct, st, ca, sa = cos(theta), sin(theta), cos(alpha), sin(alpha)
+        transforms = np.zeros((num_designs, dofs + 1, 4, 4))
+        transforms[:, 0] = np.eye(4)
+        transforms[:, 1:, 0] = np.stack([ct, -1 * st * ca, st * sa, a * ct], axis=-1)
+        transforms[:, 1:, 1] = np.stack([st, ct * ca, -1 * ct * sa, a * st], axis=-1)
+        transforms[:, 1:, 2, 1] = sa
+        transforms[:, 1:, 2, 2] = ca
+        transforms[:, 1:, 2, 3] = np.where(joint_types == "p", 0.0, d)
+        transforms[:, 1:, 3, 3] = 1
+
+        frames = np.empty_like(transforms)
+        frames[:, 0] = transforms[:, 0]
+        for i in range(dofs):
+            frames[:, i + 1] = frames[:, i] @ transforms[:, i + 1]
+
+        rpy = R.from_matrix(frames[:, :, :3, :3].reshape(-1, 3, 3)).as_euler("XYZ")
+        frame_rpy = _vector_strings(np.round(rpy.reshape(num_designs, dofs + 1, 3), 3))
+        frame_xyz = _vector_strings(np.round(transforms[:, :, :3, 3], 3))
+        joint_axes = _vector_strings(np.round(frames[:, :dofs, :3, 2], 5))
+        joint_xyz = _vector_strings(transforms[:, :dofs, :3, 3])
+
+        # Link cylinders between consecutive joint origins
+        origins = transforms[:, 1:, :3, 3]
+        # Norms of each vector as generate_urdf computes them, the lengths are
+        # written unrounded
+        norms = np.array([np.linalg.norm(v) for v in origins.reshape(-1, 3)])
+        norms = norms.reshape(shape)
+        has_link = norms != 0.0
+        units = np.divide(
+            origins,
+            norms[..., None],
+            out=np.zeros_like(origins),
+            where=has_link[..., None],
+        )
+        axes = np.cross(origins, np.array([0, 0, -1]))
+        axis_norms = np.linalg.norm(axes, axis=-1, keepdims=True)
+        axes = np.divide(axes, axis_norms, out=axes, where=axis_norms != 0.0)
+        angles = np.arccos(np.clip(units @ np.array([0, 0, 1]), -1.0, 1.0))
+        link_rpy = np.zeros_like(origins)
+        if has_link.any():
+            link_rpy[has_link] = R.from_rotvec(
+                (angles[..., None] * axes)[has_link]
+            ).as_euler("XYZ")
+        link_rpy = _vector_strings(np.round(link_rpy, 3))
+        link_xyz = _vector_strings(np.round(origins / 2, 3))
+
+        norms, has_link = norms.tolist(), has_link.tolist()
+        link_radius, actuator_radius, actuator_length, qlim = (
+            link_radius.tolist(),
+            actuator_radius.tolist(),
+            actuator_length.tolist(),
+            qlim.tolist(),
+        )
+        joint_types = joint_types.tolist()
+
+        urdfs = []
+        for k in range(num_designs):
+            parts = [_URDF_HEADER.format(name=names[k])]
+            for i in range(dofs):
+                parts.append(
+                    _URDF_ACTUATOR.format(
+                        i=i,
+                        rpy=frame_rpy[k][i],
+                        xyz=frame_xyz[k][i],
+                        length=actuator_length[k][i],
+                        radius=actuator_radius[k][i],
+                    )
+                )
+                if i != 0:
+                    parts.append(_URDF_ACTUATOR_JOINT.format(i=i, parent=i - 1))
+                if has_link[k][i]:
+                    parts.append(
+                        _URDF_LINK.format(
+                            i=i,
+                            rpy=link_rpy[k][i],
+                            xyz=link_xyz[k][i],
+                            length=norms[k][i],
+                            radius=link_radius[k][i],
+                        )
+                    )
+                jt = joint_types[k][i]
+                parts.append(
+                    _URDF_JOINT.format(
+                        i=i,
+                        type=_URDF_JOINT_TYPES[jt],
+                        axis=joint_axes[k][i],
+                        xyz=joint_xyz[k][i],
+                    )
+                )
+                if jt == "p":
+                    lower, upper = qlim[k][i]
+                    parts.append(_URDF_LIMIT.format(lower=lower, upper=upper))
+                parts.append("\t</joint>\n")
+            parts.append(
+                _URDF_TOOL.format(
+                    rpy=frame_rpy[k][dofs], xyz=frame_xyz[k][dofs], parent=dofs - 1
+                )
+            )
+            urdfs.append("".join(parts))
+        return urdfs
+
+    @classmethod
+    def export_urdf_batch(
+        cls,
+        directory,
+        a,
+        d,
+        alpha,
+        link_radius=0.04,
+        actuator_radius=0.05,
+        actuator_length=0.1,
+        qlim=None,
+        names="GenericDH",
+        joint_types=None,
+        max_workers=None,
+        chunk_size=1000,
+        manifest_name="manifest.json",
+    ):
+        """
+        Write the URDF files of many designs to a directory, with a manifest.
+
+        The designs are generated by generate_urdf_batch chunk by chunk while a
+        pool of threads writes the files of the previous chunk, each one atomically.
+        The manifest lists, for each design, its file, the SHA-256 of the URDF and
+        the DH parameters it was generated from.
+
+        Parameters:
+        - directory: Target directory, created if missing
+        - a, d, alpha, link_radius, actuator_radius, actuator_length, qlim, names,
+          joint_types: Designs, see generate_urdf_batch
+        - max_workers: Number of writer threads (default: ThreadPoolExecutor's)
+        - chunk_size: Number of designs generated at once (default: 1000)
+        - manifest_name: File name of the manifest (default: "manifest.json")
+
+        Returns:
+        - list of manifest entries, one dict per design
+        """
+        a = np.atleast_2d(np.asarray(a, dtype=float))
+        num_designs, dofs = shape = a.shape
+        d, alpha, link_radius, actuator_radius, actuator_length = (
+            np.broadcast_to(np.asarray(value, dtype=float), shape)
+            for value in [d, alpha, link_radius, actuator_radius, actuator_length]
+        )
+        qlim = _joint_limits(qlim, shape)
+        joint_types = np.broadcast_to(
+            np.asarray(["r"] * dofs if joint_types is None else joint_types), shape
+        )
+        names = [names] * num_designs if isinstance(names, str) else list(names)
+        if len(names) != num_designs:
+            raise ValueError(f"Expected {num_designs} names, got {len(names)}")
+
+        directory = pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        width = len(str(max(num_designs - 1, 0)))
+        files = [f"{name}_{k:0{width}d}.urdf" for k, name in enumerate(names)]
+
+        def write(k, urdf):
+            atomic_write_text(directory / files[k], urdf)
+            return hashlib.sha256(urdf.encode("utf-8")).hexdigest()
+
+        # At most two chunks of URDF strings are alive: the one being written and
+        # the one being generated, so memory does not grow with num_designs
+        digests, pending = [], []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for start in range(0, num_designs, chunk_size):
+                chunk = slice(start, start + chunk_size)
+                urdfs = cls.generate_urdf_batch(
+                    a[chunk],
+                    d[chunk],
+                    alpha[chunk],
+                    link_radius=link_radius[chunk],
+                    actuator_radius=actuator_radius[chunk],
+                    actuator_length=actuator_length[chunk],
+                    qlim=qlim[chunk],
+                    names=names[chunk],
+                    joint_types=joint_types[chunk],
+                )
+                digests.extend(future.result() for future in pending)
+                pending = [
+                    pool.submit(write, k, urdf) for k, urdf in enumerate(urdfs, start)
+                ]
+                del urdfs
+            digests.extend(future.result() for future in pending)
+
+        manifest = [
+            {
+                "index": k,
+                "name": names[k],
+                "file": files[k],
+                "sha256": digests[k],
+                "a": a[k].tolist(),
+                "d": d[k].tolist(),
+                "alpha": alpha[k].tolist(),
+                "joint_types": joint_types[k].tolist(),
+            }
+            for k in range(num_designs)
+        ]
+        atomic_write_text(directory / manifest_name, json.dumps(manifest, indent=1))
+        return manifest
 
 if __name__ == "__main__":
     # Example usage
@@ -0,0 +1,424 @@
+#!/usr/bin/env python
+"""
+Cache of parsed URDF link structures
+
+Constructing a URDF model re-runs xacro, parses the XML and rebuilds the
+links every time. The cache keeps the parsed links of each URDF per process,
+keyed by the URDF content hash and the versions of the packages producing
+them, and hands out copies, so repeated construction (pool workers, Dash
+callbacks) skips parsing.
+
+The links hold scene-graph nodes that cannot be pickled, so the optional
+on-disk store keeps the expanded URDF string instead: a new process then
+skips the xacro preprocessing and only parses the XML.
+
+roboticstoolbox 1.4 builds its URDF models with the module-level URDF_file
+instead of Robot.URDF_read. While a CachedURDFMixin robot is constructed,
+URDF_file is routed through the cache as well, without the on-disk store as
+URDF_file does not return the expanded URDF.
+"""
+
+import contextvars
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pathlib
+import tempfile
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache
+from importlib import metadata
+
+from roboticstoolbox.robot.Robot import Robot
+from roboticstoolbox.tools.data import rtb_path_to_datafile
+from roboticstoolbox.tools.urdf import URDF
+
+# Distributions whose version changes the parsed links
+CACHE_PACKAGES = (
+    "roboticstoolbox-python",
+    "rtb-data",
+    "robot_descriptions",
+    "robosandbox",
+)
+
+# roboticstoolbox 1.4 robots no longer keep the URDF they were built from
+ROBOT_KEEPS_URDF = "urdf_string" in inspect.signature(Robot.__init__).parameters
+
+try:
+    _URDF_LOADER = importlib.import_module("roboticstoolbox.models.URDF.URDFRobot")
+except ImportError:
+    _URDF_LOADER = None
+# URDF_file of roboticstoolbox 1.4, None on versions reading with Robot.URDF_read
+_urdf_file = getattr(_URDF_LOADER, "URDF_file", None)
+_urdf_file = getattr(_urdf_file, "__wrapped__", _urdf_file)
+
+# Set while a CachedURDFMixin robot is constructed
+_CACHED_CONSTRUCTION = contextvars.ContextVar("cached_construction", default=False)
+
+
+@lru_cache(maxsize=None)
+def package_versions():
+    """
+    Versions of the packages producing the parsed links
+
+    Returns:
+    --------
+    tuple
+        (distribution, version) pairs, version is None if not installed
+    """
+    versions = []
+    for package in CACHE_PACKAGES:
+        try:
+            versions.append((package, metadata.version(package)))
+        except metadata.PackageNotFoundError:
+            versions.append((package, None))
+    return tuple(versions)
+
+
+def urdf_key(*parts):
+    """
+    Cache key of a URDF source, its content hash plus the package versions
+
+    Parameters:
+    -----------
+    *parts : str or bytes
+        URDF content and anything else determining the parsed links
+
+    Returns:
+    --------
+    str
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(repr(package_versions()).encode("utf-8"))
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def atomic_write_text(file_path, text):
+    """
+    Write a text file through a temporary file renamed into place
+
+    Readers in other processes see either no file or the complete file.
+
+    Parameters:
+    -----------
+    file_path : str or pathlib.Path
+        Path to the file, its directory is created if missing
+    text : str
+        File content
+    """
+    file_path = pathlib.Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=file_path.parent, prefix=".", suffix=file_path.suffix + ".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def copy_links(links):
+    """
+    Deep copy of a list of links with the parent/child references remapped
+
+    Parameters:
+    -----------
+    links : list
+        Links of a robot
+
+    Returns:
+    --------
+    list
+        Copied links referencing each other instead of the originals
+    """
+    copies = {id(link): deepcopy(link) for link in links}
+    for link in links:
+        copied = copies[id(link)]
+        if link.parent is not None:
+            copied._parent = copies.get(id(link.parent), link.parent)
+        copied._children = [copies.get(id(child), child) for child in link.children]
+        copied._robot = None
+        # roboticstoolbox 1.4 does not copy whether the joint index was assigned
+        # automatically, which the robot checks when it numbers the joints
+        if hasattr(link.ets, "_auto_jindex"):
+            copied.ets._auto_jindex = link.ets._auto_jindex
+    return [copies[id(link)] for link in links]
+
+
+def parse_urdf_string(urdf_string, file_path=None):
+    """
+    Parse a URDF string into robot links without going through a file
+
+    Parameters:
+    -----------
+    urdf_string : str
+        The URDF
+    file_path : str, optional
+        Path of the file the URDF was stored in (default: None)
+
+    Returns:
+    --------
+    tuple
+        List of links and the robot name
+    """
+    urdf = URDF.loadstr(urdf_string, file_path)
+    if hasattr(urdf, "elinks"):
+        return urdf.elinks, urdf.name
+    # roboticstoolbox 1.4 builds the links outside of the URDF class
+    from roboticstoolbox.models.URDF.URDFRobot import _parse_urdf
+
+    return _parse_urdf(urdf_string)
+
+
+class URDFCache:
+    """
+    LRU cache of parsed URDF links with an optional on-disk store
+
+    Parameters:
+    -----------
+    max_entries : int, optional
+        Number of parsed URDFs kept in memory (default: 32)
+    cache_dir : str or pathlib.Path, optional
+        Directory of the on-disk store of expanded URDFs (default: None)
+    """
+
+    def __init__(self, max_entries=32, cache_dir=None):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Drop the parsed URDFs kept in memory"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Copy of the parsed URDF stored under key
+
+        Returns:
+        --------
+        tuple or None
+            List of links, robot name and URDF string, None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        links, name, urdf_string = entry
+        return copy_links(links), name, urdf_string
+
+    def put(self, key, links, name, urdf_string):
+        """
+        Store a copy of a parsed URDF, evicting the least recently used one
+
+        The links passed in stay with the caller, which usually hands them to
+        a robot that takes ownership of them.
+        """
+        self._entries[key] = (copy_links(links), name, urdf_string)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def parse(self, urdf_string, file_path=None):
+        """
+        Cached parse_urdf_string
+
+        Returns:
+        --------
+        tuple
+            List of links and the robot name
+        """
+        key = urdf_key(urdf_string)
+        cached = self.get(key)
+        if cached is not None:
+            return cached[:2]
+        links, name = parse_urdf_string(urdf_string, file_path)
+        self.put(key, links, name, urdf_string)
+        return links, name
+
+    def read(self, file_path, reader, tld=None, xacro_tld=None):
+        """
+        Cached Robot.URDF_read
+
+        Parameters:
+        -----------
+        file_path : str
+            URDF or xacro file, relative to tld
+        reader : callable
+            URDF_read of the robot class, called on a miss
+        tld : str, optional
+            Top-level directory of the file (default: the rtb-data xacro folder)
+        xacro_tld : str, optional
+            Top-level directory within the xacro data (default: None)
+
+        Returns:
+        --------
+        tuple
+            List of links, robot name, URDF string and file path
+        """
+        base_path = pathlib.Path(rtb_path_to_datafile("xacro") if tld is None else tld)
+        source = base_path / file_path
+        content = source.read_bytes() if source.is_file() else b""
+        key = urdf_key(content, source, xacro_tld)
+
+        cached = self.get(key)
+        if cached is not None:
+            links, name, urdf_string = cached
+            return links, name, urdf_string, source
+
+        stored = self._load(key)
+        if stored is not None:
+            urdf_string = stored["urdf_string"]
+            links, name = parse_urdf_string(urdf_string, source)
+        else:
+            links, name, urdf_string, source = reader(
+                file_path, tld=tld, xacro_tld=xacro_tld
+            )
+            self._store(key, name, urdf_string)
+        self.put(key, links, name, urdf_string)
+        return links, name, urdf_string, source
+
+    def load(self, file, loader, patch=None, extra_packages=None):
+        """
+        Cached URDF_file of roboticstoolbox 1.4
+
+        Parameters:
+        -----------
+        file : str, pathlib.Path or file-like
+            URDF or xacro file, relative to the rtb-data xacro folder, or the
+            name of a robot_descriptions model
+        loader : callable
+            URDF_file of the toolbox, called on a miss
+        patch : callable, optional
+            Fix applied to the file content before parsing (default: None)
+        extra_packages : dict, optional
+            Additional xacro packages (default: None)
+
+        Returns:
+        --------
+        tuple
+            List of links, robot name and resolved file path
+        """
+        if not isinstance(file, (str, pathlib.Path)):
+            # File-like objects can only be read once
+            return loader(file, patch=patch, extra_packages=extra_packages)
+
+        source = pathlib.Path(file)
+        if source.suffix in (".urdf", ".xacro"):
+            if not source.is_absolute():
+                source = pathlib.Path(rtb_path_to_datafile("xacro")) / source
+            content = source.read_bytes() if source.is_file() else b""
+        else:
+            # robot_descriptions model, versioned by CACHE_PACKAGES
+            content = b""
+        patch_name = None
+        if patch is not None:
+            patch_name = f"{patch.__module__}.{patch.__qualname__}"
+        packages = sorted((extra_packages or {}).items())
+        key = urdf_key(content, file, patch_name, packages)
+
+        cached = self.get(key)
+        if cached is not None:
+            links, name, source = cached
+            return links, name, source
+
+        links, name, source = loader(file, patch=patch, extra_packages=extra_packages)
+        # The file path stands in for the URDF string, which URDF_file drops
+        self.put(key, links, name, source)
+        return links, name, source
+
+    def _load(self, key):
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(pathlib.Path(self.cache_dir) / f"{key}.json") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key, name, urdf_string):
+        if self.cache_dir is None or urdf_string is None:
+            return
+        atomic_write_text(
+            pathlib.Path(self.cache_dir) / f"{key}.json",
+            json.dumps({"name": name, "urdf_string": urdf_string}),
+        )
+
+
+# Per-process cache used by the URDF models, set URDF_CACHE.cache_dir to
+# share expanded URDFs between processes
+URDF_CACHE = URDFCache()
+
+
+def read_urdf_file(file_path, tld=None, xacro_tld=None):
+    """
+    Robot.URDF_read for roboticstoolbox 1.4, which reads with URDF_file
+
+    xacro_tld is not supported by URDF_file and ignored. The expanded URDF is
+    not returned, so the URDF string is None.
+
+    Returns:
+    --------
+    tuple
+        List of links, robot name, None and file path
+    """
+    base_path = pathlib.Path(rtb_path_to_datafile("xacro") if tld is None else tld)
+    links, name, source = _urdf_file((base_path / file_path).absolute())
+    return links, name, None, source
+
+
+def _cached_urdf_file(file, model=None, patch=None, extra_packages=None):
+    if not _CACHED_CONSTRUCTION.get():
+        return _urdf_file(file, model, patch=patch, extra_packages=extra_packages)
+    return URDF_CACHE.load(
+        file,
+        lambda file, **kwargs: _urdf_file(file, model, **kwargs),
+        patch=patch,
+        extra_packages=extra_packages,
+    )
+
+
+if _urdf_file is not None:
+    _cached_urdf_file.__wrapped__ = _urdf_file
+    _URDF_LOADER.URDF_file = _cached_urdf_file
+
+
+class CachedURDFMixin:
+    """
+    Mixin routing the URDF reading of a robot class through URDF_CACHE
+
+    Use it ahead of the robot base class, e.g.
+    ``class Panda(CachedURDFMixin, PandaBase)``. It caches Robot.URDF_read
+    and, on roboticstoolbox 1.4, the URDF_file called while constructing the
+    robot.
+    """
+
+    def __init__(self, *args, **kwargs):
+        token = _CACHED_CONSTRUCTION.set(True)
+        try:
+            super().__init__(*args, **kwargs)
+        finally:
+            _CACHED_CONSTRUCTION.reset(token)
+
+    def URDF_read(self, file_path, tld=None, xacro_tld=None):
+        reader = getattr(super(), "URDF_read", None) or read_urdf_file
+        return URDF_CACHE.read(file_path, reader, tld=tld, xacro_tld=xacro_tld)
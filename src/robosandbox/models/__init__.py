@@ -1,6 +1,5 @@
-from . import DH
-from . import MR
-from . import DHRoboLink
-from . import URDF
+from robosandbox._lazy import attach
 
-__all__ = ["DH", "MR", "DHRoboLink", "URDF"]
+__getattr__, __dir__, __all__ = attach(
+    __name__, submodules=["DH", "MR", "DHRoboLink", "URDF"]
+)
@@ -1,4 +1,6 @@
-from .sweeper import ParameterSweeper
-from .problem import DesignProblem
+from robosandbox._lazy import attach
 
-__all__ = ["ParameterSweeper", "DesignProblem"]
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={"ParameterSweeper": "sweeper", "DesignProblem": "problem"},
+)
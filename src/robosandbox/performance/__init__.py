@@ -1,3 +1,3 @@
-from . import workspace
+from robosandbox._lazy import attach
 
-__all__ = ["workspace"]
+__getattr__, __dir__, __all__ = attach(__name__, submodules=["workspace"])
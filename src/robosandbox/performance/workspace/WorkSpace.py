@@ -2,7 +2,9 @@ import numpy as np
 import pandas as pd
 from typing import Callable, Optional, Union
 from .indice_manager import IndiceManager
+from . import volume_estimators
 from robosandbox.visualization.plotly_WorkSpace import PlotlyWorkSpace
+from robosandbox.visualization.voxel_accumulator import VoxelAccumulator
 
 
 class WorkSpace(PlotlyWorkSpace):
@@ -14,6 +16,7 @@ class WorkSpace(PlotlyWorkSpace):
         self.robot = robot
         self.df = pd.DataFrame(columns=["x", "y", "z"])
         self.indice_manager = IndiceManager()
+        self.voxel_accumulator = None
         PlotlyWorkSpace.__init__(self, df=self.df)
 
     def add_indice(
@@ -84,6 +87,8 @@ class WorkSpace(PlotlyWorkSpace):
         max_samples: int = 20000,
         is_normalized: bool = False,
         *args,
+        volume_tolerance: Optional[float] = None,
+        progress_callback: Optional[Callable[[int, float], None]] = None,
         **kwargs,
     ) -> float:
         """
@@ -91,8 +96,16 @@ class WorkSpace(PlotlyWorkSpace):
 
         :param method: str, the metric to use for calculation (default is "yoshikawa").
         :param is_normalized: bool, flag indicating whether to normalize the indice (default is False).
+        :param volume_tolerance: float, optional, if given, sampling also continues until the
+            relative change of the voxel volume tracked by track_voxels() drops below this value.
+        :param progress_callback: callable, optional, called after every batch with the
+            number of samples and the current global indice.
         :return: float, the computed global indice value.
         """
+        if volume_tolerance is not None and self.voxel_accumulator is None:
+            raise ValueError(
+                "volume_tolerance requires voxel tracking, call track_voxels() first"
+            )
         qlist = self.generate_joints_samples(initial_samples)
         self.add_samples(
             points=self.get_cartesian_points(qlist),
@@ -104,14 +117,19 @@ class WorkSpace(PlotlyWorkSpace):
         current_G = self._calc_global_indice(
             method=method, is_normalized=is_normalized, *args, **kwargs
         )
-        if current_G == 0:
+        if progress_callback is not None:
+            progress_callback(len(self.df), current_G)
+        if current_G == 0 and volume_tolerance is None:
             return 0.0
 
         prev_G = 0
-        err_relative = np.abs(prev_G - current_G) / current_G
+        err_relative = self._relative_change(prev_G, current_G)
         iteration = 1
         # Iteratively refine the global indice until convergence.
-        while err_relative > error_tolerance_percentage and len(self.df) < max_samples:
+        while (
+            err_relative > error_tolerance_percentage
+            or not self._is_volume_converged(volume_tolerance)
+        ) and len(self.df) < max_samples:
             num_samples = int(len(self.df) * batch_ratio)
             qlist = self.generate_joints_samples(num_samples)
             self.add_samples(
@@ -125,10 +143,49 @@ class WorkSpace(PlotlyWorkSpace):
             current_G = self._calc_global_indice(
                 method=method, is_normalized=is_normalized, *args, **kwargs
             )
-            err_relative = np.abs(prev_G - current_G) / current_G
+            err_relative = self._relative_change(prev_G, current_G)
             iteration += 1
+            if progress_callback is not None:
+                progress_callback(len(self.df), current_G)
         return current_G
 
+    @staticmethod
+    def _relative_change(prev_G: float, current_G: float) -> float:
+        # A global indice of zero has nothing left to converge
+        if current_G == 0:
+            return 0.0
+        return np.abs(prev_G - current_G) / current_G
+
+    def _is_volume_converged(self, volume_tolerance: Optional[float]) -> bool:
+        if volume_tolerance is None:
+            return True
+        return self.voxel_accumulator.is_converged(volume_tolerance)
+
+    def track_voxels(
+        self, voxel_size: float = 0.05, bounds=None, growable: bool = True
+    ) -> VoxelAccumulator:
+        """
+        Start accumulating voxel statistics for every batch passed to add_samples.
+
+        Samples already in the workspace are fed to the accumulator first.
+
+        :param voxel_size: float, the edge length of a voxel in meters.
+        :param bounds: optional, [[xmin, xmax], [ymin, ymax], [zmin, zmax]] of the voxel grid.
+        :param growable: bool, whether the grid grows to cover samples outside the bounds.
+        :return: VoxelAccumulator, the accumulator, also stored in self.voxel_accumulator.
+        """
+        self.voxel_accumulator = VoxelAccumulator(
+            voxel_size=voxel_size, bounds=bounds, growable=growable
+        )
+        if len(self.df) > 0:
+            metrics = list(self.df.iloc[:, 3:].select_dtypes("number").columns)
+            self.voxel_accumulator.add_samples(
+                self.df[["x", "y", "z"]].to_numpy(dtype=float),
+                metric_values=self.df[metrics].to_numpy(dtype=float),
+                metric=metrics,
+            )
+        return self.voxel_accumulator
+
     def list_indice(self) -> list:
         """
         List all available indices.
@@ -156,6 +213,8 @@ class WorkSpace(PlotlyWorkSpace):
         :param joint_points: list of joint points.
         :return: cartesian_points: list of cartesian points. (x, y, z)
         """
+        if hasattr(self.robot, "fkine_batch") and len(joint_points) > 0:
+            return list(self.robot.fkine_batch(joint_points)[:, :3, 3])
         cartesian_points = []
         for point in joint_points:
             T = self.robot.fkine(point)
@@ -182,6 +241,9 @@ class WorkSpace(PlotlyWorkSpace):
             [filtered_df, filtered_points_df], axis=0, ignore_index=True
         )
 
+        if self.voxel_accumulator is not None:
+            self.voxel_accumulator.add_samples(points, metric_values, metric)
+
     def get_max_distance(self, origin=[0, 0, 0]):
         """
         Calculate the maximum Euclidean distance of all points from the specified origin.
@@ -220,7 +282,51 @@ class WorkSpace(PlotlyWorkSpace):
         elif axes == "all":
             return [x_range, y_range, z_range]
 
-    def get_volume(self, origin=[0, 0, 0], method="sphere"):
+    def get_volume(
+        self,
+        origin=[0, 0, 0],
+        method="sphere",
+        return_error: bool = False,
+        **kwargs,
+    ):
+        """
+        Estimate the workspace volume.
+
+        :param origin: list, the sphere centre for the "sphere" method.
+        :param method: str, one of
+            "sphere": sphere enclosing all samples around the origin (no error estimate),
+            "voxel": voxel occupancy extrapolated from two resolutions (kwargs: voxel_size),
+            "convex_hull": convex hull of the samples (kwargs: seed),
+            "alpha_shape": concave hull of the samples (kwargs: alpha, max_points, seed).
+        :param return_error: bool, also return the error estimate.
+        :param kwargs: additional keyword arguments for the estimator.
+        :return: float, the volume in m³, or (volume, error) if return_error is set.
+        """
         if method == "sphere":
             r = self.get_max_distance(origin)
-            return (4 / 3) * np.pi * r**3
+            result = {"volume": (4 / 3) * np.pi * r**3, "error": np.nan}
+        elif method == "voxel":
+            voxel_size = kwargs.get("voxel_size")
+            accumulator = self.voxel_accumulator
+            if accumulator is not None and voxel_size in (None, accumulator.voxel_size):
+                # Reuse the incrementally tracked occupancy instead of re-binning
+                indices = np.stack(np.nonzero(accumulator.counts), axis=1)
+                result = volume_estimators.voxel_volume_from_indices(
+                    indices + accumulator.origin_idx, accumulator.voxel_size
+                )
+            else:
+                result = volume_estimators.voxel_volume(self._valid_points(), **kwargs)
+        elif method == "convex_hull":
+            result = volume_estimators.convex_hull_volume(self._valid_points(), **kwargs)
+        elif method == "alpha_shape":
+            result = volume_estimators.alpha_shape_volume(self._valid_points(), **kwargs)
+        else:
+            raise ValueError(f"Unknown volume method: {method}")
+
+        if return_error:
+            return result["volume"], result["error"]
+        return result["volume"]
+
+    def _valid_points(self):
+        points = self.df[["x", "y", "z"]].to_numpy(dtype=float)
+        return points[~np.isnan(points).any(axis=1)]
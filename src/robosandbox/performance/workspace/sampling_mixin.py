@@ -21,6 +21,8 @@ class SamplingMixin:
         :param joint_points: list of joint points.
         :return: cartesian_points: list of cartesian points. (x, y, z)
         """
+        if hasattr(self.robot, "fkine_batch") and len(joint_points) > 0:
+            return list(self.robot.fkine_batch(joint_points)[:, :3, 3])
         cartesian_points = []
         for point in joint_points:
             T = self.robot.fkine(point)
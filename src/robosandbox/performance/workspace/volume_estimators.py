@@ -0,0 +1,257 @@
+"""
+Workspace volume estimators working on (N, 3) arrays of Cartesian sample points.
+
+Every estimator returns a dictionary with at least the estimated "volume" and an
+"error" estimate, both in m³.
+"""
+
+import numpy as np
+from scipy.spatial import ConvexHull, Delaunay, QhullError
+from robosandbox.visualization.sparse_voxel_data import pack_voxel_keys
+
+
+def _as_points(points) -> np.ndarray:
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    return points[~np.isnan(points).any(axis=1)]
+
+
+def sample_spacing(points) -> float:
+    """
+    Characteristic spacing of the samples: the edge of a cube holding one sample
+    if the samples were spread uniformly over their bounding box.
+
+    :param points: array-like of shape (N, 3).
+    :return: float, the spacing in meters.
+    """
+    points = _as_points(points)
+    if len(points) < 2:
+        return 0.0
+    extent = np.ptp(points, axis=0)
+    extent = np.where(extent > 0, extent, np.max(extent))
+    return float((np.prod(extent) / len(points)) ** (1 / 3))
+
+
+def voxel_volume_from_indices(indices, voxel_size: float) -> dict:
+    """
+    Resolution-extrapolated voxel volume from the indices of occupied voxels.
+
+    Boundary voxels overestimate the volume by roughly (surface area * voxel size / 2),
+    so the occupied volume is linear in the voxel size to first order. Comparing the
+    volume at h and 2h gives the extrapolated estimate V0 = 2 V(h) - V(2h), and the
+    difference |V(h) - V0| as its error estimate.
+
+    :param indices: array-like of shape (M, 3), integer indices of occupied voxels (duplicates allowed).
+    :param voxel_size: float, the voxel edge length h.
+    :return: dict with volume, error, raw_volume (at h), coarse_volume (at 2h) and voxel_size.
+    """
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    fine = len(np.unique(pack_voxel_keys(indices)))
+    coarse = len(np.unique(pack_voxel_keys(indices >> 1)))
+    raw_volume = fine * voxel_size**3
+    coarse_volume = coarse * (2 * voxel_size) ** 3
+    volume = max(2 * raw_volume - coarse_volume, 0.0)
+    return {
+        "volume": volume,
+        "error": abs(raw_volume - volume),
+        "raw_volume": raw_volume,
+        "coarse_volume": coarse_volume,
+        "voxel_size": voxel_size,
+    }
+
+
+def voxel_volume(points, voxel_size=None) -> dict:
+    """
+    Voxel occupancy volume with resolution extrapolation.
+
+    The extrapolation assumes the voxels are large enough for the samples to fill
+    the workspace without holes; the default voxel size is twice the sample spacing.
+
+    :param points: array-like of shape (N, 3).
+    :param voxel_size: float, optional, the voxel edge length in meters.
+    :return: dict, see voxel_volume_from_indices.
+    """
+    points = _as_points(points)
+    if voxel_size is None:
+        voxel_size = 2 * sample_spacing(points)
+    if len(points) == 0 or voxel_size <= 0:
+        return {
+            "volume": 0.0,
+            "error": 0.0,
+            "raw_volume": 0.0,
+            "coarse_volume": 0.0,
+            "voxel_size": voxel_size,
+        }
+    indices = np.floor(points / voxel_size).astype(np.int64)
+    return voxel_volume_from_indices(indices, voxel_size)
+
+
+def _hull_volume(points) -> float:
+    if len(points) < 4:
+        return 0.0
+    try:
+        return float(ConvexHull(points).volume)
+    except QhullError:
+        # Degenerate (flat or collinear) point sets have no volume
+        return 0.0
+
+
+def _hull_deficit(volume, previous_volume, num_points, previous_num_points) -> float:
+    # The hull of N uniform samples of a smooth body misses O(N^(-1/2)) of its volume
+    # in 3D, so the change between two sample sizes predicts the remainder.
+    ratio = np.sqrt(num_points / previous_num_points)
+    if ratio <= 1:
+        return np.inf
+    return max(volume - previous_volume, 0.0) / (ratio - 1)
+
+
+def convex_hull_volume(points, seed: int = 0) -> dict:
+    """
+    Convex hull volume of the samples.
+
+    The hull volume converges from below; the error estimate extrapolates the missing
+    volume from the hull of a random half of the samples. The hull always includes
+    non-convex regions that the robot cannot reach, which the error does not cover.
+
+    :param points: array-like of shape (N, 3).
+    :param seed: int, seed for the random half sample.
+    :return: dict with volume and error.
+    """
+    points = _as_points(points)
+    volume = _hull_volume(points)
+    rng = np.random.default_rng(seed)
+    half = rng.permutation(len(points))[: len(points) // 2]
+    half_volume = _hull_volume(points[half])
+    error = _hull_deficit(volume, half_volume, len(points), len(half)) if len(half) else np.inf
+    return {"volume": volume, "error": error}
+
+
+class IncrementalConvexHullVolume:
+    """
+    Convex hull volume updated batch by batch with scipy's incremental Qhull.
+    """
+
+    def __init__(self):
+        self.hull = None
+        self._pending = np.zeros((0, 3))
+        self.history = []
+
+    @property
+    def num_points(self) -> int:
+        return len(self.hull.points) if self.hull is not None else len(self._pending)
+
+    def add_points(self, points):
+        """
+        Add a batch of samples to the hull.
+
+        :param points: array-like of shape (N, 3).
+        :return: self
+        """
+        points = _as_points(points)
+        if self.hull is not None:
+            if len(points) > 0:
+                self.hull.add_points(points)
+        else:
+            # Qhull needs four non-coplanar points before the hull exists
+            self._pending = np.vstack([self._pending, points])
+            if len(self._pending) >= 4:
+                try:
+                    self.hull = ConvexHull(self._pending, incremental=True)
+                except QhullError:
+                    pass
+        self.history.append((self.num_points, self.volume))
+        return self
+
+    @property
+    def volume(self) -> float:
+        return float(self.hull.volume) if self.hull is not None else 0.0
+
+    def estimate(self) -> dict:
+        """
+        Current volume and the deficit extrapolated from the previous batch.
+
+        :return: dict with volume and error.
+        """
+        if len(self.history) < 2:
+            return {"volume": self.volume, "error": np.inf}
+        (previous_n, previous_volume), (n, volume) = self.history[-2], self.history[-1]
+        if previous_n == 0:
+            return {"volume": volume, "error": np.inf}
+        return {
+            "volume": volume,
+            "error": _hull_deficit(volume, previous_volume, n, previous_n),
+        }
+
+
+def _tetrahedra_geometry(points, simplices):
+    a = points[simplices[:, 0]]
+    b = points[simplices[:, 1]] - a
+    c = points[simplices[:, 2]] - a
+    d = points[simplices[:, 3]] - a
+    c_cross_d = np.cross(c, d)
+    triple = np.einsum("ij,ij->i", b, c_cross_d)
+    volumes = np.abs(triple) / 6
+    numerator = (
+        np.einsum("ij,ij->i", b, b)[:, None] * c_cross_d
+        + np.einsum("ij,ij->i", c, c)[:, None] * np.cross(d, b)
+        + np.einsum("ij,ij->i", d, d)[:, None] * np.cross(b, c)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        radii = np.linalg.norm(numerator, axis=1) / np.abs(2 * triple)
+    radii = np.where(np.isfinite(radii), radii, np.inf)
+    return volumes, radii
+
+
+def _alpha_shape(points, alpha):
+    # Volume and alpha sensitivity of one tetrahedralization
+    if len(points) < 4:
+        return 0.0, 0.0, alpha
+    try:
+        tetrahedralization = Delaunay(points)
+    except QhullError:
+        return 0.0, 0.0, alpha
+    volumes, radii = _tetrahedra_geometry(points, tetrahedralization.simplices)
+    if alpha is None:
+        alpha = 2 * float(np.median(radii[np.isfinite(radii)]))
+
+    def volume_at(threshold):
+        return float(np.sum(volumes[radii <= threshold]))
+
+    volume = volume_at(alpha)
+    sensitivity = max(
+        abs(volume_at(1.25 * alpha) - volume), abs(volume - volume_at(0.8 * alpha))
+    )
+    return volume, sensitivity, alpha
+
+
+def alpha_shape_volume(
+    points, alpha=None, max_points: int = 100000, seed: int = 0
+) -> dict:
+    """
+    Alpha-shape (concave hull) volume of the samples.
+
+    The Delaunay tetrahedra with a circumradius below alpha are kept and their volumes
+    summed. Like the convex hull, the alpha shape misses volume near the boundary that
+    shrinks with the sample count. The error estimate adds that deficit, extrapolated
+    from a random half of the samples, to the volume change when alpha is scaled by
+    0.8 and 1.25.
+
+    :param points: array-like of shape (N, 3).
+    :param alpha: float, optional, the circumradius threshold in meters
+        (default: twice the median circumradius of the Delaunay tetrahedra).
+    :param max_points: int, random subsample size above which the tetrahedralization is capped.
+    :param seed: int, seed for the subsamples.
+    :return: dict with volume, error and alpha.
+    """
+    points = _as_points(points)
+    rng = np.random.default_rng(seed)
+    if len(points) > max_points:
+        points = points[rng.choice(len(points), max_points, replace=False)]
+    volume, sensitivity, alpha = _alpha_shape(points, alpha)
+    if alpha is None:
+        return {"volume": volume, "error": 0.0, "alpha": alpha}
+
+    # The sample spacing, and with it alpha, grows by 2^(1/3) on the half sample
+    half = rng.permutation(len(points))[: len(points) // 2]
+    half_volume, _, _ = _alpha_shape(points[half], alpha * 2 ** (1 / 3))
+    deficit = _hull_deficit(volume, half_volume, len(points), len(half)) if len(half) else np.inf
+    return {"volume": volume, "error": sensitivity + deficit, "alpha": alpha}
@@ -1,13 +1,17 @@
-from .plotly_Figure3D import Figure3D, reflect_over_XZ_plane
-from .app import RobotArmDesignApp
-from .app_standalone import RobotArmDesignAppStandalone
-from .voxel_data import VoxelData
+from robosandbox._lazy import attach
 
-
-__all__ = [
-    "Figure3D",
-    "reflect_over_XZ_plane",
-    "RobotArmDesignApp",
-    "RobotArmDesignAppStandalone",
-    "VoxelData",
-]
+# The Dash apps, matplotlib and plotly are only imported when used
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "Figure3D": "plotly_Figure3D",
+        "reflect_over_XZ_plane": "plotly_Figure3D",
+        "RobotArmDesignApp": "app",
+        "RobotArmDesignAppStandalone": "app_standalone",
+        "VoxelData": "voxel_data",
+        "VoxelAccumulator": "voxel_accumulator",
+        "SparseVoxelData": "sparse_voxel_data",
+        "WorkSpaceOctree": "workspace_octree",
+        "WorkSpaceEnvelope": "workspace_envelope",
+    },
+)
@@ -1,19 +1,92 @@
 import dash
 from dash import dcc, html
 import dash_bootstrap_components as dbc
-from dash.dependencies import Input, Output, State
+from dash.dependencies import ALL, Input, Output, State
 import plotly.graph_objects as go
 import robosandbox as rsb
 import numpy as np
+import uuid
+from contextlib import nullcontext
+from functools import lru_cache
 from robosandbox.performance.workspace import WorkSpace
+from robosandbox.visualization.background_jobs import (
+    JobSlots,
+    create_callback_manager,
+    create_job_cache,
+)
+from robosandbox.visualization.figure_payload import (
+    COMPRESSION_AVAILABLE,
+    describe_payload,
+    typed_array,
+)
+from robosandbox.visualization.pose_clientside import POSE_CALLBACK_JS, dh_table
+from robosandbox.visualization.workspace_cache import (
+    SINGULAR_VALUE_INDICES,
+    RecordingWorkSpace,
+    WorkSpaceCache,
+    WorkSpaceSamples,
+)
+from robosandbox.visualization.workspace_stream import (
+    PointStream,
+    extend_data,
+    stream_trace,
+)
+
+# Inputs whose change makes a running workspace analysis obsolete
+WORKSPACE_INPUT_IDS = [
+    "robot_selection",
+    "link_lengths",
+    "alpha",
+    "qs",
+    "commercial_qs",
+    "method_dropdown",
+    "axes_dropdown",
+]
+WORKSPACE_MAX_SAMPLES = 50000
+# Maximum number of workspace points drawn in the figure
+WORKSPACE_PLOT_POINTS = 20000
 
 
 class RobotArmDesignApp:
     """A Dash application for designing and analyzing robot arms."""
 
-    def __init__(self):
-        """Initialize the Dash application with UI components and callbacks."""
-        self.app = dash.Dash(external_stylesheets=[dbc.themes.MINTY])
+    def __init__(
+        self, max_jobs=2, cache_dir=None, max_workspaces=16, progressive=True
+    ):
+        """
+        Initialize the Dash application with UI components and callbacks.
+
+        :param max_jobs: int, the maximum number of workspace analyses running at once.
+        :param cache_dir: str, optional, the directory of the background job cache (default: one per app and user in the temporary directory).
+        :param max_workspaces: int, the maximum number of sampled workspaces kept in the cache.
+        :param progressive: bool, whether the sampled points are streamed into the figure during an analysis.
+        """
+        # Workspace analyses run as background jobs when dash[diskcache] is installed
+        self.job_cache = create_job_cache(cache_dir, app_name=type(self).__name__)
+        self.callback_manager = create_callback_manager(self.job_cache)
+        self.job_slots = JobSlots(
+            self.job_cache if self.callback_manager is not None else None,
+            max_jobs=max_jobs,
+        )
+        # Sampled workspaces, shared with the job processes through the job cache
+        self.workspace_cache = WorkSpaceCache(
+            max_entries=max_workspaces,
+            cache=self.job_cache if self.callback_manager is not None else None,
+        )
+        # Batches of the running analyses, polled by the page in progressive mode
+        self.point_stream = (
+            PointStream(
+                self.job_cache if self.callback_manager is not None else None
+            )
+            if progressive
+            else None
+        )
+        self.app = dash.Dash(
+            external_stylesheets=[dbc.themes.MINTY],
+            background_callback_manager=self.callback_manager,
+            # gzip the responses when flask-compress (dash[compress]) is installed
+            compress=COMPRESSION_AVAILABLE,
+        )
         self.setup_layout()
         self.register_callbacks()
 
@@ -238,6 +311,24 @@ class RobotArmDesignApp:
                             color="primary",
                             style={"width": "80%"},
                         ),
+                        html.Div(style={"height": "10px"}),
+                        dbc.Button(
+                            "Cancel Analysis",
+                            id="cancel_button",
+                            color="secondary",
+                            disabled=True,
+                            style={"width": "80%"},
+                        ),
+                        html.Div(style={"height": "10px"}),
+                        dbc.Progress(
+                            id="workspace_progress",
+                            value=0,
+                            striped=True,
+                            style={"width": "80%"},
+                        ),
+                        html.Div(
+                            id="workspace_status", style={"margin-top": "5px"}
+                        ),
                     ]
                 ),
             ],
@@ -259,17 +350,25 @@ class RobotArmDesignApp:
 
     def _create_visualization_panel(self):
         """Create the middle visualization panel."""
+        graph = dcc.Graph(
+            id="main_display",
+            style={"height": "75vh"},
+        )
         return dbc.Col(
             [
                 html.H5("Visualization"),
-                dbc.Spinner(
-                    dcc.Graph(
-                        id="main_display",
-                        style={"height": "75vh"},
-                    ),
-                    color="primary",
-                ),
+                html.Div(id="workspace_stream_status"),
+                # A spinner would hide the points streamed during an analysis
+                graph
+                if self.point_stream is not None
+                else dbc.Spinner(graph, color="primary"),
+                html.Div(id="pose_sliders", style={"margin-top": "10px"}),
                 html.Div(id="output", style={"margin-top": "20px"}),
+                dcc.Store(id="robot_dh_table"),
+                dcc.Store(id="workspace_stream_id"),
+                dcc.Interval(
+                    id="workspace_stream_interval", interval=250, disabled=True
+                ),
             ],
             width=6,
         )
@@ -296,6 +395,10 @@ class RobotArmDesignApp:
         self._register_robot_info_callback()
         self._register_collapse_callbacks()
         self._register_visualization_callback()
+        self._register_pose_callbacks()
+        self._register_workspace_callback()
+        if self.point_stream is not None:
+            self._register_stream_callback()
 
     def _register_robot_info_callback(self):
         """Register the callback for updating robot information."""
@@ -348,7 +451,6 @@ class RobotArmDesignApp:
                 Output("results_table", "children"),
             ],
             Input("generate_button", "n_clicks"),
-            Input("workspace_button", "n_clicks"),
             State("robot_selection", "value"),
             State("link_lengths", "value"),
             State("alpha", "value"),
@@ -363,7 +465,6 @@ class RobotArmDesignApp:
         )
         def update_visualization(
             generate_clicks,
-            workspace_clicks,
             robot_selection,
             link_lengths,
             alpha,
@@ -378,7 +479,7 @@ class RobotArmDesignApp:
         ):
             return VisualizationManager.update_visualization(
                 generate_clicks,
-                workspace_clicks,
+                None,
                 robot_selection,
                 link_lengths,
                 alpha,
@@ -392,6 +493,170 @@ class RobotArmDesignApp:
                 is_normalized_value,
             )
 
+    def _register_pose_callbacks(self):
+        """
+        Register the joint sliders.
+
+        The server sends the DH table and the sliders of the robot once per Generate or
+        Workspace Analysis click; moving a slider then poses the robot in the browser.
+        """
+
+        @self.app.callback(
+            Output("robot_dh_table", "data"),
+            Output("pose_sliders", "children"),
+            Input("generate_button", "n_clicks"),
+            Input("workspace_button", "n_clicks"),
+            State("robot_selection", "value"),
+            State("link_lengths", "value"),
+            State("alpha", "value"),
+            State("qs", "value"),
+            State("commercial_qs", "value"),
+            prevent_initial_call=True,
+        )
+        def update_pose_controls(generate_clicks, workspace_clicks, *values):
+            return VisualizationManager.update_pose_controls(*values)
+
+        self.app.clientside_callback(
+            POSE_CALLBACK_JS,
+            Output("main_display", "figure", allow_duplicate=True),
+            Input({"type": "joint_slider", "index": ALL}, "value"),
+            State("robot_dh_table", "data"),
+            State("main_display", "figure"),
+            prevent_initial_call=True,
+        )
+
+    def _register_workspace_callback(self):
+        """
+        Register the workspace analysis callback.
+
+        With a background callback manager the analysis runs in a job process: it reports
+        the number of samples and the current global indice, is cancelled by the Cancel
+        button or by any change of the robot or method inputs, and waits for a free slot
+        when max_jobs analyses are already running.
+
+        A click first stores a new stream key, whose change starts the analysis; the
+        batches of the analysis are streamed under that key in progressive mode.
+        """
+        job_slots = self.job_slots
+        workspace_cache = self.workspace_cache
+        point_stream = self.point_stream
+        start_outputs = [Output("workspace_stream_id", "data")]
+        if self.callback_manager is None:
+            # Without running outputs, the interval is enabled here and disabled by the analysis
+            start_outputs.append(
+                Output("workspace_stream_interval", "disabled", allow_duplicate=True)
+            )
+
+        @self.app.callback(
+            start_outputs,
+            Input("workspace_button", "n_clicks"),
+            prevent_initial_call=True,
+        )
+        def start_workspace_analysis(workspace_clicks):
+            stream_key = uuid.uuid4().hex
+            if self.callback_manager is None:
+                return stream_key, point_stream is None
+            return [stream_key]
+
+        outputs = [
+            Output("main_display", "figure", allow_duplicate=True),
+            Output("output", "children", allow_duplicate=True),
+            Output("results_table", "children", allow_duplicate=True),
+        ]
+        states = [
+            State("robot_selection", "value"),
+            State("link_lengths", "value"),
+            State("alpha", "value"),
+            State("qs", "value"),
+            State("commercial_qs", "value"),
+            State("initial_samples", "value"),
+            State("batch_ratio", "value"),
+            State("error_tolerance", "value"),
+            State("method_dropdown", "value"),
+            State("axes_dropdown", "value"),
+            State("ws_normalization_slider", "value"),
+        ]
+
+        if self.callback_manager is None:
+
+            @self.app.callback(
+                outputs
+                + [
+                    Output(
+                        "workspace_stream_interval", "disabled", allow_duplicate=True
+                    )
+                ],
+                Input("workspace_stream_id", "data"),
+                *states,
+                prevent_initial_call=True,
+            )
+            def run_workspace_analysis(stream_key, *values):
+                result = VisualizationManager.update_visualization(
+                    None,
+                    None,
+                    *values,
+                    job_slots=job_slots,
+                    workspace_cache=workspace_cache,
+                    point_stream=point_stream,
+                    stream_key=stream_key,
+                    button_id="workspace_button",
+                )
+                return (*result, True)
+
+            return
+
+        running = [
+            (Output("workspace_button", "disabled"), True, False),
+            (Output("cancel_button", "disabled"), False, True),
+            (Output("workspace_progress", "animated"), True, False),
+        ]
+        if point_stream is not None:
+            running.append(
+                (Output("workspace_stream_interval", "disabled"), False, True)
+            )
+
+        @self.app.callback(
+            outputs,
+            Input("workspace_stream_id", "data"),
+            *states,
+            background=True,
+            progress=[
+                Output("workspace_progress", "value"),
+                Output("workspace_status", "children"),
+            ],
+            running=running,
+            cancel=[Input("cancel_button", "n_clicks")]
+            + [Input(component_id, "value") for component_id in WORKSPACE_INPUT_IDS],
+            prevent_initial_call=True,
+        )
+        def run_workspace_analysis(set_progress, stream_key, *values):
+            return VisualizationManager.update_visualization(
+                None,
+                None,
+                *values,
+                set_progress=set_progress,
+                job_slots=job_slots,
+                workspace_cache=workspace_cache,
+                point_stream=point_stream,
+                stream_key=stream_key,
+                button_id="workspace_button",
+            )
+
+    def _register_stream_callback(self):
+        """Register the callback appending the streamed workspace points to the figure."""
+        point_stream = self.point_stream
+
+        @self.app.callback(
+            Output("main_display", "figure", allow_duplicate=True),
+            Output("main_display", "extendData"),
+            Output("workspace_stream_status", "children"),
+            Input("workspace_stream_interval", "n_intervals"),
+            State("workspace_stream_id", "data"),
+            prevent_initial_call=True,
+        )
+        def stream_workspace_points(n_intervals, stream_key):
+            return VisualizationManager.drain_stream(point_stream, stream_key)
+
     def run_server(self, debug=False, *args, **kwargs):
         """Run the Dash server."""
         self.app.run(debug=debug, use_reloader=False, *args, **kwargs)
@@ -400,8 +665,29 @@ class RobotArmDesignApp:
 class RobotHelper:
     """Helper class for robot-related functions."""
 
+    @staticmethod
+    def robot_key(robot_selection, link_lengths=None, alpha=None):
+        """Hashable key identifying a robot by its selection and parameters."""
+        return (
+            robot_selection,
+            None if link_lengths is None else tuple(link_lengths),
+            None if alpha is None else tuple(alpha),
+        )
+
     @staticmethod
     def get_robot(robot_selection, link_lengths=None, alpha=None):
+        """
+        Get the robot for the selection, constructing it only on the first request.
+
+        The robots are shared between concurrent callbacks and must not be modified;
+        drawing them with PlotlyRobot.plotly keeps the frames in local variables.
+        """
+        return _build_robot(
+            *RobotHelper.robot_key(robot_selection, link_lengths, alpha)
+        )
+
+    @staticmethod
+    def create_robot(robot_selection, link_lengths=None, alpha=None):
         """Initialize the robot based on selection."""
         # Commercial robots
         if robot_selection == "panda":
@@ -487,6 +773,11 @@ class RobotHelper:
             )
 
 
+@lru_cache(maxsize=32)
+def _build_robot(robot_selection, link_lengths, alpha):
+    return RobotHelper.create_robot(robot_selection, link_lengths, alpha)
+
+
 class VisualizationManager:
     """Manager class for robot visualization and analysis."""
 
@@ -505,13 +796,25 @@ class VisualizationManager:
         method,
         axes,
         is_normalized_value,
+        set_progress=None,
+        job_slots=None,
+        workspace_cache=None,
+        point_stream=None,
+        stream_key=None,
+        button_id=None,
     ):
-        """Update visualization based on user inputs."""
+        """
+        Update visualization based on user inputs.
+
+        :param set_progress: callable, optional, receives (percent, status) during a workspace analysis.
+        :param job_slots: JobSlots, optional, the cap on concurrent workspace analyses.
+        :param workspace_cache: WorkSpaceCache, optional, the sampled workspaces to reuse.
+        :param point_stream: PointStream, optional, receives the sampled batches under stream_key.
+        :param button_id: str, optional, the button to handle, the trigger of the callback if None.
+        """
         ctx = dash.callback_context
 
-        if not ctx.triggered:
-            button_id = None
-        else:
+        if button_id is None and ctx.triggered:
             button_id = ctx.triggered[0]["prop_id"].split(".")[0]
 
         # Initialize empty figure and default message
@@ -566,6 +869,14 @@ class VisualizationManager:
                     method,
                     axes,
                     params["is_normalized"],
+                    set_progress=set_progress,
+                    job_slots=job_slots,
+                    workspace_cache=workspace_cache,
+                    cache_key=RobotHelper.robot_key(
+                        robot_selection, params["link_lengths"], params["alpha"]
+                    ),
+                    point_stream=point_stream,
+                    stream_key=stream_key,
                 )
 
         except Exception as e:
@@ -649,10 +960,11 @@ class VisualizationManager:
     def _handle_generate_button(robot, qs, robot_name, robot_metrics):
         """Handle the Generate Robot Arm button click."""
         fig = go.Figure()
-        robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True)
+        robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True, compact=True)
 
         # Update figure layout
         fig.update_layout(
+            uirevision="robot_pose",
             scene=dict(
                 xaxis=dict(title="X", range=[-2, 2]),
                 yaxis=dict(title="Y", range=[-2, 2]),
@@ -661,7 +973,7 @@ class VisualizationManager:
             margin=dict(l=0, r=0, b=0, t=30),
         )
 
-        message = f"Generated {robot_name}."
+        message = f"Generated {robot_name}. {describe_payload(fig)}"
 
         # Create the results table
         if robot_metrics["total_length"] == "N/A":
@@ -697,6 +1009,108 @@ class VisualizationManager:
 
         return fig, message, results_table
 
+    @staticmethod
+    def update_pose_controls(
+        robot_selection, link_lengths, alpha, generic_qs, commercial_qs
+    ):
+        """
+        DH table and joint sliders of the selected robot, for client-side posing.
+
+        :return: the table for POSE_CALLBACK_JS and the slider components, or None and
+            no sliders if the inputs do not describe a robot.
+        """
+        try:
+            params = VisualizationManager._prepare_params(
+                robot_selection,
+                link_lengths,
+                alpha,
+                generic_qs,
+                commercial_qs,
+                None,
+                None,
+                None,
+                0,
+            )
+            robot = RobotHelper.get_robot(
+                robot_selection, params["link_lengths"], params["alpha"]
+            )
+            table = dh_table(robot)
+            sliders = VisualizationManager._create_pose_sliders(robot, params["qs"])
+        except Exception:
+            return None, []
+        return table, sliders
+
+    @staticmethod
+    def _create_pose_sliders(robot, qs):
+        """Create one slider per joint, in deg for revolute and m for prismatic joints."""
+        if len(qs) != robot.n:
+            raise ValueError(f"Expected {robot.n} joint values, got {len(qs)}")
+        sliders = [html.P("Pose [deg]:")]
+        for j, link in enumerate(robot.links):
+            low, high = robot.qlim[:, j]
+            if not link.sigma:
+                low, high = np.rad2deg([low, high])
+            sliders.append(
+                html.Div(
+                    [
+                        html.Span(f"q{j + 1}"),
+                        dcc.Slider(
+                            id={"type": "joint_slider", "index": j},
+                            min=float(low),
+                            max=float(high),
+                            value=float(np.clip(qs[j], low, high)),
+                            marks=None,
+                            tooltip={"placement": "bottom"},
+                            updatemode="drag",
+                        ),
+                    ]
+                )
+            )
+        return sliders
+
+    @staticmethod
+    def _update_workspace_layout(fig):
+        """Apply the layout of the workspace analysis figure."""
+        fig.update_layout(
+            showlegend=False,
+            uirevision="robot_pose",
+            scene=dict(
+                xaxis=dict(title="X", range=[-2, 2]),
+                yaxis=dict(title="Y", range=[-2, 2]),
+                zaxis=dict(title="Z", range=[-2, 2]),
+            ),
+            margin=dict(l=0, r=0, b=0, t=30),
+        )
+
+    @staticmethod
+    def drain_stream(point_stream, stream_key):
+        """
+        Figure updates for the batches streamed since the last call.
+
+        :return: the figure (on the first call of a stream), the extendData of the points
+            trace and the status, dash.no_update for what did not change.
+        """
+        update = point_stream.drain(stream_key) if stream_key else None
+        if update is None:
+            return dash.no_update, dash.no_update, dash.no_update
+        points = update["points"][-WORKSPACE_PLOT_POINTS:]
+        values = update["values"][-WORKSPACE_PLOT_POINTS:]
+        if update["figure"] is not None:
+            # First paint: the figure with the batches sampled so far
+            figure = update["figure"]
+            trace = figure["data"][update["trace_index"]]
+            points = typed_array(points)
+            trace.update(x=points[:, 0], y=points[:, 1], z=points[:, 2])
+            trace["marker"]["color"] = typed_array(values)
+            return figure, dash.no_update, update["status"]
+        if len(points) == 0:
+            return dash.no_update, dash.no_update, update["status"]
+        return (
+            dash.no_update,
+            extend_data(points, values, update["trace_index"], WORKSPACE_PLOT_POINTS),
+            update["status"],
+        )
+
     @staticmethod
     def _handle_workspace_button(
         robot,
@@ -709,23 +1123,98 @@ class VisualizationManager:
         method,
         axes,
         is_normalized,
+        set_progress=None,
+        job_slots=None,
+        workspace_cache=None,
+        cache_key=None,
+        point_stream=None,
+        stream_key=None,
     ):
-        """Handle the Workspace Analysis button click."""
+        """
+        Handle the Workspace Analysis button click.
+
+        The samples of an analysis are cached under cache_key; a later analysis of the same
+        robot with the same sampling settings re-aggregates them for the selected method,
+        axes and normalization instead of sampling again. With a point_stream, each batch
+        is pushed under stream_key as soon as it is sampled.
+        """
         fig = go.Figure()
-        robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True)
-
-        # Perform workspace analysis
-        ws = WorkSpace(robot)
-        G = ws.global_indice(
-            initial_samples=initial_samples,
-            batch_ratio=batch_ratio,
-            error_tolerance_percentage=error_tolerance,
-            method=method,
-            axes=axes,
-            max_samples=50000,
-            is_normalized=is_normalized,
-        )
-        ws.plot(color=method, fig=fig, isShow=False)
+        robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True, compact=True)
+
+        streaming = point_stream is not None and stream_key is not None
+        if streaming:
+            stream_fig = go.Figure(fig)
+            stream_fig.add_trace(stream_trace(method))
+            VisualizationManager._update_workspace_layout(stream_fig)
+            point_stream.open(stream_key, stream_fig.to_plotly_json(), len(fig.data))
+        num_streamed = [0]
+
+        def report_progress(num_samples, G):
+            status = f"{num_samples} samples, G = {G:.6f}"
+            if set_progress is not None:
+                set_progress(
+                    (100 * min(num_samples / WORKSPACE_MAX_SAMPLES, 1.0), status)
+                )
+            if streaming:
+                batch = ws.df.iloc[num_streamed[0] : num_samples].tail(
+                    WORKSPACE_PLOT_POINTS
+                )
+                point_stream.push(
+                    stream_key,
+                    batch[["x", "y", "z"]].to_numpy(dtype=float),
+                    batch[method].to_numpy(dtype=float),
+                    status,
+                )
+                num_streamed[0] = num_samples
+
+        def report_waiting():
+            if set_progress is not None:
+                set_progress((0, "Waiting for a running analysis to finish..."))
+
+        try:
+            settings = (initial_samples, batch_ratio, error_tolerance)
+            samples = None
+            if workspace_cache is not None and method in SINGULAR_VALUE_INDICES:
+                samples = workspace_cache.get(cache_key)
+                if samples is not None and samples.settings != settings:
+                    samples = None
+
+            if samples is not None:
+                # Re-aggregate the cached samples
+                ws = samples.to_workspace(robot, method, axes)
+                G = ws._calc_global_indice(method=method, is_normalized=is_normalized)
+                report_progress(len(samples), G)
+            else:
+                # Perform workspace analysis
+                if workspace_cache is not None and method in SINGULAR_VALUE_INDICES:
+                    samples = WorkSpaceSamples(settings)
+                    ws = RecordingWorkSpace(robot, samples)
+                else:
+                    ws = WorkSpace(robot)
+                slot = (
+                    job_slots.slot(on_wait=report_waiting)
+                    if job_slots
+                    else nullcontext()
+                )
+                with slot:
+                    G = ws.global_indice(
+                        initial_samples=initial_samples,
+                        batch_ratio=batch_ratio,
+                        error_tolerance_percentage=error_tolerance,
+                        method=method,
+                        axes=axes,
+                        max_samples=WORKSPACE_MAX_SAMPLES,
+                        is_normalized=is_normalized,
+                        progress_callback=report_progress,
+                    )
+                if samples is not None:
+                    workspace_cache.put(cache_key, samples)
+            ws.plot(
+                color=method, fig=fig, isShow=False, max_points=WORKSPACE_PLOT_POINTS
+            )
+        finally:
+            if streaming:
+                point_stream.close(stream_key)
 
         # Get reach data
         reach = ws.reach(axes="all")
@@ -736,15 +1225,7 @@ class VisualizationManager:
         text_reach_y = f"[{reach_y[0]:.3f}, {reach_y[1]:.3f}]"
         text_reach_z = f"[{reach_z[0]:.3f}, {reach_z[1]:.3f}]"
 
-        fig.update_layout(
-            showlegend=False,
-            scene=dict(
-                xaxis=dict(title="X", range=[-2, 2]),
-                yaxis=dict(title="Y", range=[-2, 2]),
-                zaxis=dict(title="Z", range=[-2, 2]),
-            ),
-            margin=dict(l=0, r=0, b=0, t=30),
-        )
+        VisualizationManager._update_workspace_layout(fig)
 
         # Create descriptive message
         axes_desc = (
@@ -759,7 +1240,8 @@ class VisualizationManager:
             f"• Initial samples: {initial_samples}\n"
             f"• Batch ratio: {batch_ratio}\n"
             f"• Error tolerance: {error_tolerance}\n"
-            f"• Normalization: {is_normalized}"
+            f"• Normalization: {is_normalized}\n"
+            f"{describe_payload(fig)}"
         )
 
         # Format total length text
@@ -526,7 +526,7 @@ def update_visualization(
         # Plot the robot arm
         if button_id == "generate_button":
             fig = go.Figure()
-            robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True)
+            robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True, compact=True)
             message = f"Generated {robot_name}."
 
             results_table = dbc.Table(
@@ -557,7 +557,7 @@ def update_visualization(
 
         elif button_id == "workspace_button":
             fig = go.Figure()
-            robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True)
+            robot.plotly(np.deg2rad(qs), isShow=False, fig=fig, isUpdate=True, compact=True)
 
             ws = WorkSpace(robot)
             G = ws.global_indice(
@@ -569,7 +569,7 @@ def update_visualization(
                 max_samples=50000,
                 is_normalized=is_normalized,  # Use the slider value here
             )
-            ws.plot(color=method, fig=fig, isShow=False)
+            ws.plot(color=method, fig=fig, isShow=False, max_points=20000)
 
             # Get reach for all axes
             reach = ws.reach(axes="all")
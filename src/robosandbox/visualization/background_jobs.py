@@ -0,0 +1,157 @@
+"""
+Background execution of long-running Dash callbacks (workspace analysis).
+
+With the optional dependencies of dash[diskcache] (diskcache, multiprocess and psutil)
+installed, jobs run in worker processes managed by a dash.DiskcacheManager, report
+progress to the page and can be cancelled. Without them the apps fall back to regular,
+blocking callbacks.
+"""
+
+import getpass
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import dash
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+def _user_name():
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return re.sub(r"[^\w.-]", "_", user)
+
+
+def default_cache_dir(app_name="robosandbox"):
+    """
+    Job cache directory of an app, one per app and user in the temporary directory.
+    :param app_name: str, the name of the app.
+    :return: str
+    """
+    return os.path.join(
+        tempfile.gettempdir(), f"robosandbox_jobs_{app_name}_{_user_name()}"
+    )
+
+
+def create_job_cache(cache_dir=None, app_name="robosandbox"):
+    """
+    Local cache shared by the server and its job processes.
+
+    Servers sharing the cache directory share its job slots and sampled workspaces, so
+    pass a cache_dir to run several servers of the same app independently.
+    :param cache_dir: str, optional, the cache directory (default: default_cache_dir(app_name)).
+    :param app_name: str, the name of the app in the default cache directory.
+    :return: diskcache.Cache, or None if diskcache is not installed.
+    """
+    if diskcache is None:
+        return None
+    if cache_dir is None:
+        cache_dir = default_cache_dir(app_name)
+    return diskcache.Cache(cache_dir)
+
+
+def create_callback_manager(cache):
+    """
+    Background callback manager running each job in its own process.
+    :param cache: diskcache.Cache from create_job_cache, or None.
+    :return: dash.DiskcacheManager, or None if the background dependencies are missing.
+    """
+    if cache is None:
+        return None
+    try:
+        return dash.DiskcacheManager(cache)
+    except ImportError:
+        return None
+
+
+def _process_alive(pid):
+    import psutil
+
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+class JobSlots:
+    """
+    Cap on the number of jobs running at the same time on one server.
+
+    With a diskcache.Cache, the slots are cache keys shared by all job processes; a slot
+    still held by a dead process (e.g. a job killed on cancellation) is reclaimed.
+    Without a cache, the slots are a semaphore shared by the server threads.
+    """
+
+    def __init__(self, cache=None, max_jobs=2, name="workspace_job", poll_interval=0.5):
+        """
+        :param cache: diskcache.Cache, optional, the cache shared with the job processes.
+        :param max_jobs: int, the maximum number of concurrent jobs.
+        :param name: str, the prefix of the slot keys in the cache.
+        :param poll_interval: float, the time between two attempts to get a slot in seconds.
+        """
+        if max_jobs < 1:
+            raise ValueError(f"max_jobs must be at least 1, got {max_jobs}")
+        self.cache = cache
+        self.max_jobs = max_jobs
+        self.name = name
+        self.poll_interval = poll_interval
+        self._semaphore = threading.BoundedSemaphore(max_jobs)
+
+    def __getstate__(self):
+        # Job processes receive the slots with the callback; threading objects do not pickle
+        state = self.__dict__.copy()
+        del state["_semaphore"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._semaphore = threading.BoundedSemaphore(self.max_jobs)
+
+    def _try_acquire(self):
+        for index in range(self.max_jobs):
+            key = f"{self.name}_slot_{index}"
+            if self.cache.add(key, os.getpid()):
+                return key
+            holder = self.cache.get(key)
+            if holder is not None and not _process_alive(holder):
+                self.cache.delete(key)
+                if self.cache.add(key, os.getpid()):
+                    return key
+        return None
+
+    @contextmanager
+    def slot(self, on_wait=None):
+        """
+        Hold a slot for the duration of the with block, waiting for one if all are taken.
+        :param on_wait: callable, optional, called once if the job has to wait.
+        """
+        if self.cache is None:
+            if not self._semaphore.acquire(blocking=False):
+                if on_wait is not None:
+                    on_wait()
+                self._semaphore.acquire()
+            try:
+                yield
+            finally:
+                self._semaphore.release()
+            return
+
+        key = self._try_acquire()
+        if key is None and on_wait is not None:
+            on_wait()
+        while key is None:
+            time.sleep(self.poll_interval)
+            key = self._try_acquire()
+        try:
+            yield
+        finally:
+            self.cache.delete(key)
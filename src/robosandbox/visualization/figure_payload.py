@@ -0,0 +1,69 @@
+"""
+Size of the figures sent by the Dash apps.
+
+Plotly serializes numpy arrays as base64 typed arrays ("bdata") instead of JSON number
+lists; float32 arrays take 4 bytes per value against about 20 characters per value in
+text. With flask-compress installed (dash[compress]), responses are also gzipped.
+"""
+
+import gzip
+
+import numpy as np
+from plotly.io.json import to_json_plotly
+
+try:
+    import flask_compress  # noqa: F401
+
+    COMPRESSION_AVAILABLE = True
+except ImportError:
+    COMPRESSION_AVAILABLE = False
+
+
+def typed_array(values, dtype=np.float32):
+    """
+    Array sent as a base64 typed array, float32 by default.
+    :param values: array-like, None entries become NaN.
+    :param dtype: numpy dtype of the array.
+    :return: np.ndarray
+    """
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def typed_trace_data(trace_data, dtype=np.float32):
+    """
+    Trace data with every array converted by typed_array, scalars unchanged.
+    :param trace_data: dict of trace properties.
+    :return: dict
+    """
+    return {
+        key: typed_array(value, dtype) if np.ndim(value) > 0 else value
+        for key, value in trace_data.items()
+    }
+
+
+def payload_size(fig, compressed=False):
+    """
+    Size of a figure as the apps send it.
+    :param fig: go.Figure or figure dict, or its serialized JSON as bytes.
+    :param compressed: bool, the size after gzip compression if True.
+    :return: int, the size in bytes.
+    """
+    payload = fig if isinstance(fig, bytes) else to_json_plotly(fig).encode()
+    if compressed:
+        return len(gzip.compress(payload, compresslevel=6))
+    return len(payload)
+
+
+def describe_payload(fig, compressed=False):
+    """
+    Payload size of a figure for status messages.
+    :param fig: go.Figure or figure dict.
+    :param compressed: bool, also show the gzipped size; gzip is only run in that case.
+    :return: str
+    """
+    payload = to_json_plotly(fig).encode()
+    message = f"Figure payload: {payload_size(payload) / 1024:.0f} kB"
+    if compressed:
+        compressed_size = payload_size(payload, compressed=True)
+        message += f" ({compressed_size / 1024:.0f} kB gzipped)"
+    return message + "."
@@ -0,0 +1,107 @@
+"""
+Bulk export of (points, faces) meshes to STL, PLY and OBJ files.
+
+Meshes use the standard format of geometry/mesh_utilities.py: `points` is a Nx3 array and
+`faces` a Mx3 (triangles) or Mx4 (quads) array of indices into `points`.
+"""
+
+import io
+import os
+import numpy as np
+from stl import mesh
+
+
+def triangulate(faces):
+    """
+    Split quads into two triangles, like Figure3D.add_quad. Triangles are returned as is.
+    :param faces: Mx3 or Mx4 array of indices.
+    :return: Kx3 array of triangles.
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    if faces.ndim != 2 or faces.shape[1] not in (3, 4):
+        raise ValueError("'faces' must be a Mx3 or Mx4 array!")
+    if faces.shape[1] == 4:
+        return np.concatenate((faces[:, [0, 1, 2]], faces[:, [0, 2, 3]]))
+    return faces
+
+
+def save_stl(points, faces, save_path):
+    """
+    Save a mesh as a binary STL file. Quads are split into triangles.
+    :param points: Nx3 array of vertices.
+    :param faces: Mx3 or Mx4 array of indices into points.
+    :param save_path: path of the file to write.
+    """
+    triangles = triangulate(faces)
+    stl_mesh = mesh.Mesh(np.zeros(len(triangles), dtype=mesh.Mesh.dtype))
+    stl_mesh.vectors[:] = np.asarray(points, dtype=float)[triangles]
+    stl_mesh.save(save_path)
+
+
+def save_ply(points, faces, save_path, intensity=None):
+    """
+    Save a mesh as a binary little-endian PLY file. Quads are kept as quads.
+    :param points: Nx3 array of vertices.
+    :param faces: Mx3 or Mx4 array of indices into points.
+    :param save_path: path of the file to write.
+    :param intensity: optional array of N values stored as a float vertex property.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.int64)
+    vertex_fields = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
+    if intensity is not None:
+        vertex_fields.append(("intensity", "<f4"))
+    vertex_data = np.zeros(len(points), dtype=vertex_fields)
+    vertex_data["x"], vertex_data["y"], vertex_data["z"] = points.T
+    if intensity is not None:
+        vertex_data["intensity"] = intensity
+    face_data = np.zeros(len(faces), dtype=[("n", "u1"), ("v", "<i4", (faces.shape[1],))])
+    face_data["n"] = faces.shape[1]
+    face_data["v"] = faces
+
+    header = ["ply", "format binary_little_endian 1.0", f"element vertex {len(vertex_data)}"]
+    header += [f"property float {name}" for name, _ in vertex_fields]
+    header += [
+        f"element face {len(face_data)}",
+        "property list uchar int vertex_indices",
+        "end_header",
+    ]
+    with open(save_path, "wb") as f:
+        f.write(("\n".join(header) + "\n").encode("ascii"))
+        f.write(vertex_data.tobytes())
+        f.write(face_data.tobytes())
+
+
+def save_obj(points, faces, save_path):
+    """
+    Save a mesh as a Wavefront OBJ file. Quads are kept as quads.
+    :param points: Nx3 array of vertices.
+    :param faces: Mx3 or Mx4 array of indices into points.
+    :param save_path: path of the file to write.
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    buffer = io.StringIO()
+    np.savetxt(buffer, np.asarray(points, dtype=float).reshape(-1, 3), fmt="v %.9g %.9g %.9g")
+    # OBJ indices start at 1
+    np.savetxt(buffer, faces + 1, fmt="f" + " %d" * faces.shape[1])
+    with open(save_path, "w") as f:
+        f.write(buffer.getvalue())
+
+
+def export_mesh(points, faces, save_path, intensity=None):
+    """
+    Save a mesh, choosing the format from the file extension (.stl, .ply or .obj).
+    :param points: Nx3 array of vertices.
+    :param faces: Mx3 or Mx4 array of indices into points.
+    :param save_path: path of the file to write.
+    :param intensity: optional array of N values, only stored in PLY files.
+    """
+    extension = os.path.splitext(str(save_path))[1].lower()
+    if extension == ".stl":
+        save_stl(points, faces, save_path)
+    elif extension == ".ply":
+        save_ply(points, faces, save_path, intensity=intensity)
+    elif extension == ".obj":
+        save_obj(points, faces, save_path)
+    else:
+        raise ValueError(f"Unknown mesh file format: '{extension}', use .stl, .ply or .obj")
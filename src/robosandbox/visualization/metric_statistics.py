@@ -0,0 +1,83 @@
+"""
+Summaries of a workspace metric for distribution plots, computed with NumPy only.
+
+Every function takes either one array of values or an iterable of arrays (chunks), so
+multi-million-sample workspaces can be summarized batch by batch without building a
+single large array or touching the workspace DataFrame.
+"""
+
+import numpy as np
+
+
+def iter_chunks(samples):
+    """
+    Iterate over samples as 1D float arrays, lazily for iterables of chunks.
+    :param samples: array-like of values, or an iterable of array-likes (chunks).
+    :return: generator of np.ndarray.
+    """
+    if hasattr(samples, "__array__") or (
+        isinstance(samples, (list, tuple)) and all(np.isscalar(v) for v in samples)
+    ):
+        yield np.asarray(samples, dtype=float).ravel()
+        return
+    for chunk in samples:
+        yield np.asarray(chunk, dtype=float).ravel()
+
+
+def finite_range(samples):
+    """
+    Range of the finite values.
+    :param samples: array-like of values, or an iterable of chunks.
+    :return: (min, max), or (nan, nan) if there are no finite values.
+    """
+    low, high = np.inf, -np.inf
+    for chunk in iter_chunks(samples):
+        chunk = chunk[np.isfinite(chunk)]
+        if len(chunk) > 0:
+            low, high = min(low, chunk.min()), max(high, chunk.max())
+    if low > high:
+        return np.nan, np.nan
+    return low, high
+
+
+def histogram(samples, num_bins=7, value_range=None):
+    """
+    Counts of the finite values in equal-width bins.
+
+    Without value_range the samples are read twice (range, then counts); pass it to
+    stream a generator of chunks in a single pass.
+
+    :param samples: array-like of values, or an iterable of chunks.
+    :param num_bins: int, the number of bins.
+    :param value_range: optional (min, max) of the bins, the range of the values if None.
+    :return: counts (num_bins,) and bin edges (num_bins + 1,).
+    """
+    if value_range is None:
+        samples = list(iter_chunks(samples))
+        value_range = finite_range(samples)
+        if np.isnan(value_range[0]):
+            value_range = (0.0, 1.0)
+    edges = np.histogram_bin_edges([], bins=num_bins, range=value_range)
+    counts = np.zeros(num_bins, dtype=np.int64)
+    for chunk in iter_chunks(samples):
+        counts += np.histogram(chunk[np.isfinite(chunk)], bins=edges)[0]
+    return counts, edges
+
+
+def threshold_counts(samples, thresholds):
+    """
+    Number of values whose magnitude is below each threshold, for all thresholds at once.
+    :param samples: array-like of values, or an iterable of chunks.
+    :param thresholds: array-like of thresholds.
+    :return: counts (len(thresholds),) in the order of sorted thresholds, and the total number of values.
+    """
+    thresholds = np.sort(np.asarray(thresholds, dtype=float))
+    below = np.zeros(len(thresholds) + 1, dtype=np.int64)
+    total = 0
+    for chunk in iter_chunks(samples):
+        # Number of thresholds <= |value|: the value is below thresholds[j] iff this is <= j
+        # (NaN sorts after every threshold and is never counted)
+        position = np.searchsorted(thresholds, np.abs(chunk), side="right")
+        below += np.bincount(position, minlength=len(thresholds) + 1)
+        total += len(chunk)
+    return np.cumsum(below)[:-1], total
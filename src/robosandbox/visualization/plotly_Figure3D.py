@@ -1,6 +1,8 @@
 import plotly.graph_objects as go
 
 import numpy as np
+from robosandbox.visualization.figure_payload import typed_array
+from robosandbox.visualization.mesh_export import export_mesh
 
 
 def reflect_over_XZ_plane(input_vector):
@@ -49,6 +51,10 @@ class Figure3D:
         self.y_streamline = []
         self.z_streamline = []
 
+        # Whole meshes and outlines added as arrays, concatenated once in draw()
+        self.mesh_blocks = []
+        self.line_blocks = []
+
     def add_line(
         self,
         points,
@@ -181,33 +187,120 @@ class Figure3D:
                 mirror=False,
             )
 
+    def add_faces(
+        self,
+        points,
+        faces,
+        intensity=None,
+        outline=False,
+        mirror=False,
+    ):
+        """
+        Adds a whole mesh to draw in one call. Vertices are shared between faces.
+        :param points: a (P, 3) array of vertices.
+        :param faces: a (F, 3) array of triangles or a (F, 4) array of quads, given as indices into points. Quads are split into two triangles like in add_quad.
+        :param intensity: Intensity associated with the mesh, either a scalar or one value per point. If None, the mesh is not colored by intensity; it counts as 0 when mixed with intensity-colored faces.
+        :param outline: Do you want to outline every face? [boolean]
+        :param mirror: Should we also draw a version that's mirrored over the XZ plane? [boolean]
+        :return: None
+
+        E.g. add_faces(points, faces) with points from CylinderLink.get_outer_mesh()
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.int64)
+        if faces.ndim != 2 or faces.shape[1] not in (3, 4):
+            raise ValueError("'faces' must be a Fx3 or Fx4 array!")
+        if intensity is not None:
+            intensity = np.broadcast_to(np.asarray(intensity, dtype=float), (len(points),))
+
+        if faces.shape[1] == 4:
+            triangles = np.concatenate((faces[:, [0, 1, 2]], faces[:, [0, 2, 3]]))
+        else:
+            triangles = faces
+        self.mesh_blocks.append((points, triangles, intensity))
+
+        if outline:
+            # Closed polygon per face, separated by a NaN row
+            loops = points[np.concatenate((faces, faces[:, :1]), axis=1)]
+            gaps = np.full((len(faces), 1, 3), np.nan)
+            self.line_blocks.append(np.concatenate((loops, gaps), axis=1).reshape(-1, 3))
+        if mirror:
+            self.add_faces(
+                points=reflect_over_XZ_plane(points),
+                faces=faces,
+                intensity=intensity,
+                outline=outline,
+                mirror=False,
+            )
+
+    def _face_buffers(self):
+        points = [np.column_stack((self.x_face, self.y_face, self.z_face)).reshape(-1, 3)]
+        triangles = [
+            np.column_stack((self.i_face, self.j_face, self.k_face))
+            .reshape(-1, 3)
+            .astype(np.int64)
+        ]
+        intensity = [np.asarray(self.intensity_face, dtype=float)]
+        offset = len(points[0])
+        for block_points, block_triangles, block_intensity in self.mesh_blocks:
+            points.append(block_points)
+            triangles.append(block_triangles + offset)
+            if block_intensity is None:
+                block_intensity = np.zeros(len(block_points))
+            intensity.append(block_intensity)
+            offset += len(block_points)
+        # Without any intensity given, the mesh is drawn without a colorscale
+        colored = len(self.x_face) > 0 or any(
+            block[2] is not None for block in self.mesh_blocks
+        )
+        intensity = np.concatenate(intensity) if colored else None
+        return np.concatenate(points), np.concatenate(triangles), intensity
+
+    def _line_buffer(self):
+        # None separators of add_line become NaN, which plotly also draws as a gap
+        lines = np.array([self.x_line, self.y_line, self.z_line], dtype=float).T
+        return np.concatenate([lines.reshape(-1, 3)] + self.line_blocks)
+
+    def export_faces(self, save_path):
+        """
+        Saves all faces added so far as one mesh, e.g. the links of a whole robot.
+        :param save_path: path of the file to write, the format follows the extension (.stl, .ply or .obj).
+        :return: None
+        """
+        points, triangles, intensity = self._face_buffers()
+        export_mesh(points, triangles, save_path, intensity=intensity)
+
     def draw(
         self, show=True, title="", colorbar_title="", colorscale="viridis", opacity=0.5
     ):
-        # Draw faces
+        # Draw faces, sent as float32 and int32 typed arrays
+        points, triangles, intensity = self._face_buffers()
+        points = typed_array(points)
+        triangles = typed_array(triangles, dtype=np.int32)
         self.fig.add_trace(
             go.Mesh3d(
-                x=self.x_face,
-                y=self.y_face,
-                z=self.z_face,
-                i=self.i_face,
-                j=self.j_face,
-                k=self.k_face,
+                x=points[:, 0],
+                y=points[:, 1],
+                z=points[:, 2],
+                i=triangles[:, 0],
+                j=triangles[:, 1],
+                k=triangles[:, 2],
                 flatshading=False,
-                intensity=self.intensity_face,
+                intensity=None if intensity is None else typed_array(intensity),
                 opacity=opacity,
                 colorbar=dict(title=colorbar_title),
                 colorscale=colorscale,
-                showscale=colorbar_title is not None,
+                showscale=colorbar_title is not None and intensity is not None,
             ),
         )
 
         # Draw lines
+        lines = typed_array(self._line_buffer())
         self.fig.add_trace(
             go.Scatter3d(
-                x=self.x_line,
-                y=self.y_line,
-                z=self.z_line,
+                x=lines[:, 0],
+                y=lines[:, 1],
+                z=lines[:, 2],
                 mode="lines",
                 name="",
                 line=dict(color="rgb(0,0,0)", width=3),
@@ -218,9 +311,9 @@ class Figure3D:
         # Draw streamlines
         self.fig.add_trace(
             go.Scatter3d(
-                x=self.x_streamline,
-                y=self.y_streamline,
-                z=self.z_streamline,
+                x=typed_array(self.x_streamline),
+                y=typed_array(self.y_streamline),
+                z=typed_array(self.z_streamline),
                 mode="lines",
                 name="",
                 line=dict(color="rgba(119,0,255,200)", width=1),
@@ -1,6 +1,6 @@
 from robosandbox.visualization.plotly_Figure3D import Figure3D
 from robosandbox.geometry.mesh_utilities import stack_meshes
-from stl import mesh
+from robosandbox.visualization.mesh_export import export_mesh, save_stl
 import numpy as np
 
 
@@ -10,27 +10,8 @@ class Link3D(Figure3D):
         super().__init__()
 
     def add_mesh(self, points, faces, method, fig, outline=False):
-        if method == "tri":
-            for face in faces:
-                fig.add_tri(
-                    [
-                        points[face[0]],
-                        points[face[1]],
-                        points[face[2]],
-                    ],
-                    outline=outline,
-                )
-        if method == "quad":
-            for face in faces:
-                fig.add_quad(
-                    [
-                        points[face[0]],
-                        points[face[1]],
-                        points[face[2]],
-                        points[face[3]],
-                    ],
-                    outline=outline,
-                )
+        # method is kept for compatibility, the face width ("tri" Fx3 or "quad" Fx4) decides
+        fig.add_faces(points, faces, intensity=0, outline=outline)
         return fig
 
     # def plot(self, *args, **kwargs):
@@ -56,36 +37,46 @@ class Link3D(Figure3D):
         outline = kwargs.get("outline", False)
         method = kwargs.get("method", "tri")
         save_path = kwargs.get("save_path", None)
+        watertight = kwargs.get("watertight", False)
 
         fig = Figure3D()
-        # outer profile mesh
-        outer_points, outer_faces = self.get_outer_mesh(method=method)
-        inner_points, inner_faces = self.get_inner_mesh(method=method)
-        start_points, start_faces = self.get_side_mesh(method=method, side="start")
-        end_points, end_faces = self.get_side_mesh(method=method, side="end")
-        points, faces = stack_meshes(
-            (outer_points, outer_faces),
-            (inner_points, inner_faces),
-            (start_points, start_faces),
-            (end_points, end_faces),
-        )
-        print(f"len of points: {len(points)}")
-        print(f"len of faces: {len(faces)}")
-        print(points)
+        if watertight:
+            # single closed mesh, the face width follows method
+            points, faces = self.get_watertight_mesh(method=method)
+        else:
+            # outer profile mesh
+            outer_points, outer_faces = self.get_outer_mesh(method=method)
+            inner_points, inner_faces = self.get_inner_mesh(method=method)
+            start_points, start_faces = self.get_side_mesh(method=method, side="start")
+            end_points, end_faces = self.get_side_mesh(method=method, side="end")
+            points, faces = stack_meshes(
+                (outer_points, outer_faces),
+                (inner_points, inner_faces),
+                (start_points, start_faces),
+                (end_points, end_faces),
+            )
         fig = self.add_mesh(points, faces, method, fig, outline)
         if save_path is not None:
             self.get_stl_export(points, faces, save_path)
         return fig.draw()
 
     def get_stl_export(self, points, faces, save_path):
-        link_mesh = mesh.Mesh(np.zeros(faces.shape[0], dtype=mesh.Mesh.dtype))
-        for i, f in enumerate(faces):
-            for j in range(3):
-                link_mesh.vectors[i][j] = points[f[j], :]
-                # print(points[f[j], :])
-                # floatarrary = points[f[j], :].astype(float)
-                # print(points[f[j], :])
-                # print(floatarrary)
-                # print("+++++++++++")
-                # exit()
-        link_mesh.save(save_path)
+        save_stl(points, faces, save_path)
+
+    def export_mesh(self, save_path, method="tri", watertight=True):
+        """
+        Save the link mesh, the format follows the extension (.stl, .ply or .obj).
+        :param save_path: path of the file to write.
+        :param method: "tri" or "quad" faces (STL files always get triangles).
+        :param watertight: export the closed stitched mesh instead of the four separate surfaces.
+        """
+        if watertight:
+            points, faces = self.get_watertight_mesh(method=method)
+        else:
+            points, faces = stack_meshes(
+                self.get_outer_mesh(method=method),
+                self.get_inner_mesh(method=method),
+                self.get_side_mesh(method=method, side="start"),
+                self.get_side_mesh(method=method, side="end"),
+            )
+        export_mesh(points, faces, save_path)
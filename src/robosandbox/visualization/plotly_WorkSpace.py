@@ -1,7 +1,10 @@
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
+from robosandbox.visualization import metric_statistics, point_cloud_lod
+from robosandbox.visualization.voxel_data import VoxelData
+from robosandbox.visualization.workspace_envelope import WorkSpaceEnvelope
 # import plotly.express as px
-# import numpy as np
 
 
 class PlotlyWorkSpace:
@@ -16,17 +19,36 @@ class PlotlyWorkSpace:
         isShow=True,
         isUpdate=True,
         show_colorbar=True,
+        max_points=None,
+        lod="voxel",
+        voxel_size=None,
     ):
+        """
+        Plot the workspace samples as a point cloud colored by a metric.
+
+        Large workspaces can be reduced before plotting: with lod="voxel" the samples of
+        each voxel are merged into their mean position and mean color (voxel_size, or the
+        smallest size that fits max_points); with lod="quantile" max_points samples are
+        drawn so that every quantile of the metric keeps its share. Coordinates and colors
+        are sent as float32 typed arrays.
+
+        :param color: str, the metric column used for the marker color.
+        :param max_points: int, optional, the maximum number of markers.
+        :param lod: str, "voxel" or "quantile", the reduction used when max_points or voxel_size is set.
+        :param voxel_size: float, optional, the voxel edge length for lod="voxel".
+        :return: go.Figure
+        """
         if fig is None:
             fig = go.Figure()
+        points, values = self._lod_points(color, max_points, lod, voxel_size)
         trace = go.Scatter3d(
-            x=self.df["x"],
-            y=self.df["y"],
-            z=self.df["z"],
+            x=points[:, 0],
+            y=points[:, 1],
+            z=points[:, 2],
             mode="markers",
             marker=dict(
                 size=5,
-                color=self.df[color],
+                color=values,
                 colorscale="Viridis",
                 opacity=0.5,
             ),
@@ -76,42 +98,108 @@ class PlotlyWorkSpace:
 
         return fig
 
-    def plot_distribution(
+    def _lod_points(self, color, max_points=None, lod="voxel", voxel_size=None):
+        points = self.df[["x", "y", "z"]].to_numpy(dtype=float)
+        values = self.df[color].to_numpy(dtype=float)
+        if lod == "voxel":
+            # Smaller budgets are met by the stratified subsampling below
+            if (
+                voxel_size is None
+                and max_points is not None
+                and point_cloud_lod.MIN_BUDGET <= max_points < len(points)
+            ):
+                voxel_size = point_cloud_lod.voxel_size_for_budget(points, max_points)
+            if voxel_size is not None:
+                points, values, _ = point_cloud_lod.voxel_downsample(
+                    points, values, voxel_size
+                )
+        elif lod != "quantile":
+            raise ValueError(f"Unknown lod method: {lod}")
+        # Also applies after voxel downsampling with an explicit voxel_size
+        if max_points is not None and len(points) > max_points:
+            keep = point_cloud_lod.stratified_subsample(values, max_points)
+            points, values = points[keep], values[keep]
+        return points.astype(np.float32), values.astype(np.float32)
+
+    def plot_envelope(
         self,
         color="invcondition",
-        num_bins=7,
-        path="",
-        fig=go.Figure(),
+        voxel_size=0.05,
+        smoothing=1.0,
+        fig=None,
         isShow=True,
         isUpdate=True,
+        show_colorbar=True,
+        opacity=0.5,
     ):
-        min_value = self.df[color].min()  # Minimum value in the data
-        max_value = self.df[color].max()  # Maximum value in the data
+        """
+        Plot the workspace boundary as a single triangle mesh instead of one marker per sample.
 
-        data_range = max_value - min_value
+        :param color: str, the metric column used to color the surface.
+        :param voxel_size: float, the edge length of the occupancy voxels in meters.
+        :param smoothing: float, Gaussian smoothing of the occupancy in voxels.
+        :return: go.Figure
+        """
+        if fig is None:
+            fig = go.Figure()
+        voxel_data = VoxelData(self.df, voxel_size=voxel_size, method=color)
+        envelope = WorkSpaceEnvelope.from_voxel_data(voxel_data, smoothing=smoothing)
+        fig.add_trace(
+            envelope.to_mesh3d(opacity=opacity, show_colorbar=show_colorbar)
+        )
+        if isUpdate:
+            fig.update_layout(
+                scene=dict(
+                    xaxis_title="X",
+                    yaxis_title="Y",
+                    zaxis_title="Z",
+                    aspectmode="data",
+                ),
+            )
+        if isShow:
+            fig.show()
 
-        # Calculate the width of each bin
-        bin_width = data_range / num_bins
+        return fig
 
-        # Generate bin edges
-        bins = [min_value + i * bin_width for i in range(num_bins + 1)]
+    def plot_distribution(
+        self,
+        color="invcondition",
+        num_bins=7,
+        path="",
+        fig=None,
+        isShow=True,
+        isUpdate=True,
+        samples=None,
+        value_range=None,
+    ):
+        """
+        Plot the number of samples in equal-width bins of a metric.
 
-        # Create bins using cut
-        self.df["Binned Values"] = pd.cut(self.df[color], bins=bins, right=False)
+        The workspace is not modified. Large or streamed workspaces can pass their metric
+        values chunk by chunk through samples.
 
-        # Count the occurrences in each bin
-        binned_counts = self.df["Binned Values"].value_counts().reset_index()
-        binned_counts.columns = ["Range", "Count"]
+        :param color: str, the metric column.
+        :param num_bins: int, the number of bins.
+        :param samples: optional, array or iterable of arrays (chunks) of metric values,
+            used instead of the color column of the workspace.
+        :param value_range: optional (min, max) of the bins, the range of the values if None.
+        :return: go.Figure
+        """
+        if fig is None:
+            fig = go.Figure()
+        if samples is None:
+            samples = self.df[color].to_numpy(dtype=float)
+        counts, edges = metric_statistics.histogram(samples, num_bins, value_range)
+        ranges = [f"[{low:.3g}, {high:.3g})" for low, high in zip(edges[:-1], edges[1:])]
+        ranges[-1] = ranges[-1][:-1] + "]"
 
         # Add a bar trace to the figure
         fig.add_trace(
             go.Bar(
-                x=binned_counts["Range"].astype(
-                    str
-                ),  # Ensure the bin ranges are string type for proper display
-                y=binned_counts["Count"],
+                x=ranges,
+                y=counts,
                 marker=dict(color="royalblue"),
-                text=binned_counts["Count"],
+                text=counts,
                 textposition="auto",
             )
         )
@@ -125,19 +213,26 @@ class PlotlyWorkSpace:
                 template="plotly_white",
             )
 
+        # Save the figure if path is provided
+        if path:
+            fig.write_image(path)
+
         # Show the figure
         if isShow:
             fig.show()
 
+        return fig
+
     def plot_zero_approach(
         self,
         data_column="invcondition",
         thresholds=None,
         path="",
-        fig=go.Figure(),
+        fig=None,
         isShow=True,
         isUpdate=True,
         color_scheme="Blues",
+        samples=None,
     ):
         """
         Plot the percentage of data points approaching zero compared to the total number of data points.
@@ -151,14 +246,18 @@ class PlotlyWorkSpace:
         path : str
             Path to save the figure
         fig : go.Figure
-            Plotly figure object
+            Plotly figure object, a new one if None
         isShow : bool
             Whether to display the figure
         isUpdate : bool
             Whether to update the figure layout
         color_scheme : str
             Color scheme for the bars (blues, greens, reds, etc.)
+        samples : array or iterable of arrays, optional
+            Values (or chunks of values) used instead of data_column of the workspace
         """
+        if fig is None:
+            fig = go.Figure()
         # Set default thresholds if not provided
         if thresholds is None:
             thresholds = [0.001, 0.01, 0.05, 0.1, 0.5, 1.0]
@@ -166,16 +265,13 @@ class PlotlyWorkSpace:
         # Ensure thresholds are sorted
         thresholds = sorted(thresholds)
 
-        # Get absolute values to focus on proximity to zero
-        abs_values = self.df[data_column].abs()
-
-        # Total number of data points
-        total_points = len(abs_values)
+        if samples is None:
+            samples = self.df[data_column].to_numpy(dtype=float)
 
-        # Calculate counts and percentages for each threshold
+        # Counts of |value| < threshold for all thresholds in one pass
+        counts, total_points = metric_statistics.threshold_counts(samples, thresholds)
         ranges = ["< " + str(threshold) for threshold in thresholds]
-        counts = [sum(abs_values < threshold) for threshold in thresholds]
-        percentages = [(count / total_points) * 100 for count in counts]
+        percentages = counts / total_points * 100
 
         # Prepare data for plotting
         plot_data = pd.DataFrame(
@@ -1,12 +1,196 @@
 import numpy as np
 import plotly.graph_objects as go
 from typing import Optional, List, Union
+from robosandbox.visualization.figure_payload import typed_trace_data
+
+LINK_COLOR = "#E1706E"
+AXIS_COLORS = ["#F84752", "#BBDA55", "#8EC1E1"]
+END_EFFECTOR_AXIS_COLOR = "#800080"  # Purple for end-effector Z-axis
+
+# Trace uids of the compact rendering, in the order the traces are added
+COMPACT_TRACE_UIDS = [
+    "robot_links",
+    "robot_x_axes",
+    "robot_y_axes",
+    "robot_z_axes",
+    "robot_end_effector_axis",
+    "robot_arrowheads",
+]
+# go.Cone colors every cone by its vector norm, so the arrowhead of each axis color gets
+# a norm 1 + k * ARROWHEAD_NORM_STEP (k = 0..3) and a stepped colorscale maps it back.
+# The 0.3% size difference is not visible.
+ARROWHEAD_NORM_STEP = 1e-3
+
+
+def polyline(starts, ends):
+    """
+    Join segments into a single polyline, separated by NaN gaps.
+    :param starts: Nx3 array of the segment start points.
+    :param ends: Nx3 array of the segment end points.
+    :return: x, y and z arrays of length 3N.
+    """
+    points = np.full((len(starts), 3, 3), np.nan)
+    points[:, 0] = starts
+    points[:, 1] = ends
+    points = points.reshape(-1, 3)
+    return points[:, 0], points[:, 1], points[:, 2]
+
+
+def shown_axes(show_z_axis=True, show_all_axes=False):
+    """
+    Indices of the frame axes to draw.
+    :return: [0, 1, 2] for all axes, [2] for the z axis only or [].
+    """
+    if show_all_axes:
+        return [0, 1, 2]
+    if show_z_axis:
+        return [2]
+    return []
+
+
+def frames_trace_data(frames, axis_length, axes_to_show):
+    """
+    Coordinates of the compact rendering of a robot, see PlotlyRobot.compact_trace_data.
+    :param frames: np.ndarray of shape (n, 4, 4), the base and link frames.
+    :param axis_length: length of the drawn frame axes.
+    :param axes_to_show: indices of the frame axes to draw.
+    :return: dict mapping each uid of COMPACT_TRACE_UIDS to its x, y, z (and u, v, w) data.
+    """
+    positions = frames[:, :3, 3]
+    directions = frames[:, :3, :3] / np.linalg.norm(
+        frames[:, :3, :3], axis=1, keepdims=True
+    )
+    ends = positions[:, :, None] + directions * axis_length
+
+    x, y, z = polyline(positions[:-1], positions[1:])
+    data = {"robot_links": dict(x=x, y=y, z=z)}
+
+    # (frame, axis) pairs of every shown axis, and the color group of each
+    frame_index, axis_index = np.meshgrid(
+        np.arange(len(frames)), axes_to_show, indexing="ij"
+    )
+    frame_index, axis_index = frame_index.ravel(), axis_index.ravel()
+    groups = axis_index.copy()
+    groups[(frame_index == len(frames) - 1) & (axis_index == 2)] = 3
+    starts = positions[frame_index]
+    tips = ends[frame_index, :, axis_index]
+    for group, uid in enumerate(COMPACT_TRACE_UIDS[1:5]):
+        x, y, z = polyline(starts[groups == group], tips[groups == group])
+        data[uid] = dict(x=x, y=y, z=z)
+
+    vectors = directions[frame_index, :, axis_index] * (
+        1 + groups * ARROWHEAD_NORM_STEP
+    )[:, None]
+    data["robot_arrowheads"] = dict(
+        x=tips[:, 0],
+        y=tips[:, 1],
+        z=tips[:, 2],
+        u=vectors[:, 0],
+        v=vectors[:, 1],
+        w=vectors[:, 2],
+    )
+    return data
+
+
+def dh_fkine_all(links, base, q_traj):
+    """
+    Forward kinematics of all frames of a DH robot along a whole trajectory at once,
+    equivalent to DHRobot.fkine_all at each step.
+    :param links: list of roboticstoolbox DHLink.
+    :param base: 4x4 base transform.
+    :param q_traj: array-like of shape (T, n), the joint configurations.
+    :return: np.ndarray of shape (T, n + 1, 4, 4), the base frame and the n link frames.
+    """
+    q_traj = np.atleast_2d(np.asarray(q_traj, dtype=float))
+    alpha, a, d, theta, offset = (
+        np.array([getattr(link, name) for link in links], dtype=float)
+        for name in ["alpha", "a", "d", "theta", "offset"]
+    )
+    prismatic = np.array([link.sigma != 0 for link in links])
+    flip = np.array([link.isflip for link in links])
+    q = np.where(flip, -q_traj, q_traj) + offset
+    theta = np.where(prismatic, theta, q)
+    d = np.where(prismatic, q, d)
+    st, ct = np.sin(theta), np.cos(theta)
+    sa, ca = np.broadcast_to(np.sin(alpha), st.shape), np.broadcast_to(np.cos(alpha), st.shape)
+    a = np.broadcast_to(a, st.shape)
+
+    A = np.zeros(q.shape + (4, 4))
+    A[..., 3, 3] = 1
+    modified = np.array([link.mdh != 0 for link in links])
+    # Standard DH: Rz(theta) Tz(d) Tx(a) Rx(alpha)
+    A[..., 0, :] = np.stack([ct, -st * ca, st * sa, a * ct], axis=-1)
+    A[..., 1, :] = np.stack([st, ct * ca, -ct * sa, a * st], axis=-1)
+    A[..., 2, :] = np.stack([np.zeros_like(st), sa, ca, d], axis=-1)
+    # Modified DH: Rx(alpha) Tx(a) Rz(theta) Tz(d)
+    if modified.any():
+        zeros = np.zeros_like(st)
+        A_mdh = np.stack(
+            [
+                np.stack([ct, -st, zeros, a], axis=-1),
+                np.stack([st * ca, ct * ca, -sa, -sa * d], axis=-1),
+                np.stack([st * sa, ct * sa, ca, ca * d], axis=-1),
+            ],
+            axis=-2,
+        )
+        A[:, modified, :3] = A_mdh[:, modified]
+
+    frames = np.empty((len(q_traj), len(links) + 1, 4, 4))
+    frames[:, 0] = base
+    for j in range(len(links)):
+        frames[:, j + 1] = frames[:, j] @ A[:, j]
+    return frames
+
+
+def scene_layout(max_distance, zoom_factor=1.5):
+    """
+    Cubic scene fitting a robot of the given reach, with the default camera.
+    :param max_distance: reach of the robot, the axes span +-1.1 times this distance.
+    :param zoom_factor: distance of the camera relative to max_distance.
+    :return: dict of layout properties for fig.update_layout.
+    """
+    return dict(
+        scene=dict(
+            aspectmode="cube",
+            camera=dict(
+                eye=dict(
+                    x=zoom_factor * max_distance,
+                    y=-zoom_factor * max_distance,
+                    z=zoom_factor * max_distance,
+                ),  # Position of the camera
+                center=dict(x=0, y=0, z=0),  # Point the camera is looking at
+                up=dict(x=0, y=0, z=1),  # Up vector direction
+            ),
+            xaxis=dict(
+                nticks=10, range=[-1.1 * max_distance, 1.1 * max_distance]
+            ),
+            yaxis=dict(
+                nticks=10, range=[-1.1 * max_distance, 1.1 * max_distance]
+            ),
+            zaxis=dict(
+                nticks=10, range=[-1.1 * max_distance, 1.1 * max_distance]
+            ),
+            xaxis_title="X",
+            yaxis_title="Y",
+            zaxis_title="Z",
+        ),
+        width=700,
+        height=600,
+    )
 
 
 class PlotlyRobot:
-    def compute_joint_positions(self):
+    def compute_joint_positions(self, tfs=None):
+        """
+        Positions of the frames.
+        :param tfs: optional, frames as returned by fkine_all or compute_frames
+            (default: the frames of the robot's current configuration self.q).
+        :return: np.ndarray of shape (n, 3).
+        """
+        if tfs is None:
+            tfs = self.fkine_all(self.q)
         positions = []
-        for tf in self.tfs:
+        for tf in tfs:
             if isinstance(tf, np.ndarray):
                 position = tf[:3, 3]
             else:
@@ -17,31 +201,150 @@ class PlotlyRobot:
             positions.append(position)
         return np.array(positions)
 
-    def plotly(
+    def compute_frames(self, q):
+        """
+        Forward kinematics of all frames as a single array.
+        The robot is not modified, so one robot can be drawn by concurrent requests.
+        :param q: joint configuration.
+        :return: np.ndarray of shape (n, 4, 4).
+        """
+        return np.array(
+            [tf if isinstance(tf, np.ndarray) else tf.A for tf in self.fkine_all(q)],
+            dtype=float,
+        )
+
+    def compact_trace_data(
         self,
         q,
-        save=False,
-        path="",
-        fig=None,
-        isShow=True,
-        isUpdate=True,
         axis_length_factor=1.0,
-        zoom_factor=1.5,
         show_z_axis: bool = True,
         show_all_axes: bool = False,
+        frames=None,
     ):
-        if fig is None:
-            fig = go.Figure()
-        self.tfs = self.fkine_all(q)
-        self.joint_positions = self.compute_joint_positions()
+        """
+        Data of the compact rendering: all links in one polyline, the frame axes in one
+        polyline per color and all arrowheads in one cone trace.
+        The number of traces does not depend on the number of joints, hidden axes are empty.
+        :param q: joint configuration.
+        :param axis_length_factor: scale of the frame axes.
+        :param show_z_axis: show the z axis of each frame.
+        :param show_all_axes: show the x, y and z axes of each frame.
+        :param frames: optional, compute_frames(q) if already computed.
+        :return: dict mapping each uid of COMPACT_TRACE_UIDS to its trace data.
+        """
+        if frames is None:
+            frames = self.compute_frames(q)
+        axis_length = (
+            round(np.linalg.norm(frames[-1, :3, 3]) / 10, 2) * axis_length_factor
+        )
+        data = frames_trace_data(
+            frames, axis_length, shown_axes(show_z_axis, show_all_axes)
+        )
+        data["robot_arrowheads"]["sizeref"] = axis_length / 10 * axis_length_factor
+        return data
+
+    def compact_traces(self, q, **kwargs):
+        """
+        Traces of the compact rendering, see compact_trace_data, with float32 arrays.
+        :param q: joint configuration.
+        :return: list of plotly traces, in the order of COMPACT_TRACE_UIDS.
+        """
+        data = {
+            uid: typed_trace_data(trace_data)
+            for uid, trace_data in self.compact_trace_data(q, **kwargs).items()
+        }
+        traces = [
+            go.Scatter3d(
+                uid="robot_links",
+                mode="lines",
+                line=dict(color=LINK_COLOR, width=14),
+                name="Links",
+                **data["robot_links"],
+            )
+        ]
+        names = ["X Axes", "Y Axes", "Z Axes", "End-Effector Z Axis"]
+        colors = AXIS_COLORS + [END_EFFECTOR_AXIS_COLOR]
+        for uid, name, color in zip(COMPACT_TRACE_UIDS[1:5], names, colors):
+            traces.append(
+                go.Scatter3d(
+                    uid=uid,
+                    mode="lines",
+                    line=dict(color=color, width=5),
+                    name=name,
+                    **data[uid],
+                )
+            )
+        traces.append(
+            go.Cone(
+                uid="robot_arrowheads",
+                sizemode="absolute",
+                showscale=False,
+                colorscale=[[k / 3, color] for k, color in enumerate(colors)],
+                cmin=1,
+                cmax=1 + 3 * ARROWHEAD_NORM_STEP,
+                name="Arrowheads",
+                **data["robot_arrowheads"],
+            )
+        )
+        return traces
+
+    def update_plotly(self, fig, q, **kwargs):
+        """
+        Move the compact rendering of fig to a new configuration in place.
+        :param fig: plotly figure drawn with plotly(..., compact=True).
+        :param q: joint configuration.
+        :param kwargs: axis options of compact_trace_data.
+        :return: the updated figure.
+        """
+        data = self.compact_trace_data(q, **kwargs)
+        with fig.batch_update():
+            for uid, trace_data in data.items():
+                fig.update_traces(typed_trace_data(trace_data), selector=dict(uid=uid))
+        return fig
+
+    def restyle_data(self, fig, q, **kwargs):
+        """
+        Arguments of Plotly.restyle (or a Dash Patch) that move the compact rendering of fig
+        to a new configuration, without sending the rest of the figure.
+        :param fig: plotly figure drawn with plotly(..., compact=True).
+        :param q: joint configuration.
+        :param kwargs: axis options of compact_trace_data.
+        :return: update dict with one list entry per trace, and the list of trace indices.
+        """
+        data = self.compact_trace_data(q, **kwargs)
+        uids = [trace.uid for trace in fig.data]
+        indices = [uids.index(uid) for uid in COMPACT_TRACE_UIDS]
+        update = {}
+        for position, uid in enumerate(COMPACT_TRACE_UIDS):
+            for key, value in data[uid].items():
+                update.setdefault(key, [None] * len(indices))[position] = (
+                    value.tolist() if isinstance(value, np.ndarray) else value
+                )
+        return update, indices
+
+    def add_traces(
+        self,
+        fig,
+        q,
+        axis_length_factor=1.0,
+        show_z_axis: bool = True,
+        show_all_axes: bool = False,
+        frames=None,
+    ):
+        """
+        Add one trace per link and one line and cone trace per frame axis.
+        :param frames: optional, compute_frames(q) if already computed.
+        """
+        tfs = self.compute_frames(q) if frames is None else frames
+        joint_positions = self.compute_joint_positions(tfs)
 
         # Adding links between joints
-        for i in range(1, len(self.joint_positions)):
+        for i in range(1, len(joint_positions)):
             fig.add_trace(
                 go.Scatter3d(
-                    x=self.joint_positions[i - 1 : i + 1, 0],
-                    y=self.joint_positions[i - 1 : i + 1, 1],
-                    z=self.joint_positions[i - 1 : i + 1, 2],
+                    x=joint_positions[i - 1 : i + 1, 0],
+                    y=joint_positions[i - 1 : i + 1, 1],
+                    z=joint_positions[i - 1 : i + 1, 2],
                     mode="lines",
                     line=dict(color="#E1706E", width=14),
                     name=f"Link{i}",
@@ -49,17 +352,17 @@ class PlotlyRobot:
             )
 
         # find the distance from last tf to the origin
-        if isinstance(self.tfs[-1], np.ndarray):
-            max_distance = np.linalg.norm(self.tfs[-1][:3, 3])
+        if isinstance(tfs[-1], np.ndarray):
+            max_distance = np.linalg.norm(tfs[-1][:3, 3])
         else:
-            max_distance = np.linalg.norm(self.tfs[-1].t)
+            max_distance = np.linalg.norm(tfs[-1].t)
         axis_length = (
             round(max_distance / 10, 2) * axis_length_factor
         )  # Uniform length for all axes
         arrow_length = axis_length / 10 * axis_length_factor  # Length of the arrowhead
 
         # Adding axes at each joint
-        for index, (tf, pos) in enumerate(zip(self.tfs, self.joint_positions)):
+        for index, (tf, pos) in enumerate(zip(tfs, joint_positions)):
             directions = ["X", "Y", "Z"]
             colors = ["#F84752", "#BBDA55", "#8EC1E1"]
 
@@ -74,7 +377,7 @@ class PlotlyRobot:
 
             for i in axes_to_show:  # only iterate over the axes we want to show
                 # Determine color - special case for last frame's Z-axis
-                if i == 2 and index == len(self.tfs) - 1:  # Last frame Z-axis
+                if i == 2 and index == len(tfs) - 1:  # Last frame Z-axis
                     axis_color = "#800080"  # Purple for end-effector Z-axis
                 else:
                     axis_color = colors[i]
@@ -117,39 +420,196 @@ class PlotlyRobot:
                     )
                 )
 
+    def plotly(
+        self,
+        q,
+        save=False,
+        path="",
+        fig=None,
+        isShow=True,
+        isUpdate=True,
+        axis_length_factor=1.0,
+        zoom_factor=1.5,
+        show_z_axis: bool = True,
+        show_all_axes: bool = False,
+        compact: bool = False,
+    ):
+        """
+        Plot the robot links and frame axes.
+        :param q: joint configuration.
+        :param fig: figure to add the traces to, a new one if None.
+        :param compact: draw a fixed number of traces (see compact_traces), which
+            update_plotly and restyle_data can later move in place.
+        :return: the figure.
+        """
+        if fig is None:
+            fig = go.Figure()
+        frames = self.compute_frames(q)
+        if compact:
+            fig.add_traces(
+                self.compact_traces(
+                    q,
+                    axis_length_factor=axis_length_factor,
+                    show_z_axis=show_z_axis,
+                    show_all_axes=show_all_axes,
+                    frames=frames,
+                )
+            )
+        else:
+            self.add_traces(
+                fig,
+                q,
+                axis_length_factor=axis_length_factor,
+                show_z_axis=show_z_axis,
+                show_all_axes=show_all_axes,
+                frames=frames,
+            )
+
+        # find the distance from last tf to the origin
+        max_distance = np.linalg.norm(frames[-1, :3, 3])
+
         # Adjust the aspect ratio
         if isUpdate:
-            fig.update_layout(
-                scene=dict(
-                    aspectmode="cube",
-                    camera=dict(
-                        eye=dict(
-                            x=zoom_factor * max_distance,
-                            y=-zoom_factor * max_distance,
-                            z=zoom_factor * max_distance,
-                        ),  # Position of the camera
-                        center=dict(x=0, y=0, z=0),  # Point the camera is looking at
-                        up=dict(x=0, y=0, z=1),  # Up vector direction
-                    ),
-                    xaxis=dict(
-                        nticks=10, range=[-1.1 * max_distance, 1.1 * max_distance]
-                    ),
-                    yaxis=dict(
-                        nticks=10, range=[-1.1 * max_distance, 1.1 * max_distance]
-                    ),
-                    zaxis=dict(
-                        nticks=10, range=[-1.1 * max_distance, 1.1 * max_distance]
-                    ),
-                    xaxis_title="X",
-                    yaxis_title="Y",
-                    zaxis_title="Z",
-                ),
-                width=700,
-                height=600,
-            )
+            fig.update_layout(**scene_layout(max_distance, zoom_factor))
 
         if isShow:
             fig.show()
         if save:
             fig.write_image(path)
         return fig
+
+    def fkine_all_batch(self, q_traj):
+        """
+        Forward kinematics of all frames along a trajectory. DH robots are evaluated in
+        one vectorized call, other robots step by step with fkine_all.
+        :param q_traj: array-like of shape (T, n), the joint configurations.
+        :return: np.ndarray of shape (T, n + 1, 4, 4).
+        """
+        q_traj = np.atleast_2d(np.asarray(q_traj, dtype=float))
+        links = getattr(self, "links", None)
+        if links and all(hasattr(link, "mdh") for link in links):
+            return dh_fkine_all(links, self.base.A, q_traj)
+        return np.stack([self.compute_frames(q) for q in q_traj])
+
+    def animate(
+        self,
+        q_traj,
+        save=False,
+        path="",
+        fig=None,
+        isShow=True,
+        isUpdate=True,
+        frame_duration=20,
+        axis_length_factor=1.0,
+        zoom_factor=1.5,
+        show_z_axis: bool = True,
+        show_all_axes: bool = False,
+    ):
+        """
+        Animate the robot along a joint trajectory.
+
+        The frames of the whole trajectory come from one batched forward kinematics
+        call. Each animation frame only carries the coordinates of the compact traces,
+        and playback (play/pause buttons and a slider) runs in the browser.
+
+        :param q_traj: array-like of shape (T, n), the joint configurations.
+        :param save: save the animation as an HTML file at path.
+        :param fig: figure to add the traces to, a new one if None.
+        :param frame_duration: duration of each animation frame in milliseconds.
+        :return: the figure.
+        """
+        if fig is None:
+            fig = go.Figure()
+        q_traj = np.atleast_2d(np.asarray(q_traj, dtype=float))
+        frames = self.fkine_all_batch(q_traj)
+        axes_to_show = shown_axes(show_z_axis, show_all_axes)
+        # Keep the axis length of the first configuration along the whole animation
+        axis_length = (
+            round(np.linalg.norm(frames[0, -1, :3, 3]) / 10, 2) * axis_length_factor
+        )
+        trace_indices = list(
+            range(len(fig.data), len(fig.data) + len(COMPACT_TRACE_UIDS))
+        )
+        fig.add_traces(
+            self.compact_traces(
+                q_traj[0],
+                axis_length_factor=axis_length_factor,
+                show_z_axis=show_z_axis,
+                show_all_axes=show_all_axes,
+            )
+        )
+
+        trace_types = [trace.type for trace in fig.data[trace_indices[0] :]]
+        animation_frames = []
+        for step, step_frames in enumerate(frames):
+            data = frames_trace_data(step_frames, axis_length, axes_to_show)
+            # Plain lists of micrometer-rounded floats validate and serialize much faster
+            # than thousands of small numpy arrays
+            animation_frames.append(
+                dict(
+                    data=[
+                        dict(
+                            {k: np.round(v, 6).tolist() for k, v in data[uid].items()},
+                            type=trace_type,
+                        )
+                        for uid, trace_type in zip(COMPACT_TRACE_UIDS, trace_types)
+                    ],
+                    traces=trace_indices,
+                    name=str(step),
+                )
+            )
+        fig.frames = animation_frames
+
+        play = dict(
+            frame=dict(duration=frame_duration, redraw=True),
+            fromcurrent=True,
+            transition=dict(duration=0),
+            mode="immediate",
+        )
+        pause = dict(
+            frame=dict(duration=0, redraw=False),
+            transition=dict(duration=0),
+            mode="immediate",
+        )
+        fig.update_layout(
+            updatemenus=[
+                dict(
+                    type="buttons",
+                    showactive=False,
+                    x=0.05,
+                    y=0.05,
+                    xanchor="right",
+                    yanchor="top",
+                    buttons=[
+                        dict(label="Play", method="animate", args=[None, play]),
+                        dict(label="Pause", method="animate", args=[[None], pause]),
+                    ],
+                )
+            ],
+            sliders=[
+                dict(
+                    x=0.1,
+                    len=0.9,
+                    currentvalue=dict(prefix="Step: "),
+                    steps=[
+                        dict(
+                            label=frame["name"],
+                            method="animate",
+                            args=[[frame["name"]], dict(pause, frame=dict(duration=0, redraw=True))],
+                        )
+                        for frame in animation_frames
+                    ],
+                )
+            ],
+        )
+
+        if isUpdate:
+            # Fixed ranges, so the scene does not rescale during the animation
+            max_distance = np.linalg.norm(frames[:, :, :3, 3], axis=-1).max()
+            fig.update_layout(**scene_layout(max_distance, zoom_factor))
+
+        if isShow:
+            fig.show()
+        if save:
+            fig.write_html(path)
+        return fig
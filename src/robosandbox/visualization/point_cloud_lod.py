@@ -0,0 +1,119 @@
+"""
+Level-of-detail reduction of workspace point clouds before plotting.
+"""
+
+import numpy as np
+from robosandbox.visualization.sparse_voxel_data import pack_voxel_keys
+
+# Smallest budget voxel_size_for_budget can meet, one voxel per octant
+MIN_BUDGET = 8
+
+
+def voxel_downsample(points, values=None, voxel_size=0.05):
+    """
+    Replace the samples of each voxel by their mean position and mean value.
+
+    :param points: array-like of shape (N, 3).
+    :param values: array-like of shape (N,), optional, e.g. the metric used for coloring.
+        NaN values are skipped; voxels without any value get NaN.
+    :param voxel_size: float, the edge length of a voxel in meters.
+    :return: (points, values, counts), one entry per occupied voxel; values is None if not given.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    keys = pack_voxel_keys(np.floor(points / voxel_size).astype(np.int64))
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    means = np.stack(
+        [np.bincount(inverse, weights=points[:, axis]) for axis in range(3)], axis=1
+    ) / counts[:, None]
+    if values is None:
+        return means, None, counts
+
+    values = np.asarray(values, dtype=float)
+    has_value = ~np.isnan(values)
+    value_sums = np.bincount(
+        inverse[has_value], weights=values[has_value], minlength=len(counts)
+    )
+    value_counts = np.bincount(inverse[has_value], minlength=len(counts))
+    mean_values = np.divide(
+        value_sums,
+        value_counts,
+        out=np.full(len(counts), np.nan),
+        where=value_counts > 0,
+    )
+    return means, mean_values, counts
+
+
+def voxel_size_for_budget(
+    points, max_points, initial_voxel_size=None, growth=1.25, max_iterations=1000
+):
+    """
+    Find a voxel size whose voxel downsampling keeps at most max_points points.
+
+    The voxels are aligned with the origin, so points on both sides of it occupy up to
+    8 voxels whatever the voxel size, and the budget must be at least MIN_BUDGET.
+
+    :param points: array-like of shape (N, 3).
+    :param max_points: int, the point budget, at least MIN_BUDGET.
+    :param initial_voxel_size: float, optional, the first size tried
+        (default: the size giving max_points voxels over the bounding box).
+    :param growth: float, factor by which the voxel size grows until the budget is met.
+    :param max_iterations: int, the number of voxel sizes tried before giving up.
+    :return: float, the voxel size in meters.
+    """
+    if max_points < MIN_BUDGET:
+        raise ValueError(f"max_points must be at least {MIN_BUDGET}")
+    if growth <= 1:
+        raise ValueError("growth must be greater than 1")
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    extent = np.ptp(points, axis=0) if len(points) else np.ones(3)
+    if initial_voxel_size is None:
+        extent = np.where(extent > 0, extent, max(np.max(extent), 1e-9))
+        initial_voxel_size = (np.prod(extent) / max_points) ** (1 / 3)
+    voxel_size = initial_voxel_size
+    for _ in range(max_iterations):
+        keys = pack_voxel_keys(np.floor(points / voxel_size).astype(np.int64))
+        if len(np.unique(keys)) <= max_points:
+            return voxel_size
+        voxel_size *= growth
+    raise ValueError(
+        f"No voxel size keeps {max_points} points within {max_iterations} iterations"
+    )
+
+
+def stratified_subsample(values, max_points, num_strata=10, seed=0):
+    """
+    Subsample indices so that every quantile range of the values keeps its share.
+
+    The values are split into num_strata quantile bins and the same fraction is drawn
+    from each, so the metric distribution (including its tails) is preserved exactly
+    up to rounding. NaN values form their own stratum.
+
+    :param values: array-like of shape (N,).
+    :param max_points: int, the number of indices to keep.
+    :param num_strata: int, the number of quantile bins.
+    :param seed: int, seed for the random draw within each stratum.
+    :return: np.ndarray of sorted int indices, at most max_points long.
+    """
+    values = np.asarray(values, dtype=float)
+    if max_points >= len(values):
+        return np.arange(len(values))
+    rng = np.random.default_rng(seed)
+    has_value = ~np.isnan(values)
+    strata = np.full(len(values), num_strata)
+    if np.any(has_value):
+        edges = np.quantile(values[has_value], np.linspace(0, 1, num_strata + 1)[1:-1])
+        strata[has_value] = np.searchsorted(edges, values[has_value], side="right")
+
+    # Shuffle once, then take the first share of each stratum in shuffled order
+    order = rng.permutation(len(values))
+    order = order[np.argsort(strata[order], kind="stable")]
+    sizes = np.bincount(strata, minlength=num_strata + 1)
+    shares = np.floor(sizes * max_points / len(values)).astype(np.int64)
+    # Hand out the points lost to rounding to the strata with the largest remainders
+    remainders = sizes * max_points / len(values) - shares
+    shares[np.argsort(-remainders)[: max_points - shares.sum()]] += 1
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rank = np.arange(len(values)) - np.repeat(starts, sizes)
+    keep = rank < np.repeat(shares, sizes)
+    return np.sort(order[keep])
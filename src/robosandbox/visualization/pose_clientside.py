@@ -0,0 +1,125 @@
+"""
+Client-side posing of the compact robot rendering in the Dash apps.
+
+The server sends the DH table of the robot once; moving a joint slider then runs the
+forward kinematics in the browser and rewrites the coordinates of the traces of
+PlotlyRobot.compact_traces, without a request to the server.
+"""
+
+import numpy as np
+
+from robosandbox.visualization.plotly_robot import (
+    ARROWHEAD_NORM_STEP,
+    COMPACT_TRACE_UIDS,
+    shown_axes,
+)
+
+
+def dh_table(robot, axis_length_factor=1.0, show_z_axis=True, show_all_axes=False):
+    """
+    JSON-serializable description of a DH robot for POSE_TRACES_JS.
+    :param robot: DH robot drawn with plotly(..., compact=True).
+    :param axis_length_factor: scale of the frame axes, see PlotlyRobot.compact_trace_data.
+    :return: dict with the links, the base transform and the rendering options.
+    """
+    if not all(hasattr(link, "mdh") for link in robot.links):
+        raise ValueError(f"Client-side posing needs a DH robot, got {type(robot).__name__}")
+    base = robot.base if isinstance(robot.base, np.ndarray) else robot.base.A
+    return {
+        "links": [
+            {
+                "a": float(link.a),
+                "d": float(link.d),
+                "alpha": float(link.alpha),
+                "theta": float(link.theta),
+                "offset": float(link.offset),
+                "prismatic": bool(link.sigma),
+                "flip": bool(link.isflip),
+                "modified": bool(link.mdh),
+            }
+            for link in robot.links
+        ],
+        "base": np.asarray(base, dtype=float).tolist(),
+        "axes": shown_axes(show_z_axis, show_all_axes),
+        "axis_length_factor": axis_length_factor,
+        "norm_step": ARROWHEAD_NORM_STEP,
+        "uids": COMPACT_TRACE_UIDS,
+    }
+
+
+# JavaScript port of dh_fkine_all and PlotlyRobot.compact_trace_data:
+# (table, q in rad or m) -> {uid: trace data}
+POSE_TRACES_JS = """
+function (table, q) {
+    const matmul = (A, B) =>
+        A.map((row) => B[0].map((_, j) => row.reduce((s, v, k) => s + v * B[k][j], 0)));
+    const frames = [table.base];
+    table.links.forEach((link, j) => {
+        const qj = (link.flip ? -q[j] : q[j]) + link.offset;
+        const theta = link.prismatic ? link.theta : qj;
+        const d = link.prismatic ? qj : link.d;
+        const st = Math.sin(theta), ct = Math.cos(theta);
+        const sa = Math.sin(link.alpha), ca = Math.cos(link.alpha), a = link.a;
+        const A = link.modified
+            ? [[ct, -st, 0, a], [st * ca, ct * ca, -sa, -sa * d],
+               [st * sa, ct * sa, ca, ca * d], [0, 0, 0, 1]]
+            : [[ct, -st * ca, st * sa, a * ct], [st, ct * ca, -ct * sa, a * st],
+               [0, sa, ca, d], [0, 0, 0, 1]];
+        frames.push(matmul(frames[frames.length - 1], A));
+    });
+
+    const positions = frames.map((T) => [T[0][3], T[1][3], T[2][3]]);
+    const last = frames.length - 1;
+    const axisLength =
+        (Math.round(Math.hypot(...positions[last]) * 10) / 100) * table.axis_length_factor;
+    const uids = table.uids;
+    const data = {};
+    uids.slice(0, 5).forEach((uid) => { data[uid] = {x: [], y: [], z: []}; });
+    const cones = {x: [], y: [], z: [], u: [], v: [], w: []};
+    const addSegment = (trace, start, end) => {
+        ["x", "y", "z"].forEach((c, i) => trace[c].push(start[i], end[i], null));
+    };
+
+    for (let f = 0; f < last; f++) {
+        addSegment(data[uids[0]], positions[f], positions[f + 1]);
+    }
+    frames.forEach((T, f) => {
+        table.axes.forEach((k) => {
+            const group = f === last && k === 2 ? 3 : k;
+            const norm = Math.hypot(T[0][k], T[1][k], T[2][k]);
+            const direction = [0, 1, 2].map((i) => T[i][k] / norm);
+            const tip = positions[f].map((p, i) => p + direction[i] * axisLength);
+            addSegment(data[uids[group + 1]], positions[f], tip);
+            const scale = 1 + group * table.norm_step;
+            ["x", "y", "z"].forEach((c, i) => cones[c].push(tip[i]));
+            ["u", "v", "w"].forEach((c, i) => cones[c].push(direction[i] * scale));
+        });
+    });
+    cones.sizeref = (axisLength / 10) * table.axis_length_factor;
+    data[uids[5]] = cones;
+    return data;
+}
+"""
+
+# Clientside callback: (joint slider values in deg or m, DH table, figure) -> figure
+POSE_CALLBACK_JS = """
+function (values, table, figure) {
+    const noUpdate = window.dash_clientside.no_update;
+    if (!table || !figure || !values || values.length !== table.links.length
+        || values.some((v) => v === null || v === undefined)) {
+        return noUpdate;
+    }
+    const poseTraces = __POSE_TRACES_JS__;
+    const q = values.map((v, j) => (table.links[j].prismatic ? v : (v * Math.PI) / 180));
+    const data = poseTraces(table, q);
+    let posed = false;
+    const traces = figure.data.map((trace) => {
+        if (!(trace.uid in data)) {
+            return trace;
+        }
+        posed = true;
+        return Object.assign({}, trace, data[trace.uid]);
+    });
+    return posed ? Object.assign({}, figure, {data: traces}) : noUpdate;
+}
+""".replace("__POSE_TRACES_JS__", POSE_TRACES_JS.strip())
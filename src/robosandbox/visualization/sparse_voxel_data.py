@@ -0,0 +1,356 @@
+import numpy as np
+import pandas as pd
+
+# Each voxel index is stored in 21 bits of a signed 64-bit key, shifted by
+# KEY_OFFSET so that negative indices can be packed as well.
+KEY_BITS = 21
+KEY_OFFSET = 1 << (KEY_BITS - 1)
+KEY_MASK = (1 << KEY_BITS) - 1
+# One voxel of head room on either side keeps neighbor keys inside their field.
+MAX_INDEX = KEY_OFFSET - 2
+
+NEIGHBOR_OFFSETS = {
+    6: np.array(
+        [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]]
+    ),
+    18: np.array(
+        [
+            offset
+            for offset in np.ndindex(3, 3, 3)
+            if 0 < np.sum(np.abs(np.array(offset) - 1)) <= 2
+        ]
+    )
+    - 1,
+    26: np.array([offset for offset in np.ndindex(3, 3, 3) if offset != (1, 1, 1)])
+    - 1,
+}
+
+
+def pack_voxel_keys(indices):
+    """
+    Pack integer voxel indices into single int64 keys.
+
+    :param indices: array-like of shape (N, 3), the integer (i, j, k) voxel indices.
+    :return: np.ndarray of shape (N,), the packed keys.
+    """
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    if indices.size and np.abs(indices).max() > MAX_INDEX:
+        raise ValueError(
+            f"Voxel index out of range: |index| must be <= {MAX_INDEX}. "
+            "Increase the voxel size or recentre the data."
+        )
+    shifted = indices + KEY_OFFSET
+    return (
+        (shifted[:, 0] << (2 * KEY_BITS)) | (shifted[:, 1] << KEY_BITS) | shifted[:, 2]
+    )
+
+
+def unpack_voxel_keys(keys):
+    """
+    Unpack int64 keys into integer voxel indices.
+
+    :param keys: array-like of shape (N,), the packed keys.
+    :return: np.ndarray of shape (N, 3), the (i, j, k) voxel indices.
+    """
+    keys = np.asarray(keys, dtype=np.int64).reshape(-1)
+    return (
+        np.stack(
+            [
+                (keys >> (2 * KEY_BITS)) & KEY_MASK,
+                (keys >> KEY_BITS) & KEY_MASK,
+                keys & KEY_MASK,
+            ],
+            axis=1,
+        )
+        - KEY_OFFSET
+    )
+
+
+def _key_deltas(offsets):
+    # Packing is linear in each field, so a neighbor key is the key plus a delta.
+    offsets = np.asarray(offsets, dtype=np.int64)
+    return (offsets[:, 0] << (2 * KEY_BITS)) + (offsets[:, 1] << KEY_BITS) + offsets[:, 2]
+
+
+class SparseVoxelData:
+    """
+    Sparse voxel representation of a workspace.
+
+    Only occupied voxels are stored, in arrays sorted by their packed integer key.
+    Voxel (i, j, k) spans [i, i + 1) * voxel_size along x (and likewise for y, z),
+    so the grid is anchored at the world origin and does not depend on the data range.
+    """
+
+    def __init__(self, df, voxel_size=0.05, method="order_independent_manipulability"):
+        """
+        :param df: DataFrame with x, y, z columns and one column per metric.
+        :param voxel_size: float, the edge length of a voxel in meters.
+        :param method: str or list of str, the metric column(s) to aggregate in one pass.
+        """
+        self.df = df
+        self.voxel_size = voxel_size
+        self.methods = [method] if isinstance(method, str) else list(method)
+        self.method = self.methods[0] if self.methods else None
+        self.keys = None
+        self.counts = None
+        self.metric_sums = {}
+        self.avg_metrics = {}
+        self.total_voxels = None
+        self.total_volume = None
+
+        self._validate_method()
+        self._create_sparse_workspace()
+
+    @property
+    def avg_metric(self):
+        return self.avg_metrics[self.method]
+
+    def _validate_method(self):
+        if not self.methods:
+            raise ValueError("At least one method must be given.")
+        missing = [method for method in self.methods if method not in self.df.columns]
+        if missing:
+            available_columns = list(self.df.columns)
+            raise ValueError(
+                f"Method '{missing[0]}' not found in DataFrame columns. Available: {available_columns}"
+            )
+
+    def _resolve_method(self, method):
+        if method is None:
+            return self.method
+        if method not in self.methods:
+            raise ValueError(
+                f"Method '{method}' was not aggregated. Available: {self.methods}"
+            )
+        return method
+
+    def _create_sparse_workspace(self):
+        points = self.df[["x", "y", "z"]].to_numpy(dtype=float)
+        keys = pack_voxel_keys(self.index_of(points))
+        self.keys, inverse, self.counts = np.unique(
+            keys, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.reshape(-1)
+        # NaN entries are skipped for that metric only
+        for method in self.methods:
+            values = self.df[method].to_numpy(dtype=float)
+            has_value = ~np.isnan(values)
+            self.metric_sums[method] = np.bincount(
+                inverse[has_value], weights=values[has_value], minlength=len(self.keys)
+            )
+            metric_counts = np.bincount(inverse[has_value], minlength=len(self.keys))
+            self.avg_metrics[method] = np.divide(
+                self.metric_sums[method],
+                metric_counts,
+                out=np.zeros(len(self.keys)),
+                where=metric_counts > 0,
+            )
+        self._calculate_volume_stats()
+
+    def _calculate_volume_stats(self):
+        self.total_voxels = len(self.keys)
+        self.total_volume = self.total_voxels * (self.voxel_size**3)
+
+    def index_of(self, points):
+        """
+        Get the integer voxel indices containing the given points.
+
+        :param points: array-like of shape (N, 3), the x, y, z coordinates.
+        :return: np.ndarray of shape (N, 3), the (i, j, k) voxel indices.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        return np.floor(points / self.voxel_size).astype(np.int64)
+
+    def voxel_indices(self):
+        """
+        Get the integer indices of all occupied voxels.
+
+        :return: np.ndarray of shape (M, 3), sorted by packed key.
+        """
+        return unpack_voxel_keys(self.keys)
+
+    def voxel_centers(self):
+        """
+        Get the centre coordinates of all occupied voxels.
+
+        :return: np.ndarray of shape (M, 3), sorted by packed key.
+        """
+        return (self.voxel_indices() + 0.5) * self.voxel_size
+
+    def lookup_keys(self, keys):
+        """
+        Find the storage position of each key.
+
+        :param keys: array-like of packed keys.
+        :return: np.ndarray of positions into the voxel arrays, -1 where the voxel is empty.
+        """
+        keys = np.asarray(keys, dtype=np.int64).reshape(-1)
+        if len(self.keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = self.keys[positions] == keys
+        return np.where(found, positions, -1)
+
+    def lookup(self, points):
+        """
+        Find the occupied voxel containing each point.
+
+        :param points: array-like of shape (N, 3), the x, y, z coordinates.
+        :return: np.ndarray of positions into the voxel arrays, -1 where the voxel is empty.
+        """
+        return self.lookup_keys(pack_voxel_keys(self.index_of(points)))
+
+    def contains(self, points):
+        """
+        Check whether each point falls inside an occupied voxel.
+
+        :param points: array-like of shape (N, 3), the x, y, z coordinates.
+        :return: np.ndarray of bool of shape (N,).
+        """
+        return self.lookup(points) >= 0
+
+    def get_avg_metric(self, points=None, fill_value=np.nan, method=None):
+        """
+        Get the average metric of the voxel containing each point.
+
+        :param points: array-like of shape (N, 3), the x, y, z coordinates. If None, the
+            metric of every occupied voxel is returned.
+        :param fill_value: float, the value returned for empty voxels.
+        :param method: str, the metric name (default: the first aggregated metric).
+        :return: np.ndarray of shape (N,), or (M,) in voxel order if points is None.
+        """
+        avg_metric = self.avg_metrics[self._resolve_method(method)]
+        if points is None:
+            return avg_metric
+        positions = self.lookup(points)
+        result = np.full(len(positions), fill_value, dtype=float)
+        found = positions >= 0
+        result[found] = avg_metric[positions[found]]
+        return result
+
+    def neighbors(self, indices, connectivity=6):
+        """
+        Find the occupied neighbors of the given voxels.
+
+        :param indices: array-like of shape (N, 3), the (i, j, k) voxel indices.
+        :param connectivity: int, 6 (faces), 18 (faces + edges) or 26 (faces + edges + corners).
+        :return: np.ndarray of shape (N, connectivity), positions into the voxel arrays, -1 where empty.
+        """
+        if connectivity not in NEIGHBOR_OFFSETS:
+            raise ValueError(
+                f"Unknown connectivity: {connectivity}. Available: {list(NEIGHBOR_OFFSETS)}"
+            )
+        keys = pack_voxel_keys(indices)
+        deltas = _key_deltas(NEIGHBOR_OFFSETS[connectivity])
+        neighbor_keys = keys[:, None] + deltas[None, :]
+        return self.lookup_keys(neighbor_keys.reshape(-1)).reshape(neighbor_keys.shape)
+
+    def neighbor_counts(self, connectivity=6):
+        """
+        Count the occupied neighbors of every occupied voxel.
+
+        :param connectivity: int, 6, 18 or 26.
+        :return: np.ndarray of shape (M,).
+        """
+        return np.sum(self.neighbors(self.voxel_indices(), connectivity) >= 0, axis=1)
+
+    def boundary_mask(self, connectivity=6):
+        """
+        Flag the occupied voxels that touch at least one empty neighbor.
+
+        :param connectivity: int, 6, 18 or 26.
+        :return: np.ndarray of bool of shape (M,).
+        """
+        return self.neighbor_counts(connectivity) < connectivity
+
+    def get_volume(self):
+        """
+        Get the volume covered by the occupied voxels.
+
+        :return: float, the volume in m³.
+        """
+        return self.total_volume
+
+    def get_bounds(self):
+        """
+        Get the inclusive lower and exclusive upper voxel indices of the occupied region.
+
+        :return: tuple of two np.ndarray of shape (3,).
+        """
+        indices = self.voxel_indices()
+        if len(indices) == 0:
+            return np.zeros(3, dtype=np.int64), np.zeros(3, dtype=np.int64)
+        return indices.min(axis=0), indices.max(axis=0) + 1
+
+    def to_dense(self, lower=None, upper=None, method=None):
+        """
+        Convert a box of the sparse grid to dense arrays.
+
+        :param lower: array-like of shape (3,), inclusive lower voxel index (default: occupied minimum).
+        :param upper: array-like of shape (3,), exclusive upper voxel index (default: occupied maximum + 1).
+        :param method: str, the metric placed in "avg_metric" (default: the first aggregated metric).
+        :return: dict with "voxels" (bool), "avg_metric" (float), "counts" (int) of shape upper - lower,
+            and "origin", the world coordinates of the block's lower corner.
+        """
+        default_lower, default_upper = self.get_bounds()
+        lower = default_lower if lower is None else np.asarray(lower, dtype=np.int64)
+        upper = default_upper if upper is None else np.asarray(upper, dtype=np.int64)
+        shape = tuple(int(n) for n in np.maximum(upper - lower, 0))
+
+        voxels = np.zeros(shape, dtype=bool)
+        avg_metric = np.zeros(shape)
+        counts = np.zeros(shape, dtype=int)
+
+        indices = self.voxel_indices()
+        inside = np.all((indices >= lower) & (indices < upper), axis=1)
+        local = tuple((indices[inside] - lower).T)
+        voxels[local] = True
+        avg_metric[local] = self.avg_metrics[self._resolve_method(method)][inside]
+        counts[local] = self.counts[inside]
+        return {
+            "voxels": voxels,
+            "avg_metric": avg_metric,
+            "counts": counts,
+            "origin": lower * self.voxel_size,
+        }
+
+    def to_dataframe(self):
+        """
+        Export the occupied voxels as a DataFrame of voxel centres and statistics.
+
+        :return: pd.DataFrame with columns x, y, z, count and one column per metric.
+        """
+        centers = self.voxel_centers()
+        data = {
+            "x": centers[:, 0],
+            "y": centers[:, 1],
+            "z": centers[:, 2],
+            "count": self.counts,
+        }
+        data.update(self.avg_metrics)
+        return pd.DataFrame(data)
+
+    def get_statistics(self, method=None):
+        lower, upper = self.get_bounds()
+        bounding_voxels = int(np.prod(upper - lower))
+        fill_ratio = self.total_voxels / bounding_voxels if bounding_voxels else 0.0
+        return {
+            "total_data_points": len(self.df),
+            "voxel_size": self.voxel_size,
+            "grid_dimensions": tuple(int(n) for n in upper - lower),
+            "occupied_voxels": self.total_voxels,
+            "workspace_volume": self.total_volume,
+            "fill_ratio": fill_ratio,
+            "method": self._resolve_method(method),
+        }
+
+    def print_statistics(self, method=None):
+        stats = self.get_statistics(method)
+        print(f"\nSparse Workspace Statistics:")
+        print(f"├─ Method: {stats['method']}")
+        print(f"├─ Total data points: {stats['total_data_points']:,}")
+        print(f"├─ Voxel size: {stats['voxel_size']:.3f} m")
+        print(f"├─ Grid dimensions: {stats['grid_dimensions']}")
+        print(f"├─ Occupied voxels: {stats['occupied_voxels']:,}")
+        print(f"├─ Workspace volume: {stats['workspace_volume']:.4f} m³")
+        print(f"└─ Fill ratio: {stats['fill_ratio']:.3%}")
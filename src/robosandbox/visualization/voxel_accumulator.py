@@ -0,0 +1,262 @@
+import numpy as np
+import pandas as pd
+
+
+class VoxelAccumulator:
+    """
+    Incremental voxel grid fed batch by batch with workspace samples.
+
+    Counts, per-metric sums and occupancy are updated in place. The grid is anchored
+    at the world origin (voxel (i, j, k) spans [i, i + 1) * voxel_size), so growing
+    the bounds never shifts existing voxels.
+    """
+
+    def __init__(self, voxel_size=0.05, bounds=None, growable=True, growth_margin=0.25):
+        """
+        :param voxel_size: float, the edge length of a voxel in meters.
+        :param bounds: optional, [[xmin, xmax], [ymin, ymax], [zmin, zmax]]; taken from the first batch if None.
+        :param growable: bool, whether the grid grows to cover samples outside the bounds.
+            If False, such samples are dropped and counted in num_dropped.
+        :param growth_margin: float, extra fraction of the grid size added on each growth step.
+        """
+        self.voxel_size = voxel_size
+        self.growable = growable
+        self.growth_margin = growth_margin
+        self.origin_idx = None
+        self.grid_shape = None
+        self.counts = None
+        self.metric_sums = {}
+        self.metric_counts = {}
+        self.num_samples = 0
+        self.num_dropped = 0
+        self.total_voxels = 0
+        self.history = []
+
+        if bounds is not None:
+            bounds = np.asarray(bounds, dtype=float)
+            self._allocate(
+                self._index_of(bounds[:, 0]).reshape(3),
+                self._index_of(bounds[:, 1]).reshape(3) + 1,
+            )
+
+    def _index_of(self, points):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        return np.floor(points / self.voxel_size).astype(np.int64)
+
+    def _allocate(self, lower, upper):
+        shape = tuple(int(n) for n in upper - lower)
+        counts = np.zeros(shape, dtype=np.int64)
+        metric_sums = {name: np.zeros(shape) for name in self.metric_sums}
+        metric_counts = {
+            name: np.zeros(shape, dtype=np.int64) for name in self.metric_counts
+        }
+
+        # Copy existing statistics into the new, larger grid
+        if self.counts is not None:
+            start = self.origin_idx - lower
+            block = tuple(
+                slice(int(s), int(s) + n) for s, n in zip(start, self.grid_shape)
+            )
+            counts[block] = self.counts
+            for name in self.metric_sums:
+                metric_sums[name][block] = self.metric_sums[name]
+                metric_counts[name][block] = self.metric_counts[name]
+
+        self.origin_idx = np.asarray(lower, dtype=np.int64)
+        self.grid_shape = shape
+        self.counts = counts
+        self.metric_sums = metric_sums
+        self.metric_counts = metric_counts
+
+    def _grow_to(self, lower, upper):
+        if self.counts is not None:
+            lower = np.minimum(lower, self.origin_idx)
+            upper = np.maximum(upper, self.origin_idx + self.grid_shape)
+        margin = np.ceil((upper - lower) * self.growth_margin).astype(np.int64)
+        self._allocate(lower - margin, upper + margin)
+
+    def _ensure_metric(self, metric):
+        if metric not in self.metric_sums:
+            self.metric_sums[metric] = np.zeros(self.grid_shape)
+            self.metric_counts[metric] = np.zeros(self.grid_shape, dtype=np.int64)
+
+    def add_samples(self, points, metric_values=None, metric=None):
+        """
+        Accumulate a batch of samples.
+
+        :param points: list of tuples, containing the x, y, z coordinates of the samples.
+        :param metric_values: list of floats, containing the metric values of the samples,
+            or an (N, M) array when several metrics are given.
+        :param metric: str or list of str, the name(s) of the metric(s).
+        :return: self
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        valid = ~np.isnan(points).any(axis=1)
+        indices = self._index_of(points[valid])
+        if metric is None or metric_values is None:
+            metrics = []
+        else:
+            metrics = [metric] if isinstance(metric, str) else list(metric)
+        if metrics:
+            values = np.asarray(metric_values, dtype=float).reshape(len(points), -1)
+            values = values[valid]
+        else:
+            values = np.zeros((len(indices), 0))
+
+        if len(indices) > 0:
+            lower, upper = indices.min(axis=0), indices.max(axis=0) + 1
+            if self.counts is None:
+                self._grow_to(lower, upper)
+            elif np.any(lower < self.origin_idx) or np.any(
+                upper > self.origin_idx + self.grid_shape
+            ):
+                if self.growable:
+                    self._grow_to(lower, upper)
+                else:
+                    inside = np.all(
+                        (indices >= self.origin_idx)
+                        & (indices < self.origin_idx + self.grid_shape),
+                        axis=1,
+                    )
+                    self.num_dropped += int(np.sum(~inside))
+                    indices = indices[inside]
+                    values = values[inside]
+
+        if len(indices) > 0:
+            flat = np.ravel_multi_index(
+                tuple((indices - self.origin_idx).T), self.grid_shape
+            )
+            voxel_ids, inverse, batch_counts = np.unique(
+                flat, return_inverse=True, return_counts=True
+            )
+            inverse = inverse.reshape(-1)
+            counts = self.counts.reshape(-1)
+            self.total_voxels += int(np.sum(counts[voxel_ids] == 0))
+            counts[voxel_ids] += batch_counts
+
+            # NaN metric values are skipped for that metric only
+            for column, name in enumerate(metrics):
+                self._ensure_metric(name)
+                has_value = ~np.isnan(values[:, column])
+                self.metric_sums[name].reshape(-1)[voxel_ids] += np.bincount(
+                    inverse[has_value],
+                    weights=values[has_value, column],
+                    minlength=len(voxel_ids),
+                )
+                self.metric_counts[name].reshape(-1)[voxel_ids] += np.bincount(
+                    inverse[has_value], minlength=len(voxel_ids)
+                )
+
+        self.num_samples += len(indices)
+        self.history.append((self.num_samples, self.total_volume))
+        return self
+
+    @property
+    def voxels(self):
+        """Boolean occupancy grid."""
+        if self.counts is None:
+            return np.zeros((0, 0, 0), dtype=bool)
+        return self.counts > 0
+
+    @property
+    def total_volume(self):
+        """Volume of the occupied voxels in m³."""
+        return self.total_voxels * (self.voxel_size**3)
+
+    @property
+    def ranges(self):
+        """Coordinate ranges covered by the grid, {"x": (min, max), ...}."""
+        if self.counts is None:
+            return None
+        lower = self.origin_idx * self.voxel_size
+        upper = (self.origin_idx + self.grid_shape) * self.voxel_size
+        return {coord: (lower[i], upper[i]) for i, coord in enumerate(["x", "y", "z"])}
+
+    def get_avg_metric(self, metric):
+        """
+        Get the per-voxel average of a metric.
+
+        :param metric: str, the name of the metric.
+        :return: np.ndarray of grid_shape, zero where the voxel has no samples of the metric.
+        """
+        if metric not in self.metric_sums:
+            available = list(self.metric_sums)
+            raise ValueError(f"Metric '{metric}' has not been accumulated. Available: {available}")
+        return np.divide(
+            self.metric_sums[metric],
+            self.metric_counts[metric],
+            out=np.zeros(self.grid_shape),
+            where=self.metric_counts[metric] > 0,
+        )
+
+    def relative_volume_change(self, window=1):
+        """
+        Relative change of the voxel volume over the last `window` batches.
+
+        :param window: int, the number of batches to look back.
+        :return: float, inf if there is not enough history or the volume is zero.
+        """
+        if len(self.history) <= window or self.history[-1][1] == 0:
+            return np.inf
+        current = self.history[-1][1]
+        previous = self.history[-1 - window][1]
+        return abs(current - previous) / current
+
+    def is_converged(self, tolerance=1e-2, window=1):
+        """
+        Check whether the voxel volume has stabilized.
+
+        :param tolerance: float, the relative volume change below which the volume counts as converged.
+        :param window: int, the number of batches to look back.
+        :return: bool
+        """
+        return self.relative_volume_change(window) <= tolerance
+
+    def to_dataframe(self):
+        """
+        Export the occupied voxels as a DataFrame of voxel centres, counts and average metrics.
+
+        The result can be passed on to VoxelData or SparseVoxelData.
+
+        :return: pd.DataFrame with columns x, y, z, count and one column per metric.
+        """
+        if self.counts is None:
+            return pd.DataFrame(columns=["x", "y", "z", "count"])
+        occupied = np.nonzero(self.counts)
+        centers = (np.stack(occupied, axis=1) + self.origin_idx + 0.5) * self.voxel_size
+        data = {
+            "x": centers[:, 0],
+            "y": centers[:, 1],
+            "z": centers[:, 2],
+            "count": self.counts[occupied],
+        }
+        for metric in self.metric_sums:
+            data[metric] = self.get_avg_metric(metric)[occupied]
+        return pd.DataFrame(data)
+
+    def get_statistics(self):
+        grid_size = int(np.prod(self.grid_shape)) if self.grid_shape else 0
+        return {
+            "total_data_points": self.num_samples,
+            "dropped_data_points": self.num_dropped,
+            "voxel_size": self.voxel_size,
+            "grid_dimensions": self.grid_shape,
+            "occupied_voxels": self.total_voxels,
+            "workspace_volume": self.total_volume,
+            "fill_ratio": self.total_voxels / grid_size if grid_size else 0.0,
+            "relative_volume_change": self.relative_volume_change(),
+            "metrics": list(self.metric_sums),
+        }
+
+    def print_statistics(self):
+        stats = self.get_statistics()
+        print(f"\nVoxel Accumulator Statistics:")
+        print(f"├─ Metrics: {stats['metrics']}")
+        print(f"├─ Total data points: {stats['total_data_points']:,}")
+        print(f"├─ Dropped data points: {stats['dropped_data_points']:,}")
+        print(f"├─ Voxel size: {stats['voxel_size']:.3f} m")
+        print(f"├─ Grid dimensions: {stats['grid_dimensions']}")
+        print(f"├─ Occupied voxels: {stats['occupied_voxels']:,}")
+        print(f"├─ Workspace volume: {stats['workspace_volume']:.4f} m³")
+        print(f"├─ Fill ratio: {stats['fill_ratio']:.3%}")
+        print(f"└─ Relative volume change: {stats['relative_volume_change']:.3%}")
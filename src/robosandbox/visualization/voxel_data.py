@@ -1,28 +1,54 @@
 import numpy as np
 import pandas as pd
-from matplotlib.colors import Normalize
-import matplotlib.pyplot as plt
+
+# matplotlib is slow to import, it is imported by the plotting methods only
 
 
 class VoxelData:
     def __init__(self, df, voxel_size=0.05, method="order_independent_manipulability"):
+        """
+        :param df: DataFrame with x, y, z columns and one column per metric.
+        :param voxel_size: float, the edge length of a voxel in meters.
+        :param method: str or list of str, the metric column(s) to aggregate. All metrics
+            are binned in one pass; the first one is displayed by default.
+        """
         self.df = df
         self.voxel_size = voxel_size
-        self.method = method
+        self.methods = [method] if isinstance(method, str) else list(method)
+        self.method = self.methods[0] if self.methods else None
         self.voxels = None
-        self.avg_metric = None
+        self.count_values = None
+        self.avg_metrics = {}
         self.grid_shape = None
         self.ranges = None
         self.total_voxels = None
         self.total_volume = None
-        
+
         self._validate_method()
         self._create_voxel_workspace()
-        
+
+    @property
+    def avg_metric(self):
+        return self.avg_metrics[self.method]
+
     def _validate_method(self):
-        if self.method not in self.df.columns:
+        if not self.methods:
+            raise ValueError("At least one method must be given.")
+        missing = [method for method in self.methods if method not in self.df.columns]
+        if missing:
             available_columns = list(self.df.columns)
-            raise ValueError(f"Method '{self.method}' not found in DataFrame columns. Available: {available_columns}")
+            raise ValueError(
+                f"Method '{missing[0]}' not found in DataFrame columns. Available: {available_columns}"
+            )
+
+    def _resolve_method(self, method):
+        if method is None:
+            return self.method
+        if method not in self.methods:
+            raise ValueError(
+                f"Method '{method}' was not aggregated. Available: {self.methods}"
+            )
+        return method
 
     def _get_coordinate_ranges(self):
         coords = ["x", "y", "z"]
@@ -33,35 +59,50 @@ class VoxelData:
         indices = {}
         for coord in coords:
             min_val, max_val = self.ranges[coord]
-            indices[f"{coord}_idx"] = ((self.df[coord] - min_val) / self.voxel_size).astype(int)
+            indices[f"{coord}_idx"] = (
+                (self.df[coord].to_numpy(dtype=float) - min_val) / self.voxel_size
+            ).astype(int)
         return indices
 
     def _initialize_grids(self, indices):
         coords = ["x", "y", "z"]
-        self.grid_shape = tuple(indices[f"{coord}_idx"].max() + 1 for coord in coords)
-        self.voxels = np.zeros(self.grid_shape, dtype=bool)
-        metric_sum = np.zeros(self.grid_shape)
-        count_values = np.zeros(self.grid_shape, dtype=int)
-        return metric_sum, count_values
-
-    def _populate_voxel_data(self, indices, metric_sum, count_values):
-        for i in range(len(self.df)):
-            x_idx = indices["x_idx"][i]
-            y_idx = indices["y_idx"][i]
-            z_idx = indices["z_idx"][i]
-
-            self.voxels[x_idx, y_idx, z_idx] = True
-            metric_sum[x_idx, y_idx, z_idx] += self.df.iloc[i][self.method]
-            count_values[x_idx, y_idx, z_idx] += 1
-
-    def _calculate_average_metric(self, metric_sum, count_values):
+        self.grid_shape = tuple(
+            int(indices[f"{coord}_idx"].max()) + 1 for coord in coords
+        )
+        flat_indices = np.ravel_multi_index(
+            tuple(indices[f"{coord}_idx"] for coord in coords), self.grid_shape
+        )
+        return flat_indices
+
+    def _populate_voxel_data(self, flat_indices):
+        grid_size = int(np.prod(self.grid_shape))
+        self.count_values = np.bincount(flat_indices, minlength=grid_size).reshape(
+            self.grid_shape
+        )
+        self.voxels = self.count_values > 0
+
+        # One stats tensor per metric; NaN entries are skipped for that metric only
+        metric_sums, metric_counts = {}, {}
+        for method in self.methods:
+            values = self.df[method].to_numpy(dtype=float)
+            has_value = ~np.isnan(values)
+            metric_sums[method] = np.bincount(
+                flat_indices[has_value], weights=values[has_value], minlength=grid_size
+            ).reshape(self.grid_shape)
+            metric_counts[method] = np.bincount(
+                flat_indices[has_value], minlength=grid_size
+            ).reshape(self.grid_shape)
+        return metric_sums, metric_counts
+
+    def _calculate_average_metric(self, metric_sums, metric_counts):
         with np.errstate(divide="ignore", invalid="ignore"):
-            self.avg_metric = np.divide(
-                metric_sum,
-                count_values,
-                out=np.zeros_like(metric_sum),
-                where=count_values > 0,
-            )
+            for method in self.methods:
+                self.avg_metrics[method] = np.divide(
+                    metric_sums[method],
+                    metric_counts[method],
+                    out=np.zeros_like(metric_sums[method]),
+                    where=metric_counts[method] > 0,
+                )
 
     def _calculate_volume_stats(self):
         self.total_voxels = np.sum(self.voxels)
@@ -70,38 +111,71 @@ class VoxelData:
     def _create_voxel_workspace(self):
         self.ranges = self._get_coordinate_ranges()
         indices = self._calculate_voxel_indices()
-        metric_sum, count_values = self._initialize_grids(indices)
-        self._populate_voxel_data(indices, metric_sum, count_values)
-        self._calculate_average_metric(metric_sum, count_values)
+        flat_indices = self._initialize_grids(indices)
+        metric_sums, metric_counts = self._populate_voxel_data(flat_indices)
+        self._calculate_average_metric(metric_sums, metric_counts)
         self._calculate_volume_stats()
 
-    def _get_metric_range(self):
-        return (self.df[self.method].min(), self.df[self.method].max())
+    def get_avg_metric(self, points=None, fill_value=np.nan, method=None):
+        """
+        Get the average metric of the voxel containing each point, with the same
+        signature as SparseVoxelData.get_avg_metric.
+
+        :param points: array-like of shape (N, 3), the x, y, z coordinates. If None, the
+            whole grid is returned.
+        :param fill_value: float, the value returned for points in empty voxels or
+            outside the grid.
+        :param method: str, the metric name (default: the displayed metric).
+        :return: np.ndarray of shape (N,), or of grid_shape with zero for empty voxels
+            if points is None.
+        """
+        avg_metric = self.avg_metrics[self._resolve_method(method)]
+        if points is None:
+            return avg_metric
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        lower = np.array([self.ranges[coord][0] for coord in ["x", "y", "z"]])
+        indices = np.floor((points - lower) / self.voxel_size).astype(int)
+        inside = np.all((indices >= 0) & (indices < self.grid_shape), axis=1)
+        result = np.full(len(points), fill_value, dtype=float)
+        index = tuple(indices[inside].T)
+        result[np.flatnonzero(inside)[self.voxels[index]]] = avg_metric[index][
+            self.voxels[index]
+        ]
+        return result
+
+    def _get_metric_range(self, method):
+        return (self.df[method].min(), self.df[method].max())
 
     def _create_color_mapping(self, metric_range, cmap_name):
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import Normalize
+
         norm = Normalize(vmin=metric_range[0], vmax=metric_range[1])
-        cmap = plt.cm.get_cmap(cmap_name)
+        cmap = plt.get_cmap(cmap_name)
         return norm, cmap
 
-    def _apply_colors_to_voxels(self, norm, cmap, alpha):
+    def _apply_colors_to_voxels(self, norm, cmap, alpha, method):
         colors = np.zeros(self.voxels.shape + (4,))
         valid_voxels = np.where(self.voxels)
-        
+
         if len(valid_voxels[0]) > 0:
-            metric_values = self.avg_metric[valid_voxels]
+            metric_values = self.avg_metrics[method][valid_voxels]
             rgba_colors = cmap(norm(metric_values))
             rgba_colors[:, 3] = alpha
             colors[valid_voxels] = rgba_colors
-            
+
         return colors
 
-    def create_colors(self, cmap_name="viridis", alpha=0.7):
-        metric_range = self._get_metric_range()
+    def create_colors(self, cmap_name="viridis", alpha=0.7, method=None):
+        method = self._resolve_method(method)
+        metric_range = self._get_metric_range(method)
         norm, cmap = self._create_color_mapping(metric_range, cmap_name)
-        colors = self._apply_colors_to_voxels(norm, cmap, alpha)
+        colors = self._apply_colors_to_voxels(norm, cmap, alpha, method)
         return colors, norm, cmap
 
     def _setup_plot_figure(self, figsize):
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=figsize)
         ax = fig.add_subplot(111, projection="3d")
         return fig, ax
@@ -138,13 +212,17 @@ class VoxelData:
             tick_positions, tick_labels = self._calculate_axis_ticks(i, min_val, max_val)
             self._set_axis_properties(ax, coord, tick_positions, tick_labels)
 
-    def _add_colorbar(self, ax, norm, cmap):
+    def _add_colorbar(self, ax, norm, cmap, method):
+        import matplotlib.pyplot as plt
+
         sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
         sm.set_array([])
-        label = self.method.replace("_", " ").title()
+        label = method.replace("_", " ").title()
         plt.colorbar(sm, ax=ax, label=label, shrink=0.8)
 
     def _add_title(self):
+        import matplotlib.pyplot as plt
+
         title = (
             f"Robot Workspace Voxel Representation\n"
             f"Voxels: {self.total_voxels:,} | "
@@ -153,17 +231,21 @@ class VoxelData:
         )
         plt.title(title)
 
-    def plot(self, figsize=(12, 9), cmap_name="viridis", alpha=0.7):
-        colors, norm, cmap = self.create_colors(cmap_name, alpha)
+    def plot(self, figsize=(12, 9), cmap_name="viridis", alpha=0.7, method=None):
+        import matplotlib.pyplot as plt
+
+        method = self._resolve_method(method)
+        colors, norm, cmap = self.create_colors(cmap_name, alpha, method)
         fig, ax = self._setup_plot_figure(figsize)
         self._draw_voxels(ax, colors)
         self._configure_axes(ax)
-        self._add_colorbar(ax, norm, cmap)
+        self._add_colorbar(ax, norm, cmap, method)
         self._add_title()
         plt.tight_layout()
         return fig
 
-    def get_statistics(self):
+    def get_statistics(self, method=None):
+        method = self._resolve_method(method)
         fill_ratio = self.total_voxels / np.prod(self.grid_shape)
         return {
             "total_data_points": len(self.df),
@@ -172,11 +254,14 @@ class VoxelData:
             "occupied_voxels": self.total_voxels,
             "workspace_volume": self.total_volume,
             "fill_ratio": fill_ratio,
-            "method": self.method
+            "method": method,
+            "metric_mean": float(np.mean(self.avg_metrics[method][self.voxels]))
+            if self.total_voxels
+            else 0.0,
         }
 
-    def print_statistics(self):
-        stats = self.get_statistics()
+    def print_statistics(self, method=None):
+        stats = self.get_statistics(method)
         print(f"\nWorkspace Statistics:")
         print(f"├─ Method: {stats['method']}")
         print(f"├─ Total data points: {stats['total_data_points']:,}")
@@ -184,7 +269,8 @@ class VoxelData:
         print(f"├─ Grid dimensions: {stats['grid_dimensions']}")
         print(f"├─ Occupied voxels: {stats['occupied_voxels']:,}")
         print(f"├─ Workspace volume: {stats['workspace_volume']:.4f} m³")
-        print(f"└─ Fill ratio: {stats['fill_ratio']:.3%}")
+        print(f"├─ Fill ratio: {stats['fill_ratio']:.3%}")
+        print(f"└─ Mean voxel {stats['method']}: {stats['metric_mean']:.4f}")
 
 
 def create_test_data(n_points=1000):
@@ -229,6 +315,8 @@ def create_test_data(n_points=1000):
 
 def test_voxel_data():
     """Test function to validate VoxelData class functionality."""
+    import matplotlib.pyplot as plt
+
     print("=" * 60)
     print("Testing VoxelData Class")
     print("=" * 60)
@@ -0,0 +1,211 @@
+"""
+Server-side cache of sampled workspaces for the Dash apps.
+
+A workspace analysis samples joint configurations until the global indice converges.
+The samples are kept with their positions and the singular values of their Jacobian, so
+switching the metric, the axes or the normalization only re-aggregates cached data.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from robosandbox.performance.workspace import WorkSpace
+
+# Rows of the geometric Jacobian used for each choice of axes
+AXES_ROWS = {"all": slice(0, 6), "trans": slice(0, 3), "rot": slice(3, 6)}
+
+
+def jacobian_singular_values(robot, joint_points):
+    """
+    Singular values of the Jacobian at each joint configuration, for every choice of axes.
+    :param robot: robot with a jacob0 method, or a vectorized jacob0_batch.
+    :param joint_points: list of joint configurations.
+    :return: dict mapping "all", "trans" and "rot" to arrays of shape (N, k).
+    """
+    if hasattr(robot, "jacob0_batch") and len(joint_points) > 0:
+        jacobians = robot.jacob0_batch(joint_points)
+    else:
+        jacobians = np.array([robot.jacob0(point) for point in joint_points])
+    if len(jacobians) == 0:
+        jacobians = np.zeros((0, 6, robot.n))
+    return {
+        axes: np.linalg.svd(jacobians[:, rows], compute_uv=False)
+        for axes, rows in AXES_ROWS.items()
+    }
+
+
+def indice_from_singular_values(singular_values, method, axes="all"):
+    """
+    Manipulability indices from Jacobian singular values, as robot.manipulability computes them.
+    :param singular_values: array of shape (N, k), sorted in decreasing order.
+    :param method: str, "yoshikawa" or "invcondition".
+    :param axes: str, the axes the singular values were computed for.
+    :return: np.ndarray of shape (N,).
+    """
+    num_rows = AXES_ROWS[axes].stop - AXES_ROWS[axes].start
+    if method == "yoshikawa":
+        # sqrt(det(J J^T)), zero when J has more rows than joints
+        if singular_values.shape[1] < num_rows:
+            return np.zeros(len(singular_values))
+        return np.prod(singular_values, axis=1)
+    if method == "invcondition":
+        largest = singular_values[:, 0]
+        return np.divide(
+            singular_values[:, -1],
+            largest,
+            out=np.zeros(len(singular_values)),
+            where=largest > 0,
+        )
+    raise ValueError(f"Unknown singular value indice: {method}")
+
+
+SINGULAR_VALUE_INDICES = ["yoshikawa", "invcondition"]
+
+
+class WorkSpaceSamples:
+    """
+    Joint samples of a robot with their positions and Jacobian singular values.
+    """
+
+    def __init__(self, settings=None):
+        """
+        :param settings: optional, the sampling settings the samples were drawn with.
+        """
+        self.settings = settings
+        self.joint_points = []
+        self.points = np.zeros((0, 3))
+        self.singular_values = {axes: [] for axes in AXES_ROWS}
+
+    def add_joint_points(self, robot, joint_points):
+        """
+        Record joint configurations and the singular values of their Jacobian.
+        :return: dict of singular values of the new samples, see jacobian_singular_values.
+        """
+        singular_values = jacobian_singular_values(robot, joint_points)
+        self.joint_points.extend(joint_points)
+        for axes, values in singular_values.items():
+            self.singular_values[axes].append(values)
+        return singular_values
+
+    def __len__(self):
+        return len(self.joint_points)
+
+    def indice(self, method, axes="all"):
+        """
+        Indice values of all samples.
+        :param method: str, "yoshikawa" or "invcondition".
+        :param axes: str, "all", "trans" or "rot".
+        :return: np.ndarray of shape (N,).
+        """
+        singular_values = self.singular_values[axes]
+        if len(singular_values) > 1:
+            # Merge the batches once
+            singular_values[:] = [np.concatenate(singular_values)]
+        return indice_from_singular_values(singular_values[0], method, axes)
+
+    def to_workspace(self, robot, method, axes="all"):
+        """
+        Workspace holding the cached samples, with the values of one indice.
+        :return: WorkSpace
+        """
+        ws = WorkSpace(robot)
+        ws.add_samples(
+            points=self.points,
+            metric_values=self.indice(method, axes),
+            metric=method,
+        )
+        return ws
+
+
+class RecordingWorkSpace(WorkSpace):
+    """
+    WorkSpace that records the samples drawn by global_indice in a WorkSpaceSamples.
+
+    The Jacobian of each sample is evaluated once, and the singular value indices are
+    derived from its singular values.
+    """
+
+    def __init__(self, robot, samples):
+        """
+        :param robot: the robot.
+        :param samples: WorkSpaceSamples, filled while sampling.
+        """
+        super().__init__(robot)
+        self.samples = samples
+
+    def local_indice(self, method: str, *args, joint_points=None, axes="all", **kwargs):
+        if method not in SINGULAR_VALUE_INDICES or joint_points is None:
+            return super().local_indice(
+                method, *args, joint_points=joint_points, axes=axes, **kwargs
+            )
+        singular_values = self.samples.add_joint_points(self.robot, joint_points)
+        return indice_from_singular_values(singular_values[axes], method, axes)
+
+    def add_samples(self, points, metric_values=None, metric=None):
+        super().add_samples(points, metric_values, metric)
+        self.samples.points = self.df[["x", "y", "z"]].to_numpy(dtype=float)
+
+
+class WorkSpaceCache:
+    """
+    Size-bounded, least-recently-used cache of WorkSpaceSamples.
+
+    Entries live in memory, or in a diskcache.Cache when one is given, so that the
+    background job processes of the apps share them.
+    """
+
+    def __init__(self, max_entries=16, cache=None, name="workspace_samples"):
+        """
+        :param max_entries: int, the maximum number of cached workspaces.
+        :param cache: diskcache.Cache, optional, the shared cache.
+        :param name: str, the prefix of the keys in the shared cache.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.cache = cache
+        self.name = name
+        self._entries = OrderedDict()
+
+    def _mark_used(self, key):
+        # Move key to the most recent end of the shared order, evicting the oldest entries
+        order = [k for k in self.cache.get(self.name, []) if k != key] + [key]
+        for old_key in order[: -self.max_entries]:
+            self.cache.delete((self.name, old_key))
+        self.cache.set(self.name, order[-self.max_entries :])
+
+    def get(self, key):
+        """
+        :param key: hashable key, e.g. (robot selection, link lengths, alpha).
+        :return: WorkSpaceSamples, or None if the key is not cached.
+        """
+        if self.cache is None:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        with self.cache.transact():
+            samples = self.cache.get((self.name, key))
+            if samples is not None:
+                self._mark_used(key)
+        return samples
+
+    def put(self, key, samples):
+        """
+        Store samples, evicting the least recently used entries beyond max_entries.
+        """
+        if self.cache is None:
+            self._entries[key] = samples
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return
+        with self.cache.transact():
+            self.cache.set((self.name, key), samples)
+            self._mark_used(key)
+
+    def __len__(self):
+        if self.cache is None:
+            return len(self._entries)
+        return len(self.cache.get(self.name, []))
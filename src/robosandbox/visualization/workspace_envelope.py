@@ -0,0 +1,347 @@
+import itertools
+import numpy as np
+import plotly.graph_objects as go
+from scipy import ndimage
+from robosandbox.visualization.mesh_export import export_mesh, save_ply, save_stl
+
+try:
+    from skimage.measure import marching_cubes as _skimage_marching_cubes
+except ImportError:
+    _skimage_marching_cubes = None
+
+
+# Cube corners, corner c sits at offset (c & 1, (c >> 1) & 1, (c >> 2) & 1)
+CORNER_OFFSETS = np.array([[c & 1, (c >> 1) & 1, (c >> 2) & 1] for c in range(8)])
+
+# Kuhn decomposition of the cube into six tetrahedra sharing the diagonal 0-7. All
+# cubes are split the same way, so the faces of neighboring cubes match up.
+KUHN_TETRAHEDRA = np.array(
+    [
+        [0, a, a | b, 7]
+        for a, b, _ in itertools.permutations([1, 2, 4])
+    ]
+)
+
+TETRAHEDRON_EDGES = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+
+
+def _edge(a, b):
+    return TETRAHEDRON_EDGES.index((min(a, b), max(a, b)))
+
+
+def _tetrahedron_cases():
+    # Triangles (as triples of tetrahedron edges) for each of the 16 inside/outside cases
+    cases = []
+    for case in range(16):
+        inside = [v for v in range(4) if case >> v & 1]
+        outside = [v for v in range(4) if not case >> v & 1]
+        if len(inside) in (0, 4):
+            cases.append([])
+        elif len(inside) in (1, 3):
+            lone = inside[0] if len(inside) == 1 else outside[0]
+            others = [v for v in range(4) if v != lone]
+            cases.append([[_edge(lone, v) for v in others]])
+        else:
+            (a, b), (c, d) = inside, outside
+            quad = [_edge(a, c), _edge(a, d), _edge(b, d), _edge(b, c)]
+            cases.append([[quad[0], quad[1], quad[2]], [quad[0], quad[2], quad[3]]])
+    return cases
+
+
+TETRAHEDRON_CASES = _tetrahedron_cases()
+
+
+def marching_tetrahedra(field, level=0.5):
+    """
+    Extract the isosurface field == level as a closed, welded triangle mesh.
+
+    Every cube of the grid is split into six tetrahedra, so the surface has about twice
+    as many triangles as marching cubes, but needs no 256-case table and no ambiguity
+    resolution. Triangles are oriented with their normals pointing out of the
+    region field >= level.
+
+    :param field: np.ndarray of shape (nx, ny, nz).
+    :param level: float, the iso value.
+    :return: (vertices, faces), (V, 3) float vertices in index coordinates and (F, 3) int faces.
+    """
+    field = np.asarray(field, dtype=float)
+    inside = field >= level
+    n = np.array(field.shape) - 1
+    if np.any(n < 1):
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+
+    # Only cubes with both inside and outside corners contribute
+    inside_count = sum(
+        inside[dx : dx + n[0], dy : dy + n[1], dz : dz + n[2]].astype(np.int8)
+        for dx, dy, dz in CORNER_OFFSETS
+    )
+    cubes = np.argwhere((inside_count > 0) & (inside_count < 8))
+    corners = cubes[:, None, :] + CORNER_OFFSETS[None, :, :]
+    corner_ids = np.ravel_multi_index(
+        tuple(corners.reshape(-1, 3).T), field.shape
+    ).reshape(-1, 8)
+    tetrahedra = corner_ids[:, KUHN_TETRAHEDRA].reshape(-1, 4)
+    tetrahedra_inside = inside.reshape(-1)[tetrahedra]
+    cases = tetrahedra_inside @ np.array([1, 2, 4, 8])
+
+    edges = np.array(TETRAHEDRON_EDGES)
+    triangle_edges, triangle_tetrahedra = [], []
+    for case, triangles in enumerate(TETRAHEDRON_CASES):
+        if not triangles:
+            continue
+        selected = np.nonzero(cases == case)[0]
+        for triangle in triangles:
+            ends = tetrahedra[selected][:, edges[triangle]]  # (K, 3, 2) grid point ids
+            triangle_edges.append(ends)
+            triangle_tetrahedra.append(selected)
+    if not triangle_edges:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    triangle_edges = np.concatenate(triangle_edges)
+    triangle_tetrahedra = np.concatenate(triangle_tetrahedra)
+
+    # Weld vertices: one vertex per grid edge crossing the surface
+    ends = np.sort(triangle_edges.reshape(-1, 2), axis=1)
+    edge_keys = ends[:, 0] * field.size + ends[:, 1]
+    _, first, faces = np.unique(
+        edge_keys, return_index=True, return_inverse=True
+    )
+    faces = faces.reshape(-1, 3)
+    a, b = ends[first, 0], ends[first, 1]
+    values = field.reshape(-1)
+    t = (level - values[a]) / (values[b] - values[a])
+    points_a = np.stack(np.unravel_index(a, field.shape), axis=1)
+    points_b = np.stack(np.unravel_index(b, field.shape), axis=1)
+    vertices = points_a + t[:, None] * (points_b - points_a)
+
+    # Orient each triangle from the inside corners of its tetrahedron to the outside ones
+    tetrahedron_points = np.stack(
+        np.unravel_index(tetrahedra[triangle_tetrahedra], field.shape), axis=-1
+    )
+    weights = tetrahedra_inside[triangle_tetrahedra]
+    inside_center = np.sum(tetrahedron_points * weights[..., None], axis=1) / np.sum(
+        weights, axis=1, keepdims=True
+    )
+    outside_center = np.sum(tetrahedron_points * ~weights[..., None], axis=1) / np.sum(
+        ~weights, axis=1, keepdims=True
+    )
+    corners = vertices[faces]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    flip = np.einsum("ij,ij->i", normals, outside_center - inside_center) < 0
+    faces[flip] = faces[flip][:, ::-1]
+    return vertices, faces
+
+
+def marching_cubes(field, level=0.5):
+    """
+    Extract the isosurface field == level, using scikit-image when it is installed and
+    the numpy marching tetrahedra otherwise.
+
+    :param field: np.ndarray of shape (nx, ny, nz).
+    :param level: float, the iso value.
+    :return: (vertices, faces), (V, 3) float vertices in index coordinates and (F, 3) int faces.
+    """
+    if _skimage_marching_cubes is None:
+        return marching_tetrahedra(field, level)
+    field = np.asarray(field, dtype=float)
+    if field.min() > level or field.max() < level:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    vertices, faces, _, _ = _skimage_marching_cubes(field, level=level)
+    faces = faces.astype(np.int64)
+    # Match the outward orientation of marching_tetrahedra (positive enclosed volume)
+    corners = vertices[faces]
+    if np.einsum("ij,ij->", corners[:, 0], np.cross(corners[:, 1], corners[:, 2])) < 0:
+        faces = faces[:, ::-1]
+    return vertices, faces
+
+
+class WorkSpaceEnvelope:
+    """
+    Triangle mesh of the workspace boundary, extracted from voxel occupancy.
+
+    The occupancy grid of a VoxelData (optionally smoothed into a density field) is
+    padded with empty voxels and contoured at `level`, so the mesh is always closed.
+    Vertices carry the metric interpolated from the neighboring occupied voxels.
+    """
+
+    def __init__(self, vertices, faces, intensity=None, method=None):
+        """
+        :param vertices: array-like of shape (V, 3), the vertex coordinates in meters.
+        :param faces: array-like of shape (F, 3), the vertex indices of each triangle.
+        :param intensity: array-like of shape (V,), optional, a value per vertex for coloring.
+        :param method: str, optional, the name of the metric stored in intensity.
+        """
+        self.vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+        self.faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+        self.intensity = None if intensity is None else np.asarray(intensity, dtype=float)
+        self.method = method
+
+    @classmethod
+    def from_voxel_data(cls, voxel_data, smoothing=0.0, level=0.5, method=None):
+        """
+        Extract the envelope of a VoxelData.
+
+        :param voxel_data: VoxelData, the binned workspace.
+        :param smoothing: float, standard deviation in voxels of the Gaussian applied to
+            the occupancy before contouring; 0 contours the raw occupancy.
+        :param level: float, the iso value between 0 (empty) and 1 (occupied).
+        :param method: str, the metric used for the vertex intensity (default: the displayed metric).
+        :return: WorkSpaceEnvelope
+        """
+        method = voxel_data._resolve_method(method)
+        occupancy = np.pad(voxel_data.voxels.astype(float), 1)
+        if smoothing > 0:
+            occupancy = ndimage.gaussian_filter(occupancy, smoothing)
+        vertices, faces = marching_cubes(occupancy, level)
+
+        # Normalized convolution spreads the metric of occupied voxels onto the surface
+        weights = np.pad(voxel_data.voxels.astype(float), 1)
+        metric = np.pad(voxel_data.get_avg_metric(method=method), 1) * weights
+        sigma = max(smoothing, 1.0)
+        weights = ndimage.gaussian_filter(weights, sigma)
+        metric = ndimage.gaussian_filter(metric, sigma)
+        intensity = ndimage.map_coordinates(
+            metric, vertices.T, order=1
+        ) / np.maximum(ndimage.map_coordinates(weights, vertices.T, order=1), 1e-12)
+
+        # Voxel centres: index i (padded i + 1) lies at min + (i + 0.5) * voxel_size
+        lower = np.array([voxel_data.ranges[coord][0] for coord in ["x", "y", "z"]])
+        vertices = lower + (vertices - 0.5) * voxel_data.voxel_size
+        return cls(vertices, faces, intensity, method)
+
+    @classmethod
+    def from_workspace(cls, workspace, voxel_size=0.05, method=None, smoothing=0.0, level=0.5):
+        """
+        Bin the samples of a WorkSpace and extract their envelope.
+
+        :param workspace: WorkSpace, or any object with an x, y, z DataFrame in `df`.
+        :param voxel_size: float, the edge length of a voxel in meters.
+        :param method: str, the metric column used for coloring (default: the first numeric
+            column other than x, y, z).
+        :param smoothing: float, see from_voxel_data.
+        :param level: float, see from_voxel_data.
+        :return: WorkSpaceEnvelope
+        """
+        from robosandbox.visualization.voxel_data import VoxelData
+
+        if method is None:
+            metrics = [
+                column
+                for column in workspace.df.select_dtypes("number").columns
+                if column not in ("x", "y", "z")
+            ]
+            if not metrics:
+                raise ValueError(
+                    "The workspace has no metric column, pass one as method"
+                )
+            method = metrics[0]
+        voxel_data = VoxelData(workspace.df, voxel_size=voxel_size, method=method)
+        return cls.from_voxel_data(voxel_data, smoothing=smoothing, level=level)
+
+    def get_volume(self):
+        """
+        Enclosed volume of the mesh by the divergence theorem.
+
+        :return: float, the volume in m³.
+        """
+        corners = self.vertices[self.faces]
+        return float(
+            np.sum(np.einsum("ij,ij->i", corners[:, 0], np.cross(corners[:, 1], corners[:, 2])))
+            / 6
+        )
+
+    def get_surface_area(self):
+        """
+        :return: float, the surface area in m².
+        """
+        corners = self.vertices[self.faces]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        return float(np.sum(np.linalg.norm(normals, axis=1)) / 2)
+
+    def to_mesh3d(self, colorscale="Viridis", opacity=0.5, show_colorbar=True, color=None):
+        """
+        Build a single go.Mesh3d trace of the envelope.
+
+        :param colorscale: str, the colorscale for the vertex intensity.
+        :param opacity: float, the mesh opacity.
+        :param show_colorbar: bool, whether to show the intensity colorbar.
+        :param color: str, optional, a uniform color used instead of the intensity.
+        :return: go.Mesh3d
+        """
+        trace = go.Mesh3d(
+            x=self.vertices[:, 0],
+            y=self.vertices[:, 1],
+            z=self.vertices[:, 2],
+            i=self.faces[:, 0],
+            j=self.faces[:, 1],
+            k=self.faces[:, 2],
+            opacity=opacity,
+            flatshading=False,
+        )
+        if color is not None or self.intensity is None:
+            trace.color = color
+        else:
+            trace.intensity = self.intensity
+            trace.colorscale = colorscale
+            trace.showscale = show_colorbar
+            if show_colorbar:
+                trace.colorbar = dict(title=dict(text=self.method))
+        return trace
+
+    def plot(self, fig=None, isShow=True, **kwargs):
+        """
+        Add the envelope to a figure.
+
+        :param fig: go.Figure, optional, the figure to draw into.
+        :param isShow: bool, whether to show the figure.
+        :param kwargs: additional keyword arguments for to_mesh3d.
+        :return: go.Figure
+        """
+        if fig is None:
+            fig = go.Figure()
+        fig.add_trace(self.to_mesh3d(**kwargs))
+        fig.update_layout(scene=dict(aspectmode="data"))
+        if isShow:
+            fig.show()
+        return fig
+
+    def save_stl(self, save_path):
+        """
+        Export the envelope as a binary STL file.
+
+        :param save_path: str, the output path.
+        """
+        save_stl(self.vertices, self.faces, save_path)
+
+    def save_ply(self, save_path):
+        """
+        Export the envelope as a binary PLY file, with the intensity as a vertex property.
+
+        :param save_path: str, the output path.
+        """
+        save_ply(self.vertices, self.faces, save_path, intensity=self.intensity)
+
+    def export_mesh(self, save_path):
+        """
+        Export the envelope, the format follows the extension (.stl, .ply or .obj).
+
+        :param save_path: str, the output path.
+        """
+        export_mesh(self.vertices, self.faces, save_path, intensity=self.intensity)
+
+    def get_statistics(self):
+        return {
+            "vertices": len(self.vertices),
+            "faces": len(self.faces),
+            "enclosed_volume": self.get_volume(),
+            "surface_area": self.get_surface_area(),
+            "method": self.method,
+        }
+
+    def print_statistics(self):
+        stats = self.get_statistics()
+        print(f"\nWorkspace Envelope Statistics:")
+        print(f"├─ Method: {stats['method']}")
+        print(f"├─ Vertices: {stats['vertices']:,}")
+        print(f"├─ Faces: {stats['faces']:,}")
+        print(f"├─ Enclosed volume: {stats['enclosed_volume']:.4f} m³")
+        print(f"└─ Surface area: {stats['surface_area']:.4f} m²")
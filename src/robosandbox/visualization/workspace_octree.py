@@ -0,0 +1,307 @@
+import numpy as np
+import pandas as pd
+from robosandbox.visualization.sparse_voxel_data import (
+    MAX_INDEX,
+    NEIGHBOR_OFFSETS,
+    pack_voxel_keys,
+)
+
+# Deepest level whose cell indices 0 .. 2**level - 1 fit in a packed voxel key
+MAX_DEPTH = (MAX_INDEX + 1).bit_length() - 1
+
+
+class WorkSpaceOctree:
+    """
+    Multi-resolution (octree) representation of a workspace.
+
+    The root node is a cube enclosing all samples. Level l splits it into 2**l cells
+    per axis and only occupied cells are stored, one sorted array of packed keys per
+    level. Every node holds the sample count and the sum, mean, min and max of each metric.
+    """
+
+    def __init__(self, df, max_depth=6, method=None, bounds=None):
+        """
+        :param df: DataFrame with x, y, z columns and metric columns, e.g. WorkSpace.df.
+        :param max_depth: int, the finest level; leaves have edge length root_size / 2**max_depth.
+        :param method: str or list of str, the metric column(s) to aggregate
+            (default: all numeric columns other than x, y, z).
+        :param bounds: optional, [[xmin, xmax], [ymin, ymax], [zmin, zmax]] the root cube must enclose.
+        """
+        if not 0 <= max_depth <= MAX_DEPTH:
+            raise ValueError(f"max_depth must be between 0 and {MAX_DEPTH}")
+        self.df = df
+        self.max_depth = max_depth
+        if method is None:
+            self.methods = [
+                column
+                for column in df.select_dtypes("number").columns
+                if column not in ("x", "y", "z")
+            ]
+        else:
+            self.methods = [method] if isinstance(method, str) else list(method)
+        self.levels = []
+
+        self._validate_method()
+        points = self.df[["x", "y", "z"]].to_numpy(dtype=float)
+        points_valid = ~np.isnan(points).any(axis=1)
+        self._set_root(points[points_valid], bounds)
+        self._build(points[points_valid], points_valid)
+
+    @classmethod
+    def from_workspace(cls, workspace, max_depth=6, method=None, bounds=None):
+        """Build the octree from the samples of a WorkSpace."""
+        return cls(workspace.df, max_depth=max_depth, method=method, bounds=bounds)
+
+    @classmethod
+    def from_voxel_data(cls, voxel_data, max_depth=6, bounds=None):
+        """Build the octree from the samples and metrics of a VoxelData."""
+        return cls(
+            voxel_data.df, max_depth=max_depth, method=voxel_data.methods, bounds=bounds
+        )
+
+    def _validate_method(self):
+        missing = [method for method in self.methods if method not in self.df.columns]
+        if missing:
+            available_columns = list(self.df.columns)
+            raise ValueError(
+                f"Method '{missing[0]}' not found in DataFrame columns. Available: {available_columns}"
+            )
+
+    def _set_root(self, points, bounds):
+        if bounds is not None:
+            bounds = np.asarray(bounds, dtype=float)
+            lower, upper = bounds[:, 0], bounds[:, 1]
+        elif len(points) > 0:
+            lower, upper = points.min(axis=0), points.max(axis=0)
+        else:
+            lower, upper = np.zeros(3), np.zeros(3)
+        self.root_size = max(float(np.max(upper - lower)), 1e-9) * (1 + 1e-9)
+        center = (lower + upper) / 2
+        self.root_origin = center - self.root_size / 2
+
+    def node_size(self, level):
+        """Edge length of the nodes at the given level."""
+        return self.root_size / 2**level
+
+    def _cell_indices(self, points, level):
+        cells = np.floor((points - self.root_origin) / self.node_size(level))
+        return cells.astype(np.int64)
+
+    def _group(self, keys):
+        # Sort the entries by key and return the unique keys and group boundaries
+        unique_keys, inverse, counts = np.unique(
+            keys, return_inverse=True, return_counts=True
+        )
+        order = np.argsort(inverse.reshape(-1), kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        return unique_keys, inverse.reshape(-1), order, starts
+
+    def _aggregate(self, indices, counts, sums, value_counts, mins, maxs):
+        keys = pack_voxel_keys(indices)
+        unique_keys, inverse, order, starts = self._group(keys)
+        node = {
+            "keys": unique_keys,
+            "indices": indices[order][starts],
+            "counts": np.bincount(inverse, weights=counts).astype(np.int64),
+            "sum": {},
+            "value_counts": {},
+            "min": {},
+            "max": {},
+        }
+        for method in self.methods:
+            node["sum"][method] = np.bincount(inverse, weights=sums[method])
+            node["value_counts"][method] = np.bincount(
+                inverse, weights=value_counts[method]
+            ).astype(np.int64)
+            if len(order) > 0:
+                node["min"][method] = np.fmin.reduceat(mins[method][order], starts)
+                node["max"][method] = np.fmax.reduceat(maxs[method][order], starts)
+            else:
+                node["min"][method] = np.zeros(0)
+                node["max"][method] = np.zeros(0)
+        return node
+
+    def _build(self, points, points_valid):
+        values = {
+            method: self.df[method].to_numpy(dtype=float)[points_valid]
+            for method in self.methods
+        }
+        has_value = {method: ~np.isnan(values[method]) for method in self.methods}
+        cells = np.clip(
+            self._cell_indices(points, self.max_depth), 0, 2**self.max_depth - 1
+        )
+        leaves = self._aggregate(
+            cells,
+            np.ones(len(points)),
+            {m: np.where(has_value[m], values[m], 0.0) for m in self.methods},
+            {m: has_value[m].astype(float) for m in self.methods},
+            {m: np.where(has_value[m], values[m], np.nan) for m in self.methods},
+            {m: np.where(has_value[m], values[m], np.nan) for m in self.methods},
+        )
+
+        # Aggregate each coarser level from its children, not from the samples
+        self.levels = [leaves]
+        for _ in range(self.max_depth):
+            child = self.levels[0]
+            parent = self._aggregate(
+                child["indices"] >> 1,
+                child["counts"],
+                child["sum"],
+                child["value_counts"],
+                child["min"],
+                child["max"],
+            )
+            self.levels.insert(0, parent)
+
+    def _lookup(self, level, keys):
+        node_keys = self.levels[level]["keys"]
+        if len(node_keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(node_keys, keys), len(node_keys) - 1)
+        return np.where(node_keys[positions] == keys, positions, -1)
+
+    def _check_level(self, level):
+        level = self.max_depth if level is None else level
+        if not 0 <= level <= self.max_depth:
+            raise ValueError(f"level must be between 0 and {self.max_depth}")
+        return level
+
+    def contains(self, points, level=None):
+        """
+        Check whether each point lies in an occupied node.
+
+        :param points: array-like of shape (N, 3), the x, y, z coordinates.
+        :param level: int, the level to test against (default: max_depth, the finest).
+        :return: np.ndarray of bool of shape (N,).
+        """
+        level = self._check_level(level)
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        cells = self._cell_indices(points, level)
+        inside_root = np.all((cells >= 0) & (cells < 2**level), axis=1)
+        result = np.zeros(len(points), dtype=bool)
+        keys = pack_voxel_keys(cells[inside_root])
+        result[inside_root] = self._lookup(level, keys) >= 0
+        return result
+
+    def boundary_mask(self, level=None):
+        """
+        Flag the nodes of a level that have at least one empty face neighbor.
+
+        :param level: int, the level (default: max_depth).
+        :return: np.ndarray of bool, one entry per node of the level.
+        """
+        level = self._check_level(level)
+        indices = self.levels[level]["indices"]
+        neighbor_indices = indices[:, None, :] + NEIGHBOR_OFFSETS[6][None, :, :]
+        keys = pack_voxel_keys(neighbor_indices.reshape(-1, 3))
+        occupied = (self._lookup(level, keys) >= 0).reshape(len(indices), 6)
+        return ~np.all(occupied, axis=1)
+
+    def get_volume(self, level=None):
+        """
+        Get the volume covered by the occupied nodes of a level.
+
+        :param level: int, the level (default: max_depth).
+        :return: float, the volume in m³.
+        """
+        level = self._check_level(level)
+        return len(self.levels[level]["keys"]) * self.node_size(level) ** 3
+
+    def _nodes_to_dataframe(self, level, positions):
+        node = self.levels[level]
+        size = self.node_size(level)
+        centers = self.root_origin + (node["indices"][positions] + 0.5) * size
+        data = {
+            "x": centers[:, 0],
+            "y": centers[:, 1],
+            "z": centers[:, 2],
+            "size": np.full(len(positions), size),
+            "level": np.full(len(positions), level),
+            "count": node["counts"][positions],
+        }
+        for method in self.methods:
+            value_counts = node["value_counts"][method][positions]
+            data[method] = np.divide(
+                node["sum"][method][positions],
+                value_counts,
+                out=np.full(len(positions), np.nan),
+                where=value_counts > 0,
+            )
+            data[f"{method}_min"] = node["min"][method][positions]
+            data[f"{method}_max"] = node["max"][method][positions]
+        return pd.DataFrame(data)
+
+    def get_level(self, level):
+        """
+        Get all occupied nodes of a level.
+
+        :param level: int, the level.
+        :return: pd.DataFrame with node centres, size, level, count and per-metric mean, min and max.
+        """
+        level = self._check_level(level)
+        return self._nodes_to_dataframe(level, np.arange(len(self.levels[level]["keys"])))
+
+    def _intersects(self, level, positions, bounds):
+        size = self.node_size(level)
+        lower = self.root_origin + self.levels[level]["indices"][positions] * size
+        upper = lower + size
+        return np.all((upper >= bounds[:, 0]) & (lower <= bounds[:, 1]), axis=1)
+
+    def extract_lod(self, base_level, refine_level=None, bounds=None, boundary_only=False):
+        """
+        Extract a level-of-detail view: coarse nodes overall, fine nodes where refined.
+
+        Nodes are split level by level from base_level down to refine_level when they
+        intersect `bounds` (the zoomed region) and, if boundary_only is set, lie on the
+        workspace boundary. Without bounds and boundary_only every node is refined.
+
+        :param base_level: int, the coarse level used everywhere.
+        :param refine_level: int, the finest level of refined regions (default: max_depth).
+        :param bounds: optional, [[xmin, xmax], [ymin, ymax], [zmin, zmax]] region to refine.
+        :param boundary_only: bool, only refine nodes with an empty face neighbor.
+        :return: pd.DataFrame with the mixed-resolution nodes, see get_level.
+        """
+        base_level = self._check_level(base_level)
+        refine_level = self._check_level(refine_level)
+        if bounds is not None:
+            bounds = np.asarray(bounds, dtype=float)
+
+        frames = []
+        positions = np.arange(len(self.levels[base_level]["keys"]))
+        for level in range(base_level, refine_level):
+            split = np.ones(len(positions), dtype=bool)
+            if bounds is not None:
+                split &= self._intersects(level, positions, bounds)
+            if boundary_only:
+                split &= self.boundary_mask(level)[positions]
+            frames.append(self._nodes_to_dataframe(level, positions[~split]))
+
+            # Children of the split nodes on the next level
+            child = self.levels[level + 1]
+            parent_keys = pack_voxel_keys(child["indices"] >> 1)
+            split_keys = self.levels[level]["keys"][positions[split]]
+            positions = np.nonzero(np.isin(parent_keys, split_keys))[0]
+        frames.append(self._nodes_to_dataframe(refine_level, positions))
+        return pd.concat(frames, ignore_index=True)
+
+    def get_statistics(self):
+        return {
+            "total_data_points": len(self.df),
+            "max_depth": self.max_depth,
+            "root_size": self.root_size,
+            "leaf_size": self.node_size(self.max_depth),
+            "nodes_per_level": [len(level["keys"]) for level in self.levels],
+            "workspace_volume": self.get_volume(),
+            "methods": self.methods,
+        }
+
+    def print_statistics(self):
+        stats = self.get_statistics()
+        print(f"\nWorkspace Octree Statistics:")
+        print(f"├─ Methods: {stats['methods']}")
+        print(f"├─ Total data points: {stats['total_data_points']:,}")
+        print(f"├─ Max depth: {stats['max_depth']}")
+        print(f"├─ Root size: {stats['root_size']:.3f} m")
+        print(f"├─ Leaf size: {stats['leaf_size']:.4f} m")
+        print(f"├─ Nodes per level: {stats['nodes_per_level']}")
+        print(f"└─ Workspace volume: {stats['workspace_volume']:.4f} m³")
@@ -0,0 +1,167 @@
+"""
+Progressive rendering of a workspace analysis in the Dash apps.
+
+The analysis pushes every sampled batch into a PointStream; the page polls the stream
+with a dcc.Interval and appends the new points to the live Scatter3d trace with
+extendData, so each update carries one batch instead of the whole cloud.
+"""
+
+import threading
+
+import numpy as np
+import plotly.graph_objects as go
+
+STREAM_TRACE_UID = "workspace_points"
+
+
+def stream_trace(color):
+    """
+    Empty point cloud trace that the streamed batches are appended to.
+    :param color: str, the name of the metric used for the marker color.
+    :return: go.Scatter3d, styled as PlotlyWorkSpace.plot.
+    """
+    return go.Scatter3d(
+        x=[],
+        y=[],
+        z=[],
+        mode="markers",
+        uid=STREAM_TRACE_UID,
+        marker=dict(
+            size=5,
+            color=[],
+            colorscale="Viridis",
+            opacity=0.5,
+            colorbar=dict(title=dict(text=color)),
+        ),
+    )
+
+
+def extend_data(points, values, trace_index, max_points=None):
+    """
+    extendData of dcc.Graph appending points to one Scatter3d trace.
+    :param points: array of shape (N, 3).
+    :param values: array of shape (N,), the marker colors.
+    :param trace_index: int, the index of the trace in the figure.
+    :param max_points: int, optional, the number of most recent points the trace keeps.
+    :return: list [update, trace indices, max points], see Plotly.extendTraces.
+    """
+    points = np.round(np.asarray(points, dtype=float), 6)
+    update = {
+        "x": [points[:, 0].tolist()],
+        "y": [points[:, 1].tolist()],
+        "z": [points[:, 2].tolist()],
+        "marker.color": [np.round(np.asarray(values, dtype=float), 6).tolist()],
+    }
+    return [update, [trace_index], max_points]
+
+
+class PointStream:
+    """
+    Buffer of the batches of running analyses, written by the job and drained by the page.
+
+    With a diskcache.Cache, the buffers are cache entries shared with the background job
+    processes; without one, they live in memory and are shared by the server threads.
+    """
+
+    def __init__(self, cache=None, name="workspace_stream", expire=600):
+        """
+        :param cache: diskcache.Cache, optional, the cache shared with the job processes.
+        :param name: str, the prefix of the stream keys in the cache.
+        :param expire: float, the lifetime in seconds of a stream left open by a cancelled job.
+        """
+        self.cache = cache
+        self.name = name
+        self.expire = expire
+        self._streams = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Job processes receive the stream with the callback; locks do not pickle
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _update(self, key, function):
+        # Apply function to the buffer of key atomically, return its result
+        if self.cache is None:
+            with self._lock:
+                result, buffer = function(self._streams.get(key))
+                if buffer is None:
+                    self._streams.pop(key, None)
+                else:
+                    self._streams[key] = buffer
+            return result
+        cache_key = (self.name, key)
+        with self.cache.transact():
+            result, buffer = function(self.cache.get(cache_key))
+            if buffer is None:
+                self.cache.delete(cache_key)
+            else:
+                self.cache.set(cache_key, buffer, expire=self.expire)
+        return result
+
+    def open(self, key, figure, trace_index):
+        """
+        Start a stream.
+        :param key: hashable, the stream key.
+        :param figure: dict, the figure holding the trace from stream_trace.
+        :param trace_index: int, the index of that trace in the figure.
+        """
+        buffer = {
+            "figure": figure,
+            "trace_index": trace_index,
+            "points": [],
+            "values": [],
+            "status": "",
+        }
+        self._update(key, lambda _: (None, buffer))
+
+    def push(self, key, points, values, status=""):
+        """
+        Append a batch of points to an open stream.
+        :param points: array of shape (N, 3).
+        :param values: array of shape (N,), the marker colors.
+        :param status: str, the status shown with the figure.
+        """
+
+        def append(buffer):
+            if buffer is not None:
+                buffer["points"].append(np.asarray(points, dtype=float).reshape(-1, 3))
+                buffer["values"].append(np.asarray(values, dtype=float).ravel())
+                buffer["status"] = status
+            return None, buffer
+
+        self._update(key, append)
+
+    def drain(self, key):
+        """
+        Take the batches pushed since the last drain.
+        :param key: hashable, the stream key.
+        :return: dict with "figure" (the figure if not sent yet, else None), "trace_index",
+            "points" (N, 3), "values" (N,) and "status", or None if the stream is closed.
+        """
+
+        def take(buffer):
+            if buffer is None:
+                return None, None
+            update = {
+                "figure": buffer["figure"],
+                "trace_index": buffer["trace_index"],
+                "points": np.concatenate(buffer["points"] or [np.zeros((0, 3))]),
+                "values": np.concatenate(buffer["values"] or [np.zeros(0)]),
+                "status": buffer["status"],
+            }
+            buffer.update(figure=None, points=[], values=[])
+            return update, buffer
+
+        return self._update(key, take)
+
+    def close(self, key):
+        """
+        End a stream, discarding the batches not drained yet.
+        """
+        self._update(key, lambda _: (None, None))
@@ -1,6 +1,7 @@
 import robosandbox as rsb
 import unittest
 from math import pi
+from robosandbox.geometry.Link.CylinderLink import _cached_mass_properties
 
 
 class TestDHRobolink(unittest.TestCase):
@@ -28,6 +29,17 @@ class TestDHRobolink(unittest.TestCase):
             self.robot.isspherical(), "GenericFour robot should not be spherical"
         )
 
+    def test_kinematics_only(self):
+        _cached_mass_properties.cache_clear()
+        robot = rsb.models.DHRoboLink.Generic.GenericFour(dynamics=False)
+        self.assertEqual(_cached_mass_properties.cache_info().currsize, 0)
+        self.assertEqual(robot.links[1].m, 0)
+        self.assertEqual(robot.fkine([0, 0, 0, 0]).t.shape, (3,))
+
+        # The four identical default links are integrated once
+        rsb.models.DHRoboLink.Generic.GenericFour()
+        self.assertEqual(_cached_mass_properties.cache_info().currsize, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,30 @@
+import os
+import tempfile
+import threading
+import time
 import robosandbox as rsb
 import unittest
+from robosandbox.visualization.app import VisualizationManager
+from robosandbox.visualization.background_jobs import (
+    JobSlots,
+    create_job_cache,
+    default_cache_dir,
+    diskcache,
+)
+
+WORKSPACE_STATES = [
+    ("robot_selection", "generic_2"),
+    ("link_lengths", "0.4,0.4"),
+    ("alpha", "90,0"),
+    ("qs", "0,0"),
+    ("commercial_qs", "0,0,0,0,0,0,0"),
+    ("initial_samples", "500"),
+    ("batch_ratio", "0.1"),
+    ("error_tolerance", "10"),
+    ("method_dropdown", "yoshikawa"),
+    ("axes_dropdown", "all"),
+    ("ws_normalization_slider", 0),
+]
 
 
 class TestApp(unittest.TestCase):
@@ -12,11 +37,157 @@ class TestApp(unittest.TestCase):
         # app.run_server(debug=True)
         self.assertIsNotNone(app, "app not defined")
 
+    def test_standalone_shares_app(self):
+        from robosandbox.visualization.app_standalone import (
+            RobotArmDesignAppStandalone,
+        )
+
+        standalone = RobotArmDesignAppStandalone()
+        app = rsb.visualization.app.RobotArmDesignApp()
+        self.assertEqual(set(standalone.app.callback_map), set(app.app.callback_map))
+
     # def test_app_standalone(self):
     #     app_standalone = rsb.visualization.app_standalone.RobotArmDesignAppStandalone()
     #     app_standalone.run_app()
     #     self.assertIsNotNone(app_standalone, "app_standalone not defined")
 
 
+class InMemoryCache(dict):
+    """The part of the diskcache.Cache interface used by JobSlots."""
+
+    def add(self, key, value):
+        return self.setdefault(key, value) is value
+
+    def delete(self, key):
+        self.pop(key, None)
+
+
+class TestWorkspaceJobs(unittest.TestCase):
+    def test_workspace_callback_registered(self):
+        app = rsb.visualization.app.RobotArmDesignApp(max_jobs=1)
+        outputs = [
+            key
+            for key in app.app.callback_map
+            if "main_display.figure@" in key and "results_table" in key
+        ]
+        self.assertEqual(len(outputs), 1)
+        self.assertEqual(app.job_slots.max_jobs, 1)
+
+    def test_progress_and_slots(self):
+        robot = rsb.models.DH.Generic.GenericTwo()
+        progress = []
+        fig, message, _ = VisualizationManager._handle_workspace_button(
+            robot,
+            [0, 0],
+            "Generic 2 DOF Robot",
+            {"total_length": 0.8},
+            500,
+            0.5,
+            10.0,
+            "yoshikawa",
+            "trans",
+            False,
+            set_progress=progress.append,
+            job_slots=JobSlots(max_jobs=1),
+        )
+        self.assertIn("yoshikawa", message)
+        self.assertGreaterEqual(len(progress), 1)
+        percent, status = progress[0]
+        self.assertAlmostEqual(percent, 1.0)
+        self.assertTrue(status.startswith("500 samples"))
+
+    def test_thread_slots_cap_concurrency(self):
+        slots = JobSlots(max_jobs=2)
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def job():
+            with slots.slot():
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.05)
+                with lock:
+                    running[0] -= 1
+
+        threads = [threading.Thread(target=job) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(peak[0], 2)
+        with self.assertRaises(ValueError):
+            JobSlots(max_jobs=0)
+
+    def test_cache_slots_reclaim_dead_jobs(self):
+        cache = InMemoryCache()
+        slots = JobSlots(cache, max_jobs=1, poll_interval=0.01)
+        # A slot left behind by a job process that was killed
+        cache["workspace_job_slot_0"] = 2**22 + 12345
+        waited = []
+        with slots.slot(on_wait=lambda: waited.append(True)):
+            self.assertEqual(cache["workspace_job_slot_0"], os.getpid())
+        self.assertEqual(waited, [])
+        self.assertNotIn("workspace_job_slot_0", cache)
+
+
+    def test_default_cache_dir_per_app(self):
+        self.assertNotEqual(default_cache_dir("app_a"), default_cache_dir("app_b"))
+        self.assertTrue(default_cache_dir("app_a").startswith(tempfile.gettempdir()))
+
+
+@unittest.skipIf(diskcache is None, "requires dash[diskcache]")
+class TestBackgroundWorkspaceJob(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_analysis_runs_in_job_process(self):
+        app = rsb.visualization.app.RobotArmDesignApp(
+            cache_dir=self.tmp.name, progressive=False
+        )
+        self.assertIsNotNone(app.callback_manager)
+        output = next(
+            key
+            for key in app.app.callback_map
+            if "main_display.figure@" in key and "results_table" in key
+        )
+        body = {
+            "output": output,
+            "outputs": [
+                {"id": id_, "property": prop.split("@")[0]}
+                for id_, prop in (
+                    part.split(".") for part in output.strip(".").split("...")
+                )
+            ],
+            "inputs": [
+                {"id": "workspace_stream_id", "property": "data", "value": "job"}
+            ],
+            "state": [
+                {"id": id_, "property": "value", "value": value}
+                for id_, value in WORKSPACE_STATES
+            ],
+            "changedPropIds": ["workspace_stream_id.data"],
+        }
+        client = app.app.server.test_client()
+        handles = client.post("/_dash-update-component", json=body).get_json()
+        self.assertIn("job", handles)
+
+        # Poll the job like the page does until its result arrives
+        response = {}
+        deadline = time.time() + 120
+        while "response" not in response and time.time() < deadline:
+            time.sleep(0.2)
+            response = client.post(
+                "/_dash-update-component",
+                json=body,
+                query_string={"cacheKey": handles["cacheKey"], "job": handles["job"]},
+            ).get_json()
+        message = response["response"]["output"]["children"]
+        self.assertIn("yoshikawa", message)
+        # The job released its slot
+        with create_job_cache(self.tmp.name) as cache:
+            self.assertNotIn("workspace_job_slot_0", cache)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import numpy as np
+import roboticstoolbox as rtb
+from roboticstoolbox import ET, ETS
+from spatialmath import SE3
+from robosandbox.models.URDF.Generic import GenericDH
+from robosandbox.models.URDF.chain_kinematics import JointChain
+from robosandbox.models.URDF.generic_dh_robot import DH_2_URDF
+from robosandbox.performance.workspace import WorkSpace
+
+JOINT_TYPES = ["r", "p", "r", "r"]
+DH_PARAMS = dict(
+    dofs=4,
+    a=[0, 0.3, 0.25, 0.1],
+    d=[0.2, 0, 0, 0.05],
+    alpha=[np.pi / 2, 0, -np.pi / 2, 0],
+    joint_types=JOINT_TYPES,
+)
+URDF_STRING = DH_2_URDF(
+    **DH_PARAMS, qlim=[(None, None), (0, 0.4)] * 2
+).generate_urdf()
+
+
+class TestJointChain(unittest.TestCase):
+    def setUp(self):
+        self.robot = rtb.Robot(
+            ET.Rz()
+            * ET.tx(0.3)
+            * ET.tz(qlim=[0, 1])
+            * ET.Ry(flip=True)
+            * ET.Rx(0.4)
+            * ET.ty(0.2)
+            * ET.Rx()
+            * ET.tx(flip=True)
+            * ET.tz(0.1)
+        )
+        self.robot.base = SE3(0.1, 0.2, 0.3) * SE3.Rx(0.3)
+        self.robot.tool = SE3(0, 0, 0.05) * SE3.Ry(0.2)
+        self.q = np.random.default_rng(0).uniform(-1, 1, (50, self.robot.n))
+
+    def test_matches_toolbox(self):
+        chain = JointChain.from_robot(self.robot)
+        poses, jacobians = chain.fkine(self.q), chain.jacob0(self.q)
+        self.assertEqual(jacobians.shape, (50, 6, 5))
+        for q, pose, jacobian in zip(self.q, poses, jacobians):
+            np.testing.assert_allclose(pose, self.robot.fkine(q).A, atol=1e-12)
+            np.testing.assert_allclose(jacobian, self.robot.jacob0(q), atol=1e-12)
+
+    def test_single_configuration(self):
+        chain = JointChain.from_robot(self.robot)
+        self.assertEqual(chain.fkine(self.q[0]).shape, (1, 4, 4))
+        with self.assertRaises(ValueError):
+            chain.jacob0(np.zeros((2, 3)))
+
+
+class TestPrismaticURDF(unittest.TestCase):
+    def test_prismatic_limits(self):
+        self.assertIn("<limit lower='0' upper='0.4'", URDF_STRING)
+        self.assertEqual(URDF_STRING.count("<limit"), 1)
+
+    def test_generic_dh_batch(self):
+        qlim = np.array([[-np.pi, 0, -np.pi, 0], [np.pi, 0.4, np.pi, 0.4]])
+        robot = GenericDH(**DH_PARAMS, qlim=qlim)
+        q = np.random.default_rng(1).uniform(robot.qlim[0], robot.qlim[1], (20, 4))
+        poses, jacobians = robot.fkine_batch(q), robot.jacob0_batch(q)
+        for point, pose, jacobian in zip(q, poses, jacobians):
+            np.testing.assert_allclose(pose, robot.fkine(point).A, atol=1e-12)
+            np.testing.assert_allclose(jacobian, robot.jacob0(point), atol=1e-12)
+
+        ws = WorkSpace(robot)
+        np.testing.assert_allclose(ws.get_cartesian_points(q), poses[:, :3, 3])
+
+    def test_generic_dh_chain_cache(self):
+        robot = GenericDH(**DH_PARAMS)
+        q = np.random.default_rng(2).uniform(0, 0.4, (10, 4))
+        chain = robot.joint_chain()
+        self.assertIs(robot.joint_chain(), chain)
+
+        robot.base = SE3(0.1, 0.2, 0.3) * SE3.Rz(0.5)
+        robot.tool = SE3(0, 0, 0.05)
+        self.assertIsNot(robot.joint_chain(), chain)
+        for point, pose, jacobian in zip(
+            q, robot.fkine_batch(q), robot.jacob0_batch(q)
+        ):
+            np.testing.assert_allclose(pose, robot.fkine(point).A, atol=1e-12)
+            np.testing.assert_allclose(jacobian, robot.jacob0(point), atol=1e-12)
+
+        chain = robot.joint_chain()
+        robot.links[0].ets = ETS(ET.tz(0.1))
+        self.assertIsNot(robot.joint_chain(), chain)
+
+
+if __name__ == "__main__":
+    unittest.main()
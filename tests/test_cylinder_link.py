@@ -0,0 +1,153 @@
+import unittest
+import numpy as np
+from robosandbox.geometry.Link.CylinderLink import CylinderLink
+from robosandbox.geometry.mesh_utilities import add_face, index_of, strip_faces
+from robosandbox.geometry.Link.mass_properties import (
+    hollow_link_mass_properties,
+    links_mass_properties,
+    parallel_axis,
+)
+
+
+def directed_edges(faces):
+    rolled = np.roll(faces, -1, axis=1)
+    return np.stack((faces, rolled), axis=-1).reshape(-1, 2)
+
+
+class TestMeshUtilities(unittest.TestCase):
+    def test_strip_faces_matches_add_face(self):
+        rows, columns = 4, 7
+        for method in ["quad", "tri"]:
+            faces = []
+            for j in range(rows - 1):
+                for i in range(columns - 1):
+                    faces = add_face(
+                        faces,
+                        index_of(i, j, columns),
+                        index_of(i + 1, j, columns),
+                        index_of(i + 1, j + 1, columns),
+                        index_of(i, j + 1, columns),
+                        method=method,
+                    )
+            index_grid = np.arange(rows * columns).reshape(rows, columns)
+            np.testing.assert_array_equal(strip_faces(index_grid, method=method), faces)
+
+    def test_wrap(self):
+        faces = strip_faces(np.arange(8).reshape(2, 4), wrap=True)
+        self.assertEqual(len(faces), 4)
+        np.testing.assert_array_equal(faces[-1], [3, 0, 4, 7])
+        with self.assertRaises(ValueError):
+            strip_faces(np.arange(8).reshape(2, 4), method="hex")
+
+
+class TestCylinderLinkMesh(unittest.TestCase):
+    def setUp(self):
+        self.link = CylinderLink(
+            inner_profile={"params": [20e-3, 10e-3], "method": "linear"},
+            resolutions={"axial": 30, "radial": 6, "angular": 40},
+        )
+
+    def test_surface_meshes(self):
+        points, faces = self.link.get_outer_mesh(method="quad")
+        self.assertEqual(points.shape, (30 * 40, 3))
+        self.assertEqual(faces.shape, (29 * 39, 4))
+        np.testing.assert_allclose(np.hypot(points[:, 0], points[:, 1]), self.link.Rout)
+
+        points, faces = self.link.get_side_mesh(method="tri", side="end")
+        self.assertEqual(faces.shape, (2 * 5 * 39, 3))
+        np.testing.assert_allclose(points[:, 2], self.link.len)
+
+    def test_watertight_mesh(self):
+        points, faces = self.link.get_watertight_mesh()
+        # Every directed edge has exactly one opposite twin: closed and consistently oriented
+        edges = {tuple(edge) for edge in directed_edges(faces)}
+        self.assertEqual(len(edges), 3 * len(faces))
+        self.assertTrue(all((b, a) in edges for a, b in edges))
+
+        corners = points[faces]
+        volume = np.sum(
+            np.einsum("ij,ij->i", corners[:, 0], np.cross(corners[:, 1], corners[:, 2]))
+        ) / 6
+        inner_radii = self.link.Rout - self.link.thickness_distribution
+        expected = np.trapz(
+            np.pi * (self.link.Rout**2 - inner_radii**2), self.link.segments_location
+        )
+        self.assertAlmostEqual(volume, expected, delta=0.01 * expected)
+
+        quad_points, quad_faces = self.link.get_watertight_mesh(method="quad")
+        self.assertEqual(2 * len(quad_faces), len(faces))
+
+
+class TestCylinderLinkMassProperties(unittest.TestCase):
+    def test_constant_profile_matches_closed_form(self):
+        link = CylinderLink()
+        inner_radius = link.Rout - link.inner_profile["params"][0]
+        mass = np.pi * (link.Rout**2 - inner_radius**2) * link.len * link.rho
+        self.assertAlmostEqual(link.mass, mass)
+        np.testing.assert_allclose(link.COM, [0, 0, link.len / 2])
+        np.testing.assert_allclose(
+            link.I_tensor,
+            CylinderLink.inertia_vector_hollow_cylinder(
+                mass, inner_radius, link.Rout, link.len
+            ),
+        )
+
+    def test_solid_cone(self):
+        # A solid cone of base radius R and height h: COM at h / 4, Izz = 3 / 10 m R^2
+        R, h = 0.1, 0.4
+        mass, com, inertia = hollow_link_mass_properties([0, h], [0, 0], [R, 0], rho=1.0)
+        self.assertAlmostEqual(mass, np.pi * R**2 * h / 3)
+        self.assertAlmostEqual(com[2], h / 4)
+        self.assertAlmostEqual(inertia[2, 2], 3 / 10 * mass * R**2)
+        self.assertAlmostEqual(inertia[0, 0], 3 / 20 * mass * R**2 + 3 / 80 * mass * h**2)
+
+    def test_tapered_profiles(self):
+        link = CylinderLink(inner_profile={"params": [20e-3, 5e-3], "method": "linear"})
+        # The wall is thicker at the start
+        self.assertLess(link.COM[2], link.len / 2)
+        piecewise = CylinderLink(
+            inner_profile={"params": [20e-3, 12.5e-3, 5e-3], "method": "piecewise_linear"}
+        )
+        self.assertAlmostEqual(piecewise.mass, link.mass)
+        np.testing.assert_allclose(piecewise.I_tensor, link.I_tensor)
+        with self.assertRaises(ValueError):
+            CylinderLink(inner_profile={"params": [1e-3], "method": "cubic"})
+
+        # Inertia about another origin follows the parallel axis theorem
+        np.testing.assert_allclose(
+            link.get_inertia_tensor((0, 0, 0))[0, 0],
+            link.I_tensor[0, 0] + link.mass * link.COM[2] ** 2,
+        )
+
+    def test_batch(self):
+        links = [
+            CylinderLink(inner_profile={"params": [t0, t1], "method": "linear"})
+            for t0, t1 in [(20e-3, 5e-3), (10e-3, 10e-3), (2e-3, 15e-3)]
+        ]
+        links.append(CylinderLink(resolutions={"axial": 20, "radial": 10, "angular": 36}))
+        mass, com, inertia = links_mass_properties(links)
+        np.testing.assert_allclose(mass, [link.mass for link in links])
+        np.testing.assert_allclose(com, [link.COM for link in links])
+        np.testing.assert_allclose(inertia, [link.I_tensor for link in links])
+
+        shifted = parallel_axis(inertia, mass, com, np.zeros(3))
+        np.testing.assert_allclose(shifted[0], links[0].get_inertia_tensor())
+
+
+class TestCylinderLinkMassPropertiesCache(unittest.TestCase):
+    def test_identical_links_share_results(self):
+        first = CylinderLink(length=0.37)
+        second = CylinderLink(length=0.37)
+        self.assertIs(first.get_mass_properties(), second.get_mass_properties())
+        with self.assertRaises(ValueError):
+            first.I_tensor[0, 0] = 1.0
+
+    def test_geometry_changes_invalidate(self):
+        link = CylinderLink(length=0.37)
+        mass = link.mass
+        link.Rout = 30e-3
+        self.assertGreater(link.mass, mass)
+
+
+if __name__ == "__main__":
+    unittest.main()
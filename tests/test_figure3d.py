@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+from robosandbox.visualization.plotly_Figure3D import Figure3D
+from robosandbox.visualization.plotly_Link3D import Link3D
+from robosandbox.geometry.Link.CylinderLink import CylinderLink
+
+
+def unit_square():
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    return points, np.array([[0, 1, 2, 3]])
+
+
+class TestFigure3DMesh(unittest.TestCase):
+    def test_quads_match_add_quad(self):
+        points, faces = unit_square()
+        loop = Figure3D()
+        loop.add_quad(points[faces[0]], outline=False)
+        bulk = Figure3D()
+        bulk.add_faces(points, faces)
+
+        loop_mesh = loop.draw(show=False).data[0]
+        bulk_mesh = bulk.draw(show=False).data[0]
+        loop_triangles = np.stack([loop_mesh.i, loop_mesh.j, loop_mesh.k], axis=1)
+        bulk_triangles = np.stack([bulk_mesh.i, bulk_mesh.j, bulk_mesh.k], axis=1)
+        loop_points = np.stack([loop_mesh.x, loop_mesh.y, loop_mesh.z], axis=1)
+        bulk_points = np.stack([bulk_mesh.x, bulk_mesh.y, bulk_mesh.z], axis=1)
+        np.testing.assert_allclose(
+            loop_points[loop_triangles], bulk_points[bulk_triangles]
+        )
+
+    def test_shared_vertices_and_offsets(self):
+        points, faces = unit_square()
+        fig = Figure3D()
+        fig.add_tri(points[:3])
+        fig.add_faces(points, faces, intensity=np.arange(4), mirror=True)
+        mesh = fig.draw(show=False).data[0]
+        # 3 legacy vertices + 4 shared vertices per mesh copy
+        self.assertEqual(len(mesh.x), 3 + 2 * 4)
+        self.assertEqual(len(mesh.i), 1 + 2 * 2)
+        self.assertEqual(max(mesh.i.max(), mesh.j.max(), mesh.k.max()), 10)
+        np.testing.assert_allclose(mesh.y[7:], -points[:, 1])
+        np.testing.assert_allclose(mesh.intensity[3:7], np.arange(4))
+
+    def test_default_intensity(self):
+        points, faces = unit_square()
+        fig = Figure3D()
+        fig.add_faces(points, faces)
+        mesh = fig.draw(show=False, colorbar_title="").data[0]
+        self.assertIsNone(mesh.intensity)
+        self.assertFalse(mesh.showscale)
+        # Mixed with intensity-colored faces, the mesh counts as 0
+        fig = Figure3D()
+        fig.add_faces(points, faces)
+        fig.add_faces(points, faces, intensity=2.0)
+        mesh = fig.draw(show=False).data[0]
+        np.testing.assert_allclose(mesh.intensity, [0] * 4 + [2] * 4)
+
+    def test_outline(self):
+        points, faces = unit_square()
+        fig = Figure3D()
+        fig.add_line([(0, 0, 0), (0, 0, 1)])
+        fig.add_faces(points, faces, outline=True)
+        lines = fig.draw(show=False).data[1]
+        # Legacy line (2 points + gap) and one closed quad (5 points + gap)
+        self.assertEqual(len(lines.x), 3 + 6)
+        self.assertTrue(np.isnan(lines.x[2]) and np.isnan(lines.x[-1]))
+
+    def test_invalid_faces(self):
+        with self.assertRaises(ValueError):
+            Figure3D().add_faces(np.zeros((5, 3)), np.zeros((2, 5), dtype=int))
+
+    def test_link_add_mesh(self):
+        link = CylinderLink(resolutions={"axial": 20, "radial": 5, "angular": 36})
+        points, faces = link.get_outer_mesh(method="quad")
+        fig = Link3D().add_mesh(points, faces, "quad", Figure3D())
+        mesh = fig.draw(show=False).data[0]
+        self.assertEqual(len(mesh.x), len(points))
+        self.assertEqual(len(mesh.i), 2 * len(faces))
+
+
+if __name__ == "__main__":
+    unittest.main()
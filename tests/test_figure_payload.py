@@ -0,0 +1,68 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+import robosandbox as rsb
+from robosandbox.visualization.figure_payload import (
+    describe_payload,
+    payload_size,
+    typed_array,
+    typed_trace_data,
+)
+from robosandbox.visualization.plotly_Figure3D import Figure3D
+from robosandbox.visualization.plotly_WorkSpace import PlotlyWorkSpace
+
+
+def trace_dtypes(fig):
+    payload = json.loads(to_json_plotly(fig))
+    return {
+        value["dtype"]
+        for trace in payload["data"]
+        for value in trace.values()
+        if isinstance(value, dict) and "bdata" in value
+    }
+
+
+class TestFigurePayload(unittest.TestCase):
+    def test_typed_arrays(self):
+        np.testing.assert_array_equal(typed_array([1, None]), [1, np.nan])
+        self.assertEqual(typed_array([[1, 2, 3]], dtype=np.int32).dtype, np.int32)
+        data = typed_trace_data({"x": [0.0, 1.0], "sizeref": 0.5})
+        self.assertEqual((data["x"].dtype, data["sizeref"]), (np.float32, 0.5))
+
+    def test_figures_use_float32(self):
+        robot = rsb.models.DH.Panda()
+        fig = robot.plotly(robot.qr, isShow=False, compact=True)
+        self.assertEqual(trace_dtypes(fig), {"f4"})
+        robot.update_plotly(fig, robot.qz)
+        self.assertEqual(trace_dtypes(fig), {"f4"})
+
+        scene = Figure3D()
+        scene.add_faces(np.eye(3), [[0, 1, 2]])
+        scene.add_line([(0, 0, 0), (1, 1, 1)])
+        self.assertEqual(trace_dtypes(scene.draw(show=False)), {"f4", "i4"})
+
+    def test_workspace_payload_is_smaller(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.uniform(size=(20000, 4)), columns=["x", "y", "z", "yoshikawa"])
+        fig = PlotlyWorkSpace(df).plot(color="yoshikawa", isShow=False)
+        lists = go.Figure(
+            go.Scatter3d(
+                x=df["x"].tolist(),
+                y=df["y"].tolist(),
+                z=df["z"].tolist(),
+                marker=dict(color=df["yoshikawa"].tolist()),
+            )
+        )
+        self.assertLess(2.5 * payload_size(fig), payload_size(lists))
+        self.assertLess(payload_size(fig, compressed=True), payload_size(fig))
+        self.assertRegex(describe_payload(fig, compressed=True), r"\d+ kB \(\d+ kB gzipped\)")
+        self.assertNotIn("gzipped", describe_payload(fig))
+        payload = to_json_plotly(fig).encode()
+        self.assertEqual(payload_size(payload), payload_size(fig))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Seconds allowed for each import in a fresh interpreter (best of 3 runs), checked
+# only with ROBOSANDBOX_IMPORT_BUDGETS=1 as wall-clock times depend on the machine
+IMPORT_TIME_BUDGETS = {
+    "robosandbox": 0.25,
+    "robosandbox.performance.workspace": 2.0,
+}
+APP_MODULES = {"dash", "dash_bootstrap_components", "webview", "matplotlib"}
+
+
+def run_fresh(statement):
+    """Run statement in a new interpreter, return its import time and the loaded modules."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps([elapsed, sorted({m.split('.')[0] for m in sys.modules})]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    elapsed, modules = json.loads(result.stdout.splitlines()[-1])
+    return elapsed, set(modules)
+
+
+class TestImportTime(unittest.TestCase):
+    @unittest.skipUnless(
+        os.environ.get("ROBOSANDBOX_IMPORT_BUDGETS") == "1",
+        "set ROBOSANDBOX_IMPORT_BUDGETS=1 to check the import time budgets",
+    )
+    def test_import_time_budgets(self):
+        for module, budget in IMPORT_TIME_BUDGETS.items():
+            elapsed = min(run_fresh(f"import {module}")[0] for _ in range(3))
+            self.assertLess(elapsed, budget, f"import {module} took {elapsed:.2f} s")
+
+    def test_subpackages_are_lazy(self):
+        _, modules = run_fresh("import robosandbox")
+        self.assertFalse(modules & ({"numpy", "plotly", "roboticstoolbox"} | APP_MODULES))
+
+        _, modules = run_fresh("import robosandbox.performance.workspace")
+        self.assertFalse(modules & ({"roboticstoolbox", "pymoo"} | APP_MODULES))
+
+        # roboticstoolbox itself imports matplotlib
+        _, modules = run_fresh("import robosandbox.models.DH")
+        self.assertFalse(modules & (APP_MODULES - {"matplotlib"}))
+
+    def test_lazy_attributes(self):
+        _, modules = run_fresh(
+            "import robosandbox as rsb\n"
+            "assert 'models' in dir(rsb)\n"
+            "assert isinstance(rsb.models.DH.Panda, type)\n"
+            "assert rsb.visualization.RobotArmDesignApp.__name__ == 'RobotArmDesignApp'\n"
+            "assert rsb.optimization.ParameterSweeper.__module__.endswith('sweeper')\n"
+            "assert rsb.visualization.plotly_robot.PlotlyRobot\n"
+            "try:\n"
+            "    rsb.visualization.missing\n"
+            "    raise AssertionError\n"
+            "except AttributeError:\n"
+            "    pass"
+        )
+        self.assertIn("dash", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
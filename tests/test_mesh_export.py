@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from stl import mesh
+from robosandbox.visualization.mesh_export import export_mesh, triangulate
+from robosandbox.visualization.plotly_Figure3D import Figure3D
+from robosandbox.geometry.Link.CylinderLink import CylinderLink
+
+
+class TestMeshExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.link = CylinderLink(resolutions={"axial": 20, "radial": 4, "angular": 36})
+        self.points, self.faces = self.link.get_outer_mesh(method="quad")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp_dir.name, name)
+
+    def test_triangulate(self):
+        np.testing.assert_array_equal(
+            triangulate([[0, 1, 2, 3]]), [[0, 1, 2], [0, 2, 3]]
+        )
+        with self.assertRaises(ValueError):
+            triangulate([[0, 1]])
+
+    def test_stl_matches_loop_export(self):
+        points, faces = self.link.get_outer_mesh(method="tri")
+        self.link.get_stl_export(points, faces, self.path("link.stl"))
+        loaded = mesh.Mesh.from_file(self.path("link.stl"))
+
+        expected = np.zeros((len(faces), 3, 3))
+        for i, f in enumerate(faces):
+            for j in range(3):
+                expected[i][j] = points[f[j], :]
+        np.testing.assert_allclose(loaded.vectors, expected, atol=1e-7)
+
+    def test_quads_are_split_for_stl(self):
+        export_mesh(self.points, self.faces, self.path("link.stl"))
+        loaded = mesh.Mesh.from_file(self.path("link.stl"))
+        self.assertEqual(len(loaded.vectors), 2 * len(self.faces))
+
+    def test_ply_and_obj(self):
+        export_mesh(self.points, self.faces, self.path("link.ply"))
+        with open(self.path("link.ply"), "rb") as f:
+            header, body = f.read().split(b"end_header\n")
+        self.assertIn(f"element vertex {len(self.points)}".encode(), header)
+        self.assertEqual(len(body), 12 * len(self.points) + 17 * len(self.faces))
+
+        export_mesh(self.points, self.faces, self.path("link.obj"))
+        with open(self.path("link.obj")) as f:
+            lines = f.read().splitlines()
+        vertices = np.array([line.split()[1:] for line in lines if line.startswith("v ")], dtype=float)
+        faces = np.array([line.split()[1:] for line in lines if line.startswith("f ")], dtype=int)
+        np.testing.assert_allclose(vertices, self.points, atol=1e-8)
+        np.testing.assert_array_equal(faces - 1, self.faces)
+
+        with self.assertRaises(ValueError):
+            export_mesh(self.points, self.faces, self.path("link.step"))
+
+    def test_link_and_scene_export(self):
+        self.link.export_mesh(self.path("watertight.stl"))
+        loaded = mesh.Mesh.from_file(self.path("watertight.stl"))
+        volume, _, _ = loaded.get_mass_properties()
+        self.assertAlmostEqual(volume * self.link.rho, self.link.mass, delta=0.02 * self.link.mass)
+
+        # A scene with two links exports as one mesh
+        scene = Figure3D()
+        points, faces = self.link.get_watertight_mesh()
+        scene.add_faces(points, faces)
+        scene.add_faces(points + [0.1, 0, 0], faces)
+        scene.export_faces(self.path("scene.stl"))
+        self.assertEqual(len(mesh.Mesh.from_file(self.path("scene.stl")).vectors), 2 * len(faces))
+
+
+if __name__ == "__main__":
+    unittest.main()
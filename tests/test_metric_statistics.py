@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import pandas as pd
+from robosandbox.visualization import metric_statistics
+from robosandbox.visualization.plotly_WorkSpace import PlotlyWorkSpace
+
+
+class TestMetricStatistics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.normal(size=100000)
+        self.values[::1000] = np.nan
+
+    def test_histogram_matches_numpy(self):
+        counts, edges = metric_statistics.histogram(self.values, num_bins=7)
+        finite = self.values[np.isfinite(self.values)]
+        expected, expected_edges = np.histogram(finite, bins=7)
+        np.testing.assert_array_equal(counts, expected)
+        np.testing.assert_allclose(edges, expected_edges)
+        self.assertEqual(counts.sum(), len(finite))
+
+    def test_chunks(self):
+        chunks = np.array_split(self.values, 13)
+        np.testing.assert_array_equal(
+            metric_statistics.histogram(chunks, num_bins=5)[0],
+            metric_statistics.histogram(self.values, num_bins=5)[0],
+        )
+        # A generator is read once when the range is given
+        streamed, _ = metric_statistics.histogram(
+            (chunk for chunk in chunks), num_bins=5, value_range=(-1, 1)
+        )
+        finite = self.values[np.isfinite(self.values)]
+        np.testing.assert_array_equal(
+            streamed, np.histogram(finite, bins=5, range=(-1, 1))[0]
+        )
+
+    def test_threshold_counts(self):
+        thresholds = [1.0, 0.01, 0.5, 0.1]
+        counts, total = metric_statistics.threshold_counts(
+            np.array_split(self.values, 7), thresholds
+        )
+        series = pd.Series(self.values).abs()
+        expected = [(series < t).sum() for t in sorted(thresholds)]
+        np.testing.assert_array_equal(counts, expected)
+        self.assertEqual(total, len(self.values))
+
+
+class TestDistributionPlots(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.df = pd.DataFrame(
+            {
+                "x": rng.uniform(size=1000),
+                "y": rng.uniform(size=1000),
+                "z": rng.uniform(size=1000),
+                "yoshikawa": rng.exponential(size=1000),
+            }
+        )
+        self.workspace = PlotlyWorkSpace(self.df.copy())
+
+    def test_plots_do_not_mutate_workspace(self):
+        fig = self.workspace.plot_distribution(color="yoshikawa", isShow=False)
+        self.assertEqual(sum(fig.data[0].y), 1000)
+        self.assertTrue(fig.data[0].x[-1].endswith("]"))
+        fig = self.workspace.plot_zero_approach(data_column="yoshikawa", isShow=False)
+        self.assertEqual(len(fig.data), 1)
+        pd.testing.assert_frame_equal(self.workspace.df, self.df)
+
+    def test_chunked_samples(self):
+        chunks = np.array_split(self.df["yoshikawa"].to_numpy(), 4)
+        fig = self.workspace.plot_zero_approach(
+            data_column="yoshikawa", samples=chunks, isShow=False
+        )
+        expected = self.workspace.plot_zero_approach(
+            data_column="yoshikawa", isShow=False
+        )
+        np.testing.assert_allclose(fig.data[0].y, expected.data[0].y)
+
+
+if __name__ == "__main__":
+    unittest.main()
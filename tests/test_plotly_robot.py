@@ -0,0 +1,130 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import plotly.graph_objects as go
+from robosandbox.models.DH.Panda import Panda
+from robosandbox.models.DH.Stanford import Stanford
+from robosandbox.models.DH.Puma560 import Puma560
+from robosandbox.visualization.plotly_robot import COMPACT_TRACE_UIDS
+
+
+def line_points(fig):
+    points = np.concatenate(
+        [np.c_[t.x, t.y, t.z] for t in fig.data if t.type == "scatter3d"]
+    )
+    points = points[~np.isnan(points[:, 0])]
+    return np.unique(np.round(points, 9), axis=0)
+
+
+class TestCompactRendering(unittest.TestCase):
+    def setUp(self):
+        self.robot = Panda()
+
+    def test_same_geometry_as_legacy(self):
+        for show_all_axes in [False, True]:
+            legacy = self.robot.plotly(
+                self.robot.qr, isShow=False, show_all_axes=show_all_axes
+            )
+            compact = self.robot.plotly(
+                self.robot.qr, isShow=False, show_all_axes=show_all_axes, compact=True
+            )
+            self.assertEqual(len(compact.data), len(COMPACT_TRACE_UIDS))
+            self.assertLess(len(compact.data), len(legacy.data))
+            np.testing.assert_allclose(line_points(compact), line_points(legacy))
+
+            cones = [t for t in legacy.data if t.type == "cone"]
+            arrowheads = compact.data[-1]
+            self.assertEqual(len(arrowheads.x), len(cones))
+            np.testing.assert_allclose(
+                sorted(arrowheads.z), sorted(c.z[0] for c in cones)
+            )
+
+    def test_arrowhead_colors(self):
+        fig = self.robot.plotly(
+            self.robot.qr, isShow=False, show_all_axes=True, compact=True
+        )
+        cone = fig.data[-1]
+        norms = np.linalg.norm(np.c_[cone.u, cone.v, cone.w], axis=1)
+        groups = np.rint((norms - cone.cmin) / (cone.cmax - cone.cmin) * 3).astype(int)
+        # One end-effector z axis, and one x, y and z axis for every other frame
+        counts = np.bincount(groups, minlength=4)
+        np.testing.assert_array_equal(counts, [len(norms) // 3] * 2 + [len(norms) // 3 - 1, 1])
+
+    def test_update_in_place(self):
+        fig = self.robot.plotly(self.robot.qr, isShow=False, compact=True)
+        expected = self.robot.plotly(self.robot.qz, isShow=False, compact=True)
+        self.robot.update_plotly(fig, self.robot.qz)
+        for trace, expected_trace in zip(fig.data, expected.data):
+            np.testing.assert_allclose(trace.x, expected_trace.x)
+            np.testing.assert_allclose(trace.z, expected_trace.z)
+
+        update, indices = self.robot.restyle_data(fig, self.robot.qr)
+        self.assertEqual(indices, list(range(len(COMPACT_TRACE_UIDS))))
+        self.assertEqual(len(update["x"]), len(indices))
+        self.assertIsNone(update["u"][0])
+        self.assertEqual(len(update["u"][-1]), len(fig.data[-1].u))
+
+    def test_shared_robot_is_not_modified(self):
+        state = dict(vars(self.robot))
+        self.robot.plotly(self.robot.qr, isShow=False)
+        self.robot.plotly(self.robot.qr, isShow=False, compact=True)
+        self.assertEqual(vars(self.robot).keys(), state.keys())
+
+        # Concurrent requests drawing one robot each get their own configuration
+        rng = np.random.default_rng(0)
+        qs = rng.uniform(-1, 1, size=(16, self.robot.n))
+        expected = [self.robot.compact_trace_data(q)["robot_links"] for q in qs]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            figs = list(
+                pool.map(
+                    lambda q: self.robot.plotly(q, isShow=False, compact=True), qs
+                )
+            )
+        for fig, links in zip(figs, expected):
+            np.testing.assert_allclose(fig.data[0].z, links["z"], atol=1e-6)
+
+    def test_compute_joint_positions(self):
+        frames = self.robot.compute_frames(self.robot.qr)
+        np.testing.assert_allclose(
+            self.robot.compute_joint_positions(frames), frames[:, :3, 3]
+        )
+        self.robot.q = self.robot.qr
+        np.testing.assert_allclose(
+            self.robot.compute_joint_positions(), frames[:, :3, 3], atol=1e-12
+        )
+
+
+class TestAnimation(unittest.TestCase):
+    def test_batched_fkine_all(self):
+        rng = np.random.default_rng(0)
+        # Modified DH, standard DH and a prismatic joint
+        for robot in [Panda(), Puma560(), Stanford()]:
+            q_traj = rng.uniform(-1, 1, size=(20, robot.n))
+            expected = np.array(
+                [[T.A for T in robot.fkine_all(q)] for q in q_traj]
+            )
+            np.testing.assert_allclose(robot.fkine_all_batch(q_traj), expected, atol=1e-12)
+
+    def test_animate(self):
+        robot = Panda()
+        q_traj = np.linspace(robot.qz, robot.qr, 50)
+        fig = go.Figure(go.Scatter3d(x=[0], y=[0], z=[0]))
+        fig = robot.animate(q_traj, fig=fig, isShow=False)
+
+        self.assertEqual(len(fig.data), 1 + len(COMPACT_TRACE_UIDS))
+        self.assertEqual(len(fig.frames), 50)
+        self.assertEqual(fig.frames[0].traces, tuple(range(1, 7)))
+        self.assertEqual(len(fig.layout.sliders[0].steps), 50)
+        # Frames only carry coordinates
+        self.assertIsNone(fig.frames[10].data[0].line.color)
+
+        last = robot.compact_trace_data(q_traj[-1])
+        np.testing.assert_allclose(
+            np.array(fig.frames[-1].data[0].z, dtype=float),
+            last["robot_links"]["z"],
+            atol=1e-6,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
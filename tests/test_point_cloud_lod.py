@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+import pandas as pd
+from robosandbox.visualization import point_cloud_lod
+from robosandbox.visualization.plotly_WorkSpace import PlotlyWorkSpace
+
+
+class TestPointCloudLOD(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = rng.uniform(-0.5, 0.5, size=(50000, 3))
+        self.values = rng.exponential(size=50000)
+
+    def test_voxel_downsample(self):
+        points = np.array([[0.01, 0.01, 0.01], [0.03, 0.03, 0.03], [0.51, 0.01, 0.01]])
+        means, values, counts = point_cloud_lod.voxel_downsample(
+            points, [1.0, np.nan, 3.0], voxel_size=0.1
+        )
+        order = np.argsort(means[:, 0])
+        np.testing.assert_allclose(means[order], [[0.02, 0.02, 0.02], [0.51, 0.01, 0.01]])
+        np.testing.assert_allclose(values[order], [1.0, 3.0])
+        np.testing.assert_array_equal(counts[order], [2, 1])
+
+    def test_voxel_size_for_budget(self):
+        voxel_size = point_cloud_lod.voxel_size_for_budget(self.points, 2000)
+        means, _, counts = point_cloud_lod.voxel_downsample(self.points, voxel_size=voxel_size)
+        self.assertLessEqual(len(means), 2000)
+        self.assertEqual(counts.sum(), len(self.points))
+        with self.assertRaises(ValueError):
+            point_cloud_lod.voxel_size_for_budget(self.points, 0)
+
+    def test_small_budget(self):
+        # Points around the origin always occupy one voxel per octant
+        points = np.random.default_rng(2).uniform(-1, 1, size=(1000, 3))
+        with self.assertRaises(ValueError):
+            point_cloud_lod.voxel_size_for_budget(points, 4)
+        voxel_size = point_cloud_lod.voxel_size_for_budget(points, 8)
+        self.assertTrue(np.isfinite(voxel_size))
+        means, _, _ = point_cloud_lod.voxel_downsample(points, voxel_size=voxel_size)
+        self.assertLessEqual(len(means), 8)
+        with self.assertRaises(ValueError):
+            point_cloud_lod.voxel_size_for_budget(points, 8, max_iterations=1)
+
+    def test_stratified_subsample(self):
+        keep = point_cloud_lod.stratified_subsample(self.values, 1000, num_strata=10)
+        self.assertEqual(len(keep), 1000)
+        self.assertEqual(len(np.unique(keep)), 1000)
+        # Each decile of the full data keeps exactly a tenth of the budget
+        edges = np.quantile(self.values, np.linspace(0, 1, 11)[1:-1])
+        strata = np.searchsorted(edges, self.values[keep], side="right")
+        np.testing.assert_array_equal(np.bincount(strata, minlength=10), np.full(10, 100))
+
+        everything = point_cloud_lod.stratified_subsample(self.values[:10], 100)
+        np.testing.assert_array_equal(everything, np.arange(10))
+
+
+class TestPlotLOD(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        points = rng.uniform(-0.5, 0.5, size=(20000, 3))
+        self.workspace = PlotlyWorkSpace(
+            pd.DataFrame(
+                {
+                    "x": points[:, 0],
+                    "y": points[:, 1],
+                    "z": points[:, 2],
+                    "yoshikawa": rng.uniform(size=20000),
+                }
+            )
+        )
+
+    def test_default_keeps_every_sample(self):
+        fig = self.workspace.plot(color="yoshikawa", isShow=False)
+        self.assertEqual(len(fig.data[0].x), 20000)
+        self.assertEqual(fig.data[0].x.dtype, np.float32)
+
+    def test_budget(self):
+        full = self.workspace.plot(color="yoshikawa", isShow=False)
+        for lod in ["voxel", "quantile"]:
+            fig = self.workspace.plot(
+                color="yoshikawa", isShow=False, max_points=2000, lod=lod
+            )
+            self.assertLessEqual(len(fig.data[0].x), 2000)
+            self.assertLess(len(fig.to_json()), len(full.to_json()) / 5)
+
+    def test_small_budget(self):
+        fig = self.workspace.plot(color="yoshikawa", isShow=False, max_points=4)
+        self.assertEqual(len(fig.data[0].x), 4)
+
+    def test_explicit_voxel_size(self):
+        fig = self.workspace.plot(color="yoshikawa", isShow=False, voxel_size=0.25)
+        self.assertEqual(len(fig.data[0].x), 64)
+        with self.assertRaises(ValueError):
+            self.workspace.plot(color="yoshikawa", isShow=False, lod="random")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import json
+import shutil
+import subprocess
+import unittest
+import numpy as np
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+import robosandbox as rsb
+from robosandbox.visualization.app import VisualizationManager
+from robosandbox.visualization.pose_clientside import (
+    POSE_CALLBACK_JS,
+    POSE_TRACES_JS,
+    dh_table,
+)
+
+
+def run_js(script):
+    result = subprocess.run(
+        ["node", "-e", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+class TestDHTable(unittest.TestCase):
+    def test_table(self):
+        robot = rsb.models.DH.Puma560()
+        table = json.loads(json.dumps(dh_table(robot)))
+        self.assertEqual(len(table["links"]), robot.n)
+        self.assertEqual(table["axes"], [2])
+        np.testing.assert_allclose(table["base"], robot.base.A)
+
+    def test_pose_controls(self):
+        table, sliders = VisualizationManager.update_pose_controls(
+            "generic_3", "0.4,0.4,0.4", "90,0,0", "0,30,400", None
+        )
+        self.assertEqual(len(table["links"]), 3)
+        self.assertEqual(len(sliders), 4)
+        self.assertEqual(sliders[3].children[1].value, 180.0)
+        self.assertEqual(
+            VisualizationManager.update_pose_controls(
+                "generic_3", "0.4,0.4,0.4", "90,0,0", "0,30", None
+            ),
+            (None, []),
+        )
+
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class TestClientsidePose(unittest.TestCase):
+    def assert_traces_equal(self, js_data, py_data):
+        for uid, trace in py_data.items():
+            for key, values in trace.items():
+                np.testing.assert_allclose(
+                    np.array(js_data[uid][key], dtype=float), values, atol=1e-12
+                )
+
+    def test_matches_compact_trace_data(self):
+        for robot in [rsb.models.DH.Panda(), rsb.models.DH.Generic.GenericFour()]:
+            q = np.random.default_rng(0).uniform(robot.qlim[0], robot.qlim[1])
+            table = dh_table(robot, show_all_axes=True)
+            js_data = run_js(
+                f"const f = {POSE_TRACES_JS};"
+                f"console.log(JSON.stringify(f({json.dumps(table)}, {json.dumps(q.tolist())})));"
+            )
+            self.assert_traces_equal(
+                js_data, robot.compact_trace_data(q, show_all_axes=True)
+            )
+
+    def test_callback_poses_figure(self):
+        robot = rsb.models.DH.Generic.GenericTwo()
+        fig = go.Figure(go.Scatter3d(x=[0], y=[0], z=[0], uid="workspace_points"))
+        robot.plotly([0, 0], fig=fig, isShow=False, compact=True)
+        # Serialized as Dash sends it, which keeps the trace uids
+        figure = json.loads(to_json_plotly(fig.to_plotly_json()))
+        q_deg = [30.0, -45.0]
+        posed = run_js(
+            "const window = {dash_clientside: {no_update: 'no_update'}};"
+            f"const f = {POSE_CALLBACK_JS};"
+            f"console.log(JSON.stringify([f({q_deg}, {json.dumps(dh_table(robot))}, "
+            f"{json.dumps(figure)}), f([30], {json.dumps(dh_table(robot))}, {{}})]));"
+        )
+        self.assertEqual(posed[1], "no_update")
+        traces = {trace["uid"]: trace for trace in posed[0]["data"]}
+        self.assertEqual(traces["workspace_points"]["x"], [0])
+        self.assert_traces_equal(
+            traces, robot.compact_trace_data(np.deg2rad(q_deg))
+        )
+
+    def test_clientside_callback_registered(self):
+        app = rsb.visualization.app.RobotArmDesignApp()
+        self.assertIn(
+            "joint_slider", json.dumps([c["inputs"] for c in app.app._callback_list])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
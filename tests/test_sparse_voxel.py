@@ -0,0 +1,115 @@
+import unittest
+import numpy as np
+import pandas as pd
+from robosandbox.visualization.sparse_voxel_data import (
+    SparseVoxelData,
+    pack_voxel_keys,
+    unpack_voxel_keys,
+)
+
+
+def make_workspace_df(n_points=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-0.5, 0.5, size=(n_points, 3))
+    return pd.DataFrame(
+        {
+            "x": points[:, 0],
+            "y": points[:, 1],
+            "z": points[:, 2],
+            "yoshikawa": rng.uniform(0, 1, n_points),
+        }
+    )
+
+
+class TestSparseVoxelData(unittest.TestCase):
+    def setUp(self):
+        self.df = make_workspace_df()
+        self.voxel_size = 0.1
+        self.voxels = SparseVoxelData(
+            self.df, voxel_size=self.voxel_size, method="yoshikawa"
+        )
+
+    def test_pack_roundtrip(self):
+        indices = np.array([[0, 0, 0], [-5, 3, 12], [1000, -1000, 7]])
+        np.testing.assert_array_equal(unpack_voxel_keys(pack_voxel_keys(indices)), indices)
+
+    def test_pack_out_of_range(self):
+        with self.assertRaises(ValueError):
+            pack_voxel_keys([[1 << 21, 0, 0]])
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            SparseVoxelData(self.df, method="nonexistent")
+
+    def test_matches_brute_force(self):
+        indices = np.floor(self.df[["x", "y", "z"]].to_numpy() / self.voxel_size)
+        occupied = {tuple(int(v) for v in idx) for idx in indices}
+        self.assertEqual(self.voxels.total_voxels, len(occupied))
+        self.assertAlmostEqual(
+            self.voxels.get_volume(), len(occupied) * self.voxel_size**3
+        )
+        self.assertEqual(self.voxels.counts.sum(), len(self.df))
+
+        # Average metric of one voxel
+        first = tuple(int(v) for v in indices[0])
+        mask = np.all(indices == first, axis=1)
+        expected = self.df["yoshikawa"].to_numpy()[mask].mean()
+        value = self.voxels.get_avg_metric(self.df[["x", "y", "z"]].to_numpy()[:1])
+        self.assertAlmostEqual(value[0], expected)
+
+    def test_lookup(self):
+        points = self.df[["x", "y", "z"]].to_numpy()
+        self.assertTrue(np.all(self.voxels.contains(points)))
+        far = np.array([[10.0, 10.0, 10.0]])
+        self.assertFalse(self.voxels.contains(far)[0])
+        self.assertTrue(np.isnan(self.voxels.get_avg_metric(far)[0]))
+
+    def test_neighbors(self):
+        df = pd.DataFrame(
+            {
+                "x": [0.05, 0.15, 0.05],
+                "y": [0.05, 0.05, 0.15],
+                "z": [0.05, 0.05, 0.05],
+                "yoshikawa": [1.0, 2.0, 3.0],
+            }
+        )
+        voxels = SparseVoxelData(df, voxel_size=0.1, method="yoshikawa")
+        neighbors = voxels.neighbors([[0, 0, 0]], connectivity=6)
+        self.assertEqual(neighbors.shape, (1, 6))
+        self.assertEqual(np.sum(neighbors >= 0), 2)
+        np.testing.assert_array_equal(np.sort(voxels.neighbor_counts()), [1, 1, 2])
+        self.assertEqual(voxels.neighbors([[0, 0, 0]], connectivity=26).shape, (1, 26))
+        self.assertTrue(np.all(voxels.boundary_mask()))
+        with self.assertRaises(ValueError):
+            voxels.neighbors([[0, 0, 0]], connectivity=5)
+
+    def test_multi_metric(self):
+        self.df["asada"] = self.df["yoshikawa"] * 2
+        voxels = SparseVoxelData(
+            self.df, voxel_size=self.voxel_size, method=["yoshikawa", "asada"]
+        )
+        np.testing.assert_allclose(
+            voxels.avg_metrics["asada"], voxels.avg_metrics["yoshikawa"] * 2
+        )
+        points = self.df[["x", "y", "z"]].to_numpy()[:5]
+        np.testing.assert_allclose(
+            voxels.get_avg_metric(points, method="asada"),
+            2 * voxels.get_avg_metric(points),
+        )
+        self.assertIn("asada", voxels.to_dataframe().columns)
+        np.testing.assert_array_equal(
+            voxels.get_avg_metric(method="asada"), voxels.avg_metrics["asada"]
+        )
+
+    def test_to_dense(self):
+        block = self.voxels.to_dense()
+        self.assertEqual(block["voxels"].sum(), self.voxels.total_voxels)
+        self.assertEqual(block["counts"].sum(), len(self.df))
+
+        sub_block = self.voxels.to_dense(lower=[0, 0, 0], upper=[2, 2, 2])
+        self.assertEqual(sub_block["voxels"].shape, (2, 2, 2))
+        np.testing.assert_allclose(sub_block["origin"], [0, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+import numpy as np
+from robosandbox.models.URDF import generic_dh_robot
+from robosandbox.models.URDF.generic_dh_robot import DH_2_URDF
+
+JOINT_TYPES = ["r", "p", "r", "f"]
+QLIM = [(-1.0, 1.0), (0.0, 0.5), (-1.0, 1.0), (-1.0, 1.0)]
+
+
+def random_designs(num_designs, seed=0):
+    rng = np.random.default_rng(seed)
+    a = rng.uniform(-0.5, 0.5, (num_designs, 4))
+    d = rng.uniform(-0.5, 0.5, (num_designs, 4))
+    alpha = rng.choice([0, np.pi / 2, -np.pi / 2, 0.3], (num_designs, 4))
+    # A design with a zero length link, which has no link cylinder
+    a[0, 2] = d[0, 2] = 0.0
+    return a, d, alpha
+
+
+class TestURDFBatchExport(unittest.TestCase):
+    def test_matches_generate_urdf(self):
+        a, d, alpha = random_designs(50)
+        link_radius = [0.03, 0.04, 0.05, 0.02]
+        urdfs = DH_2_URDF.generate_urdf_batch(
+            a,
+            d,
+            alpha,
+            link_radius=link_radius,
+            qlim=QLIM,
+            names=[f"design{k}" for k in range(50)],
+            joint_types=JOINT_TYPES,
+        )
+        for k, urdf in enumerate(urdfs):
+            expected = DH_2_URDF(
+                dofs=4,
+                a=list(a[k]),
+                d=list(d[k]),
+                alpha=list(alpha[k]),
+                link_radius=link_radius,
+                qlim=QLIM,
+                name=f"design{k}",
+                joint_types=JOINT_TYPES,
+            ).generate_urdf()
+            self.assertEqual(urdf, expected)
+        self.assertEqual(urdfs[0].count("<link name='l"), 3)
+
+    def test_matches_generate_urdf_without_limits(self):
+        a, d, alpha = random_designs(5)
+        # DH_2_URDF's own default form, with a limit given on one side only
+        for qlim in [[(None, None)] * 4, [(None, 0.5)] * 4]:
+            urdfs = DH_2_URDF.generate_urdf_batch(
+                a, d, alpha, qlim=qlim, joint_types=JOINT_TYPES
+            )
+            for k, urdf in enumerate(urdfs):
+                expected = DH_2_URDF(
+                    dofs=4,
+                    a=list(a[k]),
+                    d=list(d[k]),
+                    alpha=list(alpha[k]),
+                    qlim=qlim,
+                    joint_types=JOINT_TYPES,
+                ).generate_urdf()
+                self.assertEqual(urdf, expected)
+                self.assertNotIn("nan", urdf)
+
+    def test_invalid_designs(self):
+        a, d, alpha = random_designs(2)
+        with self.assertRaises(ValueError):
+            DH_2_URDF.generate_urdf_batch(a, d, alpha, joint_types=["r", "x", "r", "r"])
+        with self.assertRaises(ValueError):
+            DH_2_URDF.generate_urdf_batch(a, d, alpha, names=["only_one"])
+
+    def test_export(self):
+        a, d, alpha = random_designs(25)
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = DH_2_URDF.export_urdf_batch(
+                directory,
+                a,
+                d,
+                alpha,
+                names="Sweep",
+                qlim=[(None, None)] * 4,
+                joint_types=JOINT_TYPES,
+                chunk_size=10,
+            )
+            self.assertEqual(len(os.listdir(directory)), 26)
+            with open(os.path.join(directory, "manifest.json")) as f:
+                self.assertEqual(json.load(f), manifest)
+
+            entry = manifest[7]
+            self.assertEqual((entry["index"], entry["file"]), (7, "Sweep_07.urdf"))
+            self.assertEqual(entry["joint_types"], JOINT_TYPES)
+            np.testing.assert_array_equal(entry["a"], a[7])
+            with open(os.path.join(directory, entry["file"])) as f:
+                urdf = f.read()
+            self.assertEqual(hashlib.sha256(urdf.encode()).hexdigest(), entry["sha256"])
+            self.assertIn("<limit lower='0.0' upper='1.0'", urdf)
+            self.assertEqual(
+                urdf,
+                DH_2_URDF.generate_urdf_batch(
+                    a[7:8], d[7:8], alpha[7:8], names="Sweep", joint_types=JOINT_TYPES
+                )[0],
+            )
+
+    def test_export_waits_for_previous_chunk(self):
+        a, d, alpha = random_designs(25)
+        generate = DH_2_URDF.generate_urdf_batch
+        write = generic_dh_robot.atomic_write_text
+        with tempfile.TemporaryDirectory() as directory:
+            written = []
+
+            def generate_chunk(*args, **kwargs):
+                written.append(len(os.listdir(directory)))
+                return generate(*args, **kwargs)
+
+            def slow_write(path, text):
+                time.sleep(0.01)
+                write(path, text)
+
+            with mock.patch.object(
+                DH_2_URDF, "generate_urdf_batch", side_effect=generate_chunk
+            ), mock.patch.object(generic_dh_robot, "atomic_write_text", slow_write):
+                DH_2_URDF.export_urdf_batch(
+                    directory, a, d, alpha, joint_types=JOINT_TYPES, chunk_size=10
+                )
+            # Chunk k is generated once at least the files of chunk k - 2 are written
+            self.assertEqual(len(written), 3)
+            self.assertGreaterEqual(written[2], 10)
+            self.assertEqual(len(os.listdir(directory)), 26)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import roboticstoolbox as rtb
+from roboticstoolbox import ET
+from robosandbox.models.URDF import urdf_cache
+from robosandbox.models.URDF.Model import Model
+from robosandbox.models.URDF.Panda import Panda
+from robosandbox.models.URDF.Puma560 import Puma560
+from robosandbox.models.URDF.generic_dh_robot import DH_2_URDF
+from robosandbox.models.URDF.urdf_cache import (
+    URDFCache,
+    copy_links,
+    package_versions,
+    parse_urdf_string,
+    urdf_key,
+)
+
+URDF_STRING = DH_2_URDF(
+    dofs=2, a=[0.3, 0.2], d=[0.1, 0], alpha=[np.pi / 2, 0]
+).generate_urdf()
+
+
+class CountingReader:
+    """Stands in for Robot.URDF_read, building a two-link arm"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, file_path, tld=None, xacro_tld=None):
+        self.calls += 1
+        links = rtb.Robot(ET.Rz() * ET.tx(0.3) * ET.Rz() * ET.tx(0.2)).links
+        for link in links:
+            link._robot = None
+        return links, "arm", "<robot name='arm'/>", file_path
+
+
+class TestURDFCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.file_path = os.path.join(self.tmp.name, "arm.urdf")
+        with open(self.file_path, "w") as f:
+            f.write("<robot name='arm'/>")
+
+    def test_key(self):
+        self.assertEqual(urdf_key("a", "b"), urdf_key("a", "b"))
+        self.assertNotEqual(urdf_key("a", "b"), urdf_key("ab"))
+        self.assertIn("roboticstoolbox-python", dict(package_versions()))
+
+    def test_copy_links(self):
+        links = CountingReader()("arm.urdf")[0]
+        copies = copy_links(links)
+        for link, copied in zip(links, copies):
+            self.assertIsNot(link, copied)
+            self.assertEqual(link.name, copied.name)
+        self.assertIs(copies[2].parent, copies[1])
+        self.assertEqual(copies[1].children, [copies[2]])
+        q = [0.3, -0.4]
+        np.testing.assert_allclose(
+            rtb.Robot(copies).fkine(q).A, rtb.Robot(links).fkine(q).A
+        )
+
+    def test_read_hits_memory(self):
+        cache, reader = URDFCache(), CountingReader()
+        first = cache.read("arm.urdf", reader, tld=self.tmp.name)
+        second = cache.read("arm.urdf", reader, tld=self.tmp.name)
+        self.assertEqual((reader.calls, cache.hits, len(cache)), (1, 1, 1))
+        self.assertEqual(first[1:3], second[1:3])
+        self.assertIsNot(first[0][0], second[0][0])
+        # Robots built from the cached links are independent
+        robot = rtb.Robot(second[0])
+        self.assertIs(robot.links[0].robot, robot)
+
+        with open(self.file_path, "w") as f:
+            f.write("<robot name='changed'/>")
+        cache.read("arm.urdf", reader, tld=self.tmp.name)
+        self.assertEqual(reader.calls, 2)
+
+    def test_eviction(self):
+        cache, reader = URDFCache(max_entries=1), CountingReader()
+        cache.read("arm.urdf", reader, tld=self.tmp.name)
+        cache.read("arm.urdf", reader, tld=self.tmp.name, xacro_tld="other")
+        cache.read("arm.urdf", reader, tld=self.tmp.name)
+        self.assertEqual((reader.calls, len(cache)), (3, 1))
+        with self.assertRaises(ValueError):
+            URDFCache(max_entries=0)
+
+    def test_disk_store(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        URDFCache(cache_dir=cache_dir).read(
+            "arm.urdf", CountingReader(), tld=self.tmp.name
+        )
+        (stored,) = os.listdir(cache_dir)
+        with open(os.path.join(cache_dir, stored)) as f:
+            self.assertEqual(json.load(f)["name"], "arm")
+
+    def test_disk_store_skips_reader(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        with open(self.file_path, "w") as f:
+            f.write(URDF_STRING)
+
+        def reader(file_path, tld=None, xacro_tld=None):
+            with open(os.path.join(tld, file_path)) as f:
+                urdf_string = f.read()
+            links, name = parse_urdf_string(urdf_string, file_path)
+            return links, name, urdf_string, file_path
+
+        URDFCache(cache_dir=cache_dir).read("arm.urdf", reader, tld=self.tmp.name)
+        links, name, _, _ = URDFCache(cache_dir=cache_dir).read(
+            "arm.urdf", None, tld=self.tmp.name
+        )
+        self.assertEqual(name, "GenericDH")
+        self.assertEqual(sum(link.isjoint for link in links), 2)
+
+    def test_parse(self):
+        cache = URDFCache()
+        links, name = cache.parse(URDF_STRING)
+        cached_links, cached_name = cache.parse(URDF_STRING)
+        self.assertEqual((cache.hits, name), (1, cached_name))
+        self.assertEqual(
+            [link.name for link in links], [link.name for link in cached_links]
+        )
+
+
+class TestCachedModels(unittest.TestCase):
+    def setUp(self):
+        self.cache = URDFCache()
+        patcher = mock.patch.object(urdf_cache, "URDF_CACHE", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_same_robot(self, robot, cached):
+        self.assertIsNot(robot.links[0], cached.links[0])
+        self.assertIs(cached.links[0].robot, cached)
+        q = np.random.default_rng(0).uniform(-1, 1, robot.n)
+        np.testing.assert_allclose(cached.fkine(q).A, robot.fkine(q).A)
+
+    def test_models_built_twice(self):
+        for model in [Panda, Puma560]:
+            with self.subTest(model=model.__name__):
+                self.cache.clear()
+                robot = model()
+                self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+                cached = model()
+                self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+                self.assert_same_robot(robot, cached)
+
+    def test_toolbox_models_bypass_cache(self):
+        rtb.models.URDF.Puma560()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_model_from_file(self):
+        with tempfile.TemporaryDirectory() as tld:
+            with open(os.path.join(tld, "arm.urdf"), "w") as f:
+                f.write(URDF_STRING)
+            robot = Model("arm.urdf", tld=tld)
+            cached = Model("arm.urdf", tld=tld)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(cached.n, 2)
+        self.assert_same_robot(robot, cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
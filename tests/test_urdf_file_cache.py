@@ -0,0 +1,83 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+import numpy as np
+from robosandbox.models.URDF import Generic
+from robosandbox.models.URDF.Generic import GenericDH, urdf_digest, write_urdf_file
+from robosandbox.models.URDF.generic_dh_robot import DH_2_URDF
+
+
+def generate_urdf(a2):
+    return DH_2_URDF(
+        dofs=3, a=[0, 0.3, a2], d=[0.4, 0, 0], alpha=[np.pi / 2, 0, 0]
+    ).generate_urdf()
+
+
+
+
+class TestURDFFileCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_identical_designs_share_a_file(self):
+        urdf = generate_urdf(0.2)
+        path = write_urdf_file(urdf, self.tmp.name, "Robot", 3)
+        self.assertEqual(path.read_text(), urdf)
+        self.assertIn(urdf_digest(urdf)[:16], path.name)
+        self.assertEqual(write_urdf_file(urdf, self.tmp.name, "Robot", 3), path)
+        self.assertNotEqual(
+            write_urdf_file(generate_urdf(0.25), self.tmp.name, "Robot", 3), path
+        )
+        self.assertEqual(len(os.listdir(self.tmp.name)), 2)
+
+    def test_parallel_writers(self):
+        urdfs = [generate_urdf(0.2), generate_urdf(0.3)] * 8
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            paths = list(
+                pool.map(
+                    write_urdf_file,
+                    urdfs,
+                    [self.tmp.name] * 16,
+                    ["Robot"] * 16,
+                    [3] * 16,
+                )
+            )
+        self.assertEqual(len(set(paths)), 2)
+        # No partial or temporary files are left behind
+        self.assertEqual(
+            sorted(os.listdir(self.tmp.name)), sorted({p.name for p in paths})
+        )
+        for urdf, path in zip(urdfs, paths):
+            self.assertEqual(path.read_text(), urdf)
+
+    def test_generic_dh_in_memory(self):
+        robot = GenericDH(dofs=3, a=[0, 0.3, 0.2], d=[0.4, 0, 0], name="InMemory")
+        self.assertEqual(robot.n, 3)
+        self.assertIsNone(robot._urdf_filepath)
+        # The file is written when its path is first needed
+        with mock.patch.object(Generic, "RSB_DATA_DIR", pathlib.Path(self.tmp.name)):
+            path = robot.urdf_file_path
+        self.assertEqual(os.path.dirname(path), self.tmp.name)
+        with open(path) as f:
+            self.assertEqual(f.read(), robot._urdf_string)
+
+        cached = GenericDH(
+            dofs=3,
+            a=[0, 0.3, 0.2],
+            d=[0.4, 0, 0],
+            name="InMemory",
+            urdf_dir=self.tmp.name,
+        )
+        self.assertEqual(os.path.dirname(cached.urdf_file_path), self.tmp.name)
+        np.testing.assert_allclose(
+            cached.fkine(cached.qz).A, robot.fkine(robot.qz).A, atol=1e-12
+        )
+        self.assertEqual(cached.urdf_file_path, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
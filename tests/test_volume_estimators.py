@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+from robosandbox.performance.workspace import volume_estimators
+from robosandbox.performance.workspace.WorkSpace import WorkSpace
+from tests.test_workspace import MockRobot
+
+
+def sample_ball(n_points, radius=1.0, seed=0):
+    rng = np.random.default_rng(seed)
+    directions = rng.normal(size=(n_points, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    radii = radius * rng.uniform(0, 1, n_points) ** (1 / 3)
+    return directions * radii[:, None]
+
+
+class TestVolumeEstimators(unittest.TestCase):
+    def setUp(self):
+        self.points = sample_ball(20000)
+        self.true_volume = 4 / 3 * np.pi
+
+    def test_voxel_volume(self):
+        points = sample_ball(200000)
+        result = volume_estimators.voxel_volume(points, voxel_size=0.05)
+        self.assertAlmostEqual(result["volume"], self.true_volume, delta=0.1 * self.true_volume)
+        self.assertLess(abs(result["volume"] - self.true_volume), result["error"])
+        # The raw occupancy overestimates the volume, more so at the coarse resolution
+        self.assertGreater(result["coarse_volume"], result["raw_volume"])
+
+    def test_voxel_volume_from_indices(self):
+        # A 4x4x4 block of voxels is exactly covered by 2x2x2 coarse voxels
+        indices = np.stack(np.meshgrid(*[np.arange(4)] * 3), axis=-1).reshape(-1, 3)
+        result = volume_estimators.voxel_volume_from_indices(indices, 0.5)
+        self.assertAlmostEqual(result["volume"], 8.0)
+        self.assertAlmostEqual(result["error"], 0.0)
+
+    def test_convex_hull_volume(self):
+        result = volume_estimators.convex_hull_volume(self.points)
+        self.assertLess(result["volume"], self.true_volume)
+        self.assertAlmostEqual(result["volume"], self.true_volume, delta=0.05 * self.true_volume)
+        self.assertLess(self.true_volume - result["volume"], 5 * result["error"])
+
+    def test_incremental_convex_hull(self):
+        incremental = volume_estimators.IncrementalConvexHullVolume()
+        incremental.add_points(self.points[:2])
+        self.assertEqual(incremental.volume, 0.0)
+        for batch in np.array_split(self.points[2:], 4):
+            incremental.add_points(batch)
+        self.assertEqual(incremental.num_points, len(self.points))
+        self.assertAlmostEqual(
+            incremental.volume,
+            volume_estimators.convex_hull_volume(self.points)["volume"],
+        )
+        self.assertTrue(np.isfinite(incremental.estimate()["error"]))
+
+    def test_alpha_shape_volume(self):
+        result = volume_estimators.alpha_shape_volume(self.points, max_points=5000)
+        self.assertAlmostEqual(result["volume"], self.true_volume, delta=0.15 * self.true_volume)
+        self.assertLess(self.true_volume - result["volume"], 2 * result["error"])
+        self.assertGreater(result["alpha"], 0)
+
+    def test_alpha_shape_concave(self):
+        # Two separate balls: the convex hull bridges the gap, the alpha shape does not
+        points = np.vstack([sample_ball(5000, 0.5, 1), sample_ball(5000, 0.5, 2) + [2, 0, 0]])
+        hull = volume_estimators.convex_hull_volume(points)["volume"]
+        alpha = volume_estimators.alpha_shape_volume(points)["volume"]
+        self.assertLess(alpha, 0.5 * hull)
+
+    def test_degenerate_points(self):
+        flat = np.column_stack([np.random.rand(100, 2), np.zeros(100)])
+        self.assertEqual(volume_estimators.convex_hull_volume(flat)["volume"], 0.0)
+        self.assertEqual(volume_estimators.voxel_volume(np.zeros((0, 3)))["volume"], 0.0)
+
+
+class TestWorkSpaceVolume(unittest.TestCase):
+    def setUp(self):
+        self.workspace = WorkSpace(MockRobot())
+        self.points = sample_ball(5000)
+        self.workspace.add_samples(self.points, metric_values=np.ones(5000), metric="yoshikawa")
+
+    def test_methods(self):
+        for method in ["voxel", "convex_hull", "alpha_shape"]:
+            volume, error = self.workspace.get_volume(method=method, return_error=True)
+            # The error estimate should cover the actual error
+            self.assertLess(abs(volume - 4 / 3 * np.pi), 2 * error)
+        self.assertTrue(np.isnan(self.workspace.get_volume(return_error=True)[1]))
+        with self.assertRaises(ValueError):
+            self.workspace.get_volume(method="unknown")
+
+    def test_voxel_uses_accumulator(self):
+        self.workspace.track_voxels(voxel_size=0.2)
+        from_accumulator = self.workspace.get_volume(method="voxel")
+        from_points = volume_estimators.voxel_volume(self.points, voxel_size=0.2)
+        self.assertAlmostEqual(from_accumulator, from_points["volume"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import numpy as np
+from robosandbox.visualization.voxel_accumulator import VoxelAccumulator
+from robosandbox.performance.workspace.WorkSpace import WorkSpace
+from tests.test_workspace import MockRobot
+
+
+class TestVoxelAccumulator(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = rng.uniform(-0.5, 0.5, size=(3000, 3))
+        self.values = rng.uniform(0, 1, size=3000)
+
+    def test_incremental_matches_single_batch(self):
+        single = VoxelAccumulator(voxel_size=0.1)
+        single.add_samples(self.points, self.values, "yoshikawa")
+
+        incremental = VoxelAccumulator(voxel_size=0.1)
+        # Start with a small batch so the grid has to grow
+        for batch in np.array_split(np.arange(len(self.points)), [10, 500, 2000]):
+            incremental.add_samples(
+                self.points[batch], self.values[batch], "yoshikawa"
+            )
+
+        self.assertEqual(incremental.num_samples, len(self.points))
+        self.assertEqual(incremental.total_voxels, single.total_voxels)
+        self.assertAlmostEqual(incremental.total_volume, single.total_volume)
+        self.assertEqual(incremental.counts.sum(), len(self.points))
+
+        df_single = single.to_dataframe().sort_values(["x", "y", "z"])
+        df_incremental = incremental.to_dataframe().sort_values(["x", "y", "z"])
+        np.testing.assert_allclose(
+            df_single[["x", "y", "z"]].to_numpy(),
+            df_incremental[["x", "y", "z"]].to_numpy(),
+        )
+        np.testing.assert_allclose(
+            df_single["yoshikawa"].to_numpy(), df_incremental["yoshikawa"].to_numpy()
+        )
+
+    def test_fixed_bounds_drop_samples(self):
+        accumulator = VoxelAccumulator(
+            voxel_size=0.1, bounds=[[0, 0.5], [0, 0.5], [0, 0.5]], growable=False
+        )
+        accumulator.add_samples(self.points, self.values, "yoshikawa")
+        inside = np.all(self.points >= 0, axis=1)
+        self.assertEqual(accumulator.num_samples, inside.sum())
+        self.assertEqual(accumulator.num_dropped, (~inside).sum())
+
+    def test_convergence(self):
+        accumulator = VoxelAccumulator(voxel_size=0.25)
+        self.assertFalse(accumulator.is_converged())
+        accumulator.add_samples(self.points[:1500])
+        accumulator.add_samples(self.points[1500:])
+        # Every 0.25 m voxel of the cube is already hit by the first batch
+        self.assertTrue(accumulator.is_converged(tolerance=1e-6))
+        self.assertEqual(len(accumulator.history), 2)
+
+    def test_unknown_metric(self):
+        accumulator = VoxelAccumulator(voxel_size=0.1)
+        accumulator.add_samples(self.points)
+        with self.assertRaises(ValueError):
+            accumulator.get_avg_metric("yoshikawa")
+
+
+class TestWorkSpaceVoxelTracking(unittest.TestCase):
+    def test_add_samples_feeds_accumulator(self):
+        workspace = WorkSpace(MockRobot())
+        workspace.add_samples(
+            [np.array([0.01, 0.01, 0.01])], metric_values=[0.5], metric="yoshikawa"
+        )
+        accumulator = workspace.track_voxels(voxel_size=0.1)
+        self.assertEqual(accumulator.num_samples, 1)
+
+        workspace.add_samples(
+            [np.array([0.21, 0.01, 0.01]), np.array([0.02, 0.02, 0.02])],
+            metric_values=[0.7, 0.3],
+            metric="yoshikawa",
+        )
+        self.assertEqual(accumulator.num_samples, 3)
+        self.assertEqual(accumulator.total_voxels, 2)
+        df = accumulator.to_dataframe().sort_values("x")
+        np.testing.assert_allclose(df["yoshikawa"].to_numpy(), [0.4, 0.7])
+
+    def test_volume_tolerance_requires_tracking(self):
+        workspace = WorkSpace(MockRobot())
+        with self.assertRaises(ValueError):
+            workspace.global_indice(initial_samples=10, volume_tolerance=1e-2)
+
+    def test_zero_indice_still_checks_volume(self):
+        robot = MockRobot()
+        robot._manip_values["yoshikawa"] = np.zeros(3)
+        workspace = WorkSpace(robot)
+        accumulator = workspace.track_voxels(voxel_size=0.05)
+        global_indice = workspace.global_indice(
+            initial_samples=10,
+            batch_ratio=1.0,
+            max_samples=2000,
+            volume_tolerance=1e-6,
+        )
+        self.assertEqual(global_indice, 0.0)
+        self.assertGreater(len(workspace.df), 10)
+        self.assertGreaterEqual(len(accumulator.history), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
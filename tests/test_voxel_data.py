@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")
+from robosandbox.visualization.voxel_data import VoxelData, create_test_data
+
+
+class TestVoxelDataMultiMetric(unittest.TestCase):
+    def setUp(self):
+        self.df = create_test_data(n_points=1000)
+        self.methods = [
+            "order_independent_manipulability",
+            "yoshikawa_manipulability",
+            "condition_number",
+        ]
+
+    def test_single_pass_matches_per_metric(self):
+        combined = VoxelData(self.df, voxel_size=0.1, method=self.methods)
+        self.assertEqual(combined.method, self.methods[0])
+        for method in self.methods:
+            single = VoxelData(self.df, voxel_size=0.1, method=method)
+            np.testing.assert_array_equal(combined.voxels, single.voxels)
+            np.testing.assert_allclose(
+                combined.get_avg_metric(method=method), single.avg_metric
+            )
+            self.assertEqual(combined.get_statistics(method)["method"], method)
+
+    def test_average_against_brute_force(self):
+        voxels = VoxelData(self.df, voxel_size=0.1, method=self.methods)
+        self.assertEqual(voxels.count_values.sum(), len(self.df))
+        row = self.df.iloc[0]
+        index = tuple(
+            int((row[coord] - voxels.ranges[coord][0]) / 0.1) for coord in "xyz"
+        )
+        in_voxel = np.all(
+            [
+                ((self.df[coord] - voxels.ranges[coord][0]) / 0.1).astype(int) == i
+                for coord, i in zip("xyz", index)
+            ],
+            axis=0,
+        )
+        expected = self.df.loc[in_voxel, "condition_number"].mean()
+        self.assertAlmostEqual(
+            voxels.get_avg_metric(method="condition_number")[index], expected
+        )
+
+    def test_nan_values_skipped_per_metric(self):
+        df = pd.DataFrame(
+            {
+                "x": [0.0, 0.01, 0.5],
+                "y": [0.0, 0.01, 0.5],
+                "z": [0.0, 0.01, 0.5],
+                "yoshikawa": [1.0, np.nan, 2.0],
+                "asada": [np.nan, 3.0, np.nan],
+            }
+        )
+        voxels = VoxelData(df, voxel_size=0.1, method=["yoshikawa", "asada"])
+        self.assertEqual(voxels.total_voxels, 2)
+        yoshikawa = voxels.get_avg_metric(method="yoshikawa")
+        self.assertAlmostEqual(yoshikawa[0, 0, 0], 1.0)
+        self.assertAlmostEqual(voxels.get_avg_metric(method="asada")[0, 0, 0], 3.0)
+
+    def test_point_lookup(self):
+        voxels = VoxelData(self.df, voxel_size=0.1, method=self.methods)
+        points = self.df[["x", "y", "z"]].to_numpy()[:20]
+        lower = [voxels.ranges[coord][0] for coord in "xyz"]
+        index = tuple(((points - lower) / 0.1).astype(int).T)
+        np.testing.assert_allclose(
+            voxels.get_avg_metric(points, method="condition_number"),
+            voxels.get_avg_metric(method="condition_number")[index],
+        )
+        far = voxels.get_avg_metric([[10.0, 10.0, 10.0]], fill_value=-1.0)
+        np.testing.assert_array_equal(far, [-1.0])
+
+    def test_unknown_method(self):
+        voxels = VoxelData(self.df, voxel_size=0.1, method=self.methods[:2])
+        with self.assertRaises(ValueError):
+            voxels.get_avg_metric(method="condition_number")
+        with self.assertRaises(ValueError):
+            VoxelData(self.df, method=["nonexistent"])
+
+    def test_plot_selected_metric(self):
+        voxels = VoxelData(self.df, voxel_size=0.2, method=self.methods)
+        fig = voxels.plot(method="condition_number")
+        self.assertIsNotNone(fig)
+
+
+if __name__ == "__main__":
+    unittest.main()
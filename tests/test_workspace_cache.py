@@ -0,0 +1,100 @@
+import unittest
+from unittest import mock
+import numpy as np
+import robosandbox as rsb
+from robosandbox.visualization.app import RobotHelper, VisualizationManager
+from robosandbox.visualization.workspace_cache import (
+    RecordingWorkSpace,
+    WorkSpaceCache,
+    WorkSpaceSamples,
+    indice_from_singular_values,
+    jacobian_singular_values,
+)
+
+
+class TestSingularValueIndices(unittest.TestCase):
+    def test_match_manipulability(self):
+        for robot in [rsb.models.DH.Generic.GenericThree(), rsb.models.DH.Panda()]:
+            rng = np.random.default_rng(0)
+            joint_points = list(rng.uniform(robot.qlim[0], robot.qlim[1], (20, robot.n)))
+            singular_values = jacobian_singular_values(robot, joint_points)
+            for method in ["yoshikawa", "invcondition"]:
+                for axes in ["all", "trans", "rot"]:
+                    expected = [
+                        robot.manipulability(q, method=method, axes=axes)
+                        for q in joint_points
+                    ]
+                    np.testing.assert_allclose(
+                        indice_from_singular_values(singular_values[axes], method, axes),
+                        expected,
+                        atol=1e-7,
+                    )
+        with self.assertRaises(ValueError):
+            indice_from_singular_values(singular_values["all"], "asada")
+
+    def test_recording_workspace(self):
+        robot = rsb.models.DH.Generic.GenericTwo()
+        samples = WorkSpaceSamples()
+        ws = RecordingWorkSpace(robot, samples)
+        G = ws.global_indice(
+            initial_samples=200, batch_ratio=0.5, error_tolerance_percentage=0.1,
+            method="invcondition", axes="trans", max_samples=400,
+        )
+        self.assertEqual(len(samples), len(ws.df))
+        np.testing.assert_allclose(samples.points, ws.df[["x", "y", "z"]])
+
+        cached = samples.to_workspace(robot, "invcondition", "trans")
+        self.assertAlmostEqual(cached._calc_global_indice(method="invcondition"), G)
+        np.testing.assert_allclose(
+            samples.indice("yoshikawa", "all"),
+            [robot.manipulability(q, method="yoshikawa") for q in samples.joint_points],
+            atol=1e-12,
+        )
+
+
+class TestWorkSpaceCache(unittest.TestCase):
+    def test_least_recently_used_eviction(self):
+        cache = WorkSpaceCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c"), len(cache)), (1, 3, 2))
+        with self.assertRaises(ValueError):
+            WorkSpaceCache(max_entries=0)
+
+    def test_robots_are_memoized(self):
+        first = RobotHelper.get_robot("generic_2", [0.4, 0.4], [90, 0])
+        self.assertIs(first, RobotHelper.get_robot("generic_2", (0.4, 0.4), (90, 0)))
+        self.assertIsNot(first, RobotHelper.get_robot("generic_2", [0.4, 0.5], [90, 0]))
+
+    def test_workspace_button_reuses_samples(self):
+        robot = RobotHelper.get_robot("generic_2", [0.4, 0.4], [90, 0])
+        key = RobotHelper.robot_key("generic_2", [0.4, 0.4], [90, 0])
+        cache = WorkSpaceCache()
+
+        def analyse(method, axes, is_normalized, progress):
+            return VisualizationManager._handle_workspace_button(
+                robot, [0, 0], "Generic 2 DOF Robot", {"total_length": 0.8},
+                300, 0.5, 10.0, method, axes, is_normalized,
+                set_progress=progress.append, workspace_cache=cache, cache_key=key,
+            )
+
+        first = []
+        analyse("yoshikawa", "trans", False, first)
+        samples = cache.get(key)
+        self.assertEqual(len(samples), 300)
+
+        second = []
+        with mock.patch.object(type(robot), "jacob0") as jacob0:
+            _, message, _ = analyse("invcondition", "all", True, second)
+        jacob0.assert_not_called()
+        self.assertEqual(second, [(100 * 300 / 50000, second[0][1])])
+        G = np.mean(samples.indice("invcondition")) / np.max(samples.indice("invcondition"))
+        self.assertIn(f"{G:.6f}", second[0][1])
+        self.assertIn("invcondition", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+from stl import mesh
+from robosandbox.visualization.voxel_data import VoxelData
+from robosandbox.visualization.workspace_envelope import (
+    WorkSpaceEnvelope,
+    marching_tetrahedra,
+)
+from robosandbox.visualization.plotly_WorkSpace import PlotlyWorkSpace
+
+
+def edge_pairs(faces):
+    # Directed edges of all triangles
+    return np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+
+
+def make_ball_df(n_points=40000, radius=0.5, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-radius, radius, size=(4 * n_points, 3))
+    points = points[np.linalg.norm(points, axis=1) <= radius][:n_points]
+    return pd.DataFrame(
+        {
+            "x": points[:, 0],
+            "y": points[:, 1],
+            "z": points[:, 2],
+            "yoshikawa": points[:, 2] + 1,
+        }
+    )
+
+
+class TestMarchingTetrahedra(unittest.TestCase):
+    def test_closed_and_oriented(self):
+        grid = np.indices((30, 30, 30)).astype(float) - 14.5
+        field = (np.linalg.norm(grid, axis=0) <= 10).astype(float)
+        vertices, faces = marching_tetrahedra(field)
+
+        # Every directed edge has exactly one opposite twin: closed and consistently oriented
+        edges = {tuple(edge) for edge in edge_pairs(faces)}
+        self.assertEqual(len(edges), 3 * len(faces))
+        self.assertTrue(all((b, a) in edges for a, b in edges))
+
+        volume = WorkSpaceEnvelope(vertices, faces).get_volume()
+        self.assertAlmostEqual(volume, 4 / 3 * np.pi * 10**3, delta=0.02 * volume)
+
+    def test_empty_field(self):
+        vertices, faces = marching_tetrahedra(np.zeros((4, 4, 4)))
+        self.assertEqual(len(vertices), 0)
+        self.assertEqual(len(faces), 0)
+
+
+class TestWorkSpaceEnvelope(unittest.TestCase):
+    def setUp(self):
+        self.df = make_ball_df()
+        self.voxel_data = VoxelData(self.df, voxel_size=0.05, method="yoshikawa")
+
+    def test_from_voxel_data(self):
+        envelope = WorkSpaceEnvelope.from_voxel_data(self.voxel_data, smoothing=1.0)
+        self.assertAlmostEqual(
+            envelope.get_volume(), 4 / 3 * np.pi * 0.5**3, delta=0.1 * 4 / 3 * np.pi * 0.5**3
+        )
+        # Vertices lie in world coordinates around the samples
+        np.testing.assert_allclose(envelope.vertices.mean(axis=0), [0, 0, 0], atol=0.05)
+        self.assertLess(envelope.vertices.max(), 0.6)
+
+        # Intensity follows the metric (z + 1) on the surface
+        np.testing.assert_allclose(
+            envelope.intensity, envelope.vertices[:, 2] + 1, atol=0.1
+        )
+
+    def test_from_workspace_default_metric(self):
+        df = self.df.copy()
+        df.insert(0, "label", "sample")
+        envelope = WorkSpaceEnvelope.from_workspace(
+            SimpleNamespace(df=df), voxel_size=0.1
+        )
+        self.assertEqual(envelope.method, "yoshikawa")
+        with self.assertRaises(ValueError):
+            WorkSpaceEnvelope.from_workspace(
+                SimpleNamespace(df=self.df[["x", "y", "z"]]), voxel_size=0.1
+            )
+
+    def test_mesh_is_smaller_than_scatter(self):
+        envelope = WorkSpaceEnvelope.from_voxel_data(self.voxel_data, smoothing=1.0)
+        self.assertLess(len(envelope.vertices), len(self.df) / 4)
+
+    def test_export(self):
+        envelope = WorkSpaceEnvelope.from_voxel_data(self.voxel_data)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stl_path = os.path.join(tmp_dir, "envelope.stl")
+            envelope.save_stl(stl_path)
+            loaded = mesh.Mesh.from_file(stl_path)
+            self.assertEqual(len(loaded.vectors), len(envelope.faces))
+            volume, _, _ = loaded.get_mass_properties()
+            self.assertAlmostEqual(volume, envelope.get_volume(), places=4)
+
+            ply_path = os.path.join(tmp_dir, "envelope.ply")
+            envelope.save_ply(ply_path)
+            with open(ply_path, "rb") as f:
+                content = f.read()
+            header, body = content.split(b"end_header\n")
+            self.assertIn(f"element face {len(envelope.faces)}".encode(), header)
+            self.assertEqual(
+                len(body), 16 * len(envelope.vertices) + 13 * len(envelope.faces)
+            )
+
+    def test_plot_envelope(self):
+        workspace = PlotlyWorkSpace(self.df)
+        fig = workspace.plot_envelope(color="yoshikawa", voxel_size=0.1, isShow=False)
+        self.assertEqual(len(fig.data), 1)
+        self.assertEqual(fig.data[0].type, "mesh3d")
+        self.assertNotIn("Binned Values", self.df.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
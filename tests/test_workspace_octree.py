@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+import pandas as pd
+from robosandbox.visualization.workspace_octree import MAX_DEPTH, WorkSpaceOctree
+from robosandbox.visualization.voxel_data import VoxelData, create_test_data
+
+
+def make_ball_df(n_points=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-1, 1, size=(4 * n_points, 3))
+    points = points[np.linalg.norm(points, axis=1) <= 1][:n_points]
+    return pd.DataFrame(
+        {
+            "x": points[:, 0],
+            "y": points[:, 1],
+            "z": points[:, 2],
+            "yoshikawa": np.linalg.norm(points, axis=1),
+        }
+    )
+
+
+class TestWorkSpaceOctree(unittest.TestCase):
+    def setUp(self):
+        self.df = make_ball_df()
+        self.octree = WorkSpaceOctree(self.df, max_depth=4, method="yoshikawa")
+
+    def test_levels_aggregate_all_samples(self):
+        self.assertEqual(len(self.octree.levels), 5)
+        self.assertEqual(len(self.octree.levels[0]["keys"]), 1)
+        for level in range(self.octree.max_depth + 1):
+            nodes = self.octree.get_level(level)
+            self.assertEqual(nodes["count"].sum(), len(self.df))
+            # Count-weighted node means reproduce the global mean
+            mean = np.sum(nodes["yoshikawa"] * nodes["count"]) / len(self.df)
+            self.assertAlmostEqual(mean, self.df["yoshikawa"].mean())
+        root = self.octree.get_level(0).iloc[0]
+        self.assertAlmostEqual(root["yoshikawa_min"], self.df["yoshikawa"].min())
+        self.assertAlmostEqual(root["yoshikawa_max"], self.df["yoshikawa"].max())
+
+    def test_volume_decreases_with_depth(self):
+        volumes = [self.octree.get_volume(level) for level in range(5)]
+        self.assertTrue(all(a >= b for a, b in zip(volumes, volumes[1:])))
+
+    def test_contains(self):
+        points = self.df[["x", "y", "z"]].to_numpy()
+        self.assertTrue(np.all(self.octree.contains(points)))
+        self.assertFalse(self.octree.contains([[5.0, 5.0, 5.0]])[0])
+        self.assertTrue(self.octree.contains([[0.0, 0.0, 0.0]], level=1)[0])
+
+    def test_lod_extraction(self):
+        full = self.octree.extract_lod(base_level=1)
+        self.assertEqual(len(full), len(self.octree.levels[4]["keys"]))
+
+        boundary = self.octree.extract_lod(base_level=1, boundary_only=True)
+        self.assertLess(len(boundary), len(full))
+        self.assertEqual(boundary["count"].sum(), len(self.df))
+        self.assertGreater(boundary["level"].nunique(), 1)
+
+        zoomed = self.octree.extract_lod(
+            base_level=1, bounds=[[0, 1], [0, 1], [0, 1]]
+        )
+        self.assertEqual(zoomed["count"].sum(), len(self.df))
+        fine = zoomed[zoomed["level"] == 4]
+        self.assertTrue(np.all(fine[["x", "y", "z"]].to_numpy() > -0.2))
+
+    def test_from_voxel_data(self):
+        voxels = VoxelData(
+            create_test_data(500),
+            voxel_size=0.1,
+            method=["order_independent_manipulability", "condition_number"],
+        )
+        octree = WorkSpaceOctree.from_voxel_data(voxels, max_depth=3)
+        self.assertEqual(octree.methods, voxels.methods)
+        self.assertIn("condition_number", octree.get_level(2).columns)
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            self.octree.get_level(10)
+
+    def test_max_depth_limit(self):
+        self.assertEqual(MAX_DEPTH, 19)
+        octree = WorkSpaceOctree(self.df, max_depth=MAX_DEPTH, method="yoshikawa")
+        self.assertEqual(octree.get_level(MAX_DEPTH)["count"].sum(), len(self.df))
+        self.assertTrue(octree.contains(self.df[["x", "y", "z"]].to_numpy()).all())
+        with self.assertRaises(ValueError):
+            WorkSpaceOctree(self.df, max_depth=MAX_DEPTH + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
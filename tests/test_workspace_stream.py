@@ -0,0 +1,90 @@
+import unittest
+import dash
+import numpy as np
+import robosandbox as rsb
+from robosandbox.visualization.app import VisualizationManager
+from robosandbox.visualization.workspace_stream import PointStream, extend_data
+
+
+class TestPointStream(unittest.TestCase):
+    def test_push_and_drain(self):
+        stream = PointStream()
+        self.assertIsNone(stream.drain("job"))
+        stream.push("job", np.zeros((2, 3)), np.zeros(2))
+        self.assertIsNone(stream.drain("job"))
+
+        stream.open("job", {"data": []}, 0)
+        stream.push("job", np.ones((2, 3)), [1, 2], "2 samples")
+        stream.push("job", np.ones((3, 3)), [3, 4, 5], "5 samples")
+        update = stream.drain("job")
+        self.assertEqual(update["figure"], {"data": []})
+        np.testing.assert_array_equal(update["values"], [1, 2, 3, 4, 5])
+        self.assertEqual((update["points"].shape, update["status"]), ((5, 3), "5 samples"))
+
+        update = stream.drain("job")
+        self.assertIsNone(update["figure"])
+        self.assertEqual(len(update["points"]), 0)
+        stream.close("job")
+        self.assertIsNone(stream.drain("job"))
+
+    def test_extend_data(self):
+        update, indices, max_points = extend_data(
+            [[0.1, 0.2, 0.3]], [0.5], trace_index=6, max_points=100
+        )
+        self.assertEqual(update["x"], [[0.1]])
+        self.assertEqual(update["marker.color"], [[0.5]])
+        self.assertEqual((indices, max_points), ([6], 100))
+
+
+class RecordingStream(PointStream):
+    """PointStream draining the page's view after every batch."""
+
+    def __init__(self):
+        super().__init__()
+        self.updates = []
+
+    def push(self, key, points, values, status=""):
+        super().push(key, points, values, status)
+        self.updates.append(VisualizationManager.drain_stream(self, key))
+
+
+class TestProgressiveWorkspace(unittest.TestCase):
+    def test_batches_are_streamed(self):
+        robot = rsb.models.DH.Generic.GenericTwo()
+        stream = RecordingStream()
+        VisualizationManager._handle_workspace_button(
+            robot, [0, 0], "Generic 2 DOF Robot", {"total_length": 0.8},
+            400, 0.5, 1e-6, "yoshikawa", "trans", False,
+            point_stream=stream, stream_key="job",
+        )
+        self.assertGreater(len(stream.updates), 1)
+
+        # The first update paints the figure with the first batch
+        figure, extend, status = stream.updates[0]
+        self.assertIs(extend, dash.no_update)
+        trace = figure["data"][-1]
+        self.assertEqual(trace["uid"], "workspace_points")
+        self.assertEqual(len(trace["x"]), 400)
+        self.assertTrue(status.startswith("400 samples"))
+
+        # Later updates only carry their batch
+        trace_index = len(figure["data"]) - 1
+        num_samples = 400
+        for figure, extend, status in stream.updates[1:]:
+            self.assertIs(figure, dash.no_update)
+            update, indices, _ = extend
+            self.assertEqual(indices, [trace_index])
+            self.assertEqual(len(update["x"][0]), num_samples // 2)
+            num_samples += num_samples // 2
+            self.assertTrue(status.startswith(f"{num_samples} samples"))
+        self.assertIsNone(stream.drain("job"))
+
+    def test_stream_callback_registered(self):
+        app = rsb.visualization.app.RobotArmDesignApp()
+        self.assertIn("main_display.extendData", "".join(app.app.callback_map))
+        app = rsb.visualization.app.RobotArmDesignApp(progressive=False)
+        self.assertNotIn("main_display.extendData", "".join(app.app.callback_map))
+
+
+if __name__ == "__main__":
+    unittest.main()